@@ -24,6 +24,7 @@ RETRY_MAX_WAIT = 60
 
 # Post Limits
 MAX_POST_LENGTH = 3000
+MAX_POLL_QUESTION_LENGTH = 140
 MAX_HASHTAGS_PER_POST = 30
 
 # Analytics Constants
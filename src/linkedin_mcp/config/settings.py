@@ -157,6 +157,16 @@ class FeatureFlags(BaseSettings):
     analytics_tracking: bool = Field(default=True)
     post_scheduling: bool = Field(default=True)
 
+    # Warm the cache for follow-up profile calls (uses unofficial API in the background)
+    predictive_prefetch: bool = Field(
+        default=True,
+        description="Prefetch contact info and skills after get_profile so follow-up calls hit the cache.",
+    )
+    cache_warming: bool = Field(
+        default=True,
+        description="Warm the cache for the own profile, network stats and recent profiles at startup.",
+    )
+
     # Messaging features (uses unofficial API - may trigger bot detection)
     messaging_enabled: bool = Field(
         default=True,
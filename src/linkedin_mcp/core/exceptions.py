@@ -331,6 +331,14 @@ def interpret_error(error: str | Exception) -> dict[str, str]:
     error_str = str(error).lower()
     original_error = str(error)
 
+    if isinstance(error, LinkedInRateLimitError):
+        wait = f"Wait {error.retry_after} seconds" if error.retry_after else "Wait"
+        return {
+            "message": "Rate limit exceeded",
+            "suggestion": f"{wait} before making more requests",
+            "technical": original_error,
+        }
+
     for pattern, message, suggestion in ERROR_PATTERNS:
         if pattern.lower() in error_str:
             return {
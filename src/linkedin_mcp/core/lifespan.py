@@ -704,6 +704,16 @@ async def shutdown_services(ctx: AppContext) -> None:
     logger.info("Shutting down services")
     ctx.mark_shutting_down()
 
+    # Stop cache warming and persist the recently used profile list
+    for task_name in ("warming_task", "hot_profiles_task"):
+        task = ctx.metadata.get(task_name)
+        if task and not task.done():
+            task.cancel()
+
+    from linkedin_mcp.services.warming import get_hot_profiles
+
+    await get_hot_profiles().flush(force=True)
+
     # Stop scheduler
     if ctx.scheduler and ctx.scheduler.running:
         logger.debug("Stopping scheduler")
@@ -952,6 +962,20 @@ async def lifespan(server: "FastMCP") -> AsyncGenerator[AppContext, None]:
         ctx.mark_initialized()
         set_context(ctx)
 
+        # Restore the recently used profile list and save it periodically
+        from linkedin_mcp.services.warming import get_hot_profiles
+
+        hot_profiles = get_hot_profiles()
+        await hot_profiles.load()
+        ctx.set_metadata("hot_profiles_task", asyncio.create_task(hot_profiles.persist()))
+
+        # Warm the cache in the background so startup is not delayed
+        if settings.features.cache_warming and ctx.linkedin_client:
+            from linkedin_mcp.services.cache import get_cache
+            from linkedin_mcp.services.warming import warm
+
+            ctx.set_metadata("warming_task", asyncio.create_task(warm(ctx, get_cache())))
+
         logger.info(
             "Server initialized successfully",
             official_api=ctx.has_official_client,
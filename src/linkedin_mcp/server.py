@@ -4,9 +4,157 @@ LinkedIn Intelligence MCP Server.
 Main FastMCP server definition with all tools, resources, and prompts.
 """
 
+import asyncio
+import base64
+import contextlib
+import functools
+import heapq
+import inspect
+import json
+import os
+import re
+import tempfile
+import time
+import traceback
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Annotated, Any
+from urllib.parse import unquote, urlparse
+
+import httpx
 from fastmcp import FastMCP
-
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from mcp.types import CallToolRequestParams
+from pydantic import Field
+
+from linkedin_mcp.config.constants import MAX_POLL_QUESTION_LENGTH, MAX_POST_LENGTH
+from linkedin_mcp.config.settings import get_settings
+from linkedin_mcp.core.context import get_context
+from linkedin_mcp.core.exceptions import LinkedInSessionError, format_error_response
 from linkedin_mcp.core.lifespan import lifespan
+from linkedin_mcp.core.logging import LogContext, get_logger
+from linkedin_mcp.services.analytics import (
+    get_audience_analyzer,
+    get_content_analyzer,
+    get_engagement_analyzer,
+    get_posting_time_analyzer,
+    post_text,
+    summarize_network,
+    summarize_posts,
+)
+from linkedin_mcp.services.browser import get_browser_automation
+from linkedin_mcp.services.cache import CacheService, get_cache
+from linkedin_mcp.services.linkedin._client_pool import get_posts_client
+from linkedin_mcp.services.linkedin.analytics_client import LinkedInAnalyticsClient
+from linkedin_mcp.services.linkedin.client import LinkedInClient, RateLimiter
+from linkedin_mcp.services.linkedin.posts_client import PostVisibility
+from linkedin_mcp.services.profile import ProfileEnrichmentEngine, ProfileManager
+from linkedin_mcp.services.scheduler import (
+    get_draft_manager,
+    get_post_manager,
+    get_suggestion_engine,
+)
+from linkedin_mcp.services.storage.token_storage import get_official_token, get_unofficial_cookies
+from linkedin_mcp.services.warming import get_hot_profiles
+
+logger = get_logger(__name__)
+
+# Official API visibility for each accepted tool value (LOGGED_IN maps to CONNECTIONS)
+_VISIBILITY_MAP = {
+    "PUBLIC": PostVisibility.PUBLIC,
+    "CONNECTIONS": PostVisibility.CONNECTIONS,
+    "LOGGED_IN": PostVisibility.CONNECTIONS,
+}
+_VALID_SCHEDULE_VIS = frozenset({"PUBLIC", "CONNECTIONS", "LOGGED_IN"})
+_VALID_POLL_DURATIONS = frozenset({1, 3, 7, 14})
+_VALID_DATE_FILTERS = frozenset({"past-24h", "past-week", "past-month", ""})
+_DATE_FILTER_VALUES = sorted(_VALID_DATE_FILTERS - {""})
+
+# Accepted media extensions, in the order listed in error messages
+_VALID_IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".gif")
+_VALID_BACKGROUND_EXTS = (".jpg", ".jpeg", ".png")
+_VALID_VIDEO_EXTS = (".mp4", ".mov")
+_VALID_DOCUMENT_EXTS = (".pdf", ".pptx", ".docx")
+
+
+def _linkedin_char_count(text: str) -> int:
+    """Length of text as LinkedIn counts it, in UTF-16 code units (emoji count as two)."""
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _validate_post_length(text: str, limit: int = MAX_POST_LENGTH, label: str = "Post") -> dict | None:
+    """Return an error response if text is over LinkedIn's limit, else None."""
+    if _linkedin_char_count(text) > limit:
+        return {"error": f"{label} exceeds maximum length of {limit} characters"}
+    return None
+
+
+def _split_csv(raw: str, cap: int, *, unique: bool = True) -> list[str] | None:
+    """
+    Split a comma-separated argument into stripped, non-empty items.
+
+    Duplicates are dropped unless unique is False. Scans lazily and returns
+    None as soon as more than cap items are seen, so an oversized argument is
+    rejected without materializing every piece.
+    """
+    items: list[str] = []
+    seen: set[str] = set()
+    start = 0
+    while start <= len(raw):
+        end = raw.find(",", start)
+        if end == -1:
+            end = len(raw)
+        if (item := raw[start:end].strip()) and not (unique and item in seen):
+            items.append(item)
+            seen.add(item)
+            if len(items) > cap:
+                return None
+        start = end + 1
+    return items
+
+
+# Post URNs accepted by the posts, comments and reactions endpoints. Bare
+# activity IDs are allowed too; linkedin-api adds the urn:li:activity: prefix.
+_POST_URN_RE = re.compile(r"\d+|urn:li:(?:activity|share|ugcPost):\d+")
+_COMMENT_URN_RE = re.compile(r"urn:li:comment:\(urn:li:(?:activity|share|ugcPost):\d+,\d+\)")
+
+
+def _check_post_urn(urn: str, allow_comment: bool = False) -> dict | None:
+    """Return an error response if urn is not a post (or comment) URN, else None."""
+    # URNs copied from LinkedIn URLs often arrive percent-encoded
+    decoded = unquote(urn)
+    if _POST_URN_RE.fullmatch(decoded) or (allow_comment and _COMMENT_URN_RE.fullmatch(decoded)):
+        return None
+    kind = "post or comment URN" if allow_comment else "post URN"
+    return {"error": f"Invalid {kind}: {urn!r}. Expected a URN like 'urn:li:activity:123456789'"}
+
+
+# Schema-level caps; the UTF-16 runtime check above stays authoritative for emoji
+_PostText = Annotated[str, Field(max_length=MAX_POST_LENGTH)]
+_PollQuestion = Annotated[str, Field(max_length=MAX_POLL_QUESTION_LENGTH)]
+
+
+class _ToolLogContext(Middleware):
+    """
+    Bind the called tool's name into structlog contextvars for the whole call.
+
+    Every log line emitted while a tool runs, including those from the
+    clients and services it calls, carries ``tool=<name>`` without each
+    call site passing it.
+    """
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[CallToolRequestParams],
+        call_next: CallNext[CallToolRequestParams, Any],
+    ) -> Any:
+        with LogContext(tool=context.message.name):
+            return await call_next(context)
+
 
 # Create FastMCP server instance with lifespan for proper initialization
 mcp = FastMCP(
@@ -14,13 +162,106 @@ mcp = FastMCP(
     instructions="AI-powered content strategy, analytics, and professional networking.",
     version="0.2.0",
     lifespan=lifespan,
+    middleware=[_ToolLogContext()],
 )
 
 
+def _ok(**fields: Any) -> dict:
+    """Build a success response envelope."""
+    return {"success": True, **fields}
+
+
+def _err(e: BaseException, **fields: Any) -> dict:
+    """Build an error response envelope from an exception."""
+    return {"error": str(e), **fields}
+
+
+def tool_error_handler(fn: Callable[..., Awaitable[dict]]) -> Callable[..., Awaitable[dict]]:
+    """
+    Convert unexpected exceptions raised by a tool into an error response.
+
+    Apply below ``@mcp.tool()`` so the tool body only has to handle the
+    happy path. The wrapped signature is preserved for schema generation.
+    Identifier arguments (``*_id``, ``*_urn`` and their plurals) are logged
+    with the failure; free text such as message bodies is left out.
+    """
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> dict:
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as e:
+            logger.error("Tool failed", error=str(e), **_id_arguments(signature, args, kwargs))
+            return _err(e)
+
+    return wrapper
+
+
+_ID_ARGUMENT_SUFFIXES = ("_id", "_ids", "_urn", "_urns")
+
+
+def _id_arguments(signature: inspect.Signature, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Return the identifier-like arguments of a call, keyed by parameter name."""
+    try:
+        bound = signature.bind_partial(*args, **kwargs)
+    except TypeError:
+        return {}
+    return {name: value for name, value in bound.arguments.items() if name.endswith(_ID_ARGUMENT_SUFFIXES)}
+
+
+def requires_client(fn: Callable[..., Awaitable[dict]]) -> Callable[..., Awaitable[dict]]:
+    """
+    Pass the unofficial LinkedIn client to a tool as its first argument.
+
+    Returns an error response instead of calling the tool when no client is
+    initialized. The ``client`` parameter is hidden from the tool schema.
+    """
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> dict:
+        client = get_context().linkedin_client
+        if not client:
+            return {"error": "LinkedIn client not initialized"}
+        return await fn(client, *args, **kwargs)
+
+    wrapper.__signature__ = signature.replace(parameters=list(signature.parameters.values())[1:])  # type: ignore[attr-defined]
+    wrapper.__annotations__ = {k: v for k, v in fn.__annotations__.items() if k != "client"}
+    return wrapper
+
+
 # =============================================================================
 # Diagnostic Tools
 # =============================================================================
 
+# (path, mtime_ns, keys) of the last parsed session cookie file
+_COOKIE_KEYS_CACHE: tuple[str, int, list[str]] | None = None
+
+
+def _read_cookie_keys(cookie_path: Path) -> list[str]:
+    """Return the top-level keys of the cookie file, re-parsing only when it changes."""
+    global _COOKIE_KEYS_CACHE
+
+    mtime_ns = cookie_path.stat().st_mtime_ns
+    path_key = str(cookie_path)
+    if _COOKIE_KEYS_CACHE and _COOKIE_KEYS_CACHE[:2] == (path_key, mtime_ns):
+        return _COOKIE_KEYS_CACHE[2]
+
+    keys = list(json.loads(cookie_path.read_bytes()).keys())
+    _COOKIE_KEYS_CACHE = (path_key, mtime_ns, keys)
+    return keys
+
+
+def _cookie_file_status(cookie_path: Path) -> tuple[bool, list[str] | str | None]:
+    """Return whether the cookie file exists and its keys (or the read error)."""
+    if not cookie_path.exists():
+        return False, None
+    try:
+        return True, _read_cookie_keys(cookie_path)
+    except Exception as e:
+        return True, f"Error reading: {e}"
+
 
 @mcp.tool()
 async def debug_context() -> dict:
@@ -33,35 +274,28 @@ async def debug_context() -> dict:
     - Cookie file status
     - Initialization errors
     """
-    import os
-    from pathlib import Path
-
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.config.settings import get_settings
 
     try:
         ctx = get_context()
         settings = get_settings()
 
-        # Check cookie file
+        # Filesystem probes run off the event loop, concurrently
         cookie_path = settings.session_cookie_path
-        cookie_exists = cookie_path.exists()
-        cookie_content = None
-        if cookie_exists:
-            try:
-                import json
-                cookie_content = list(json.loads(cookie_path.read_text()).keys())
-            except Exception as e:
-                cookie_content = f"Error reading: {e}"
+        if cookie_path is None:
+            return {"error": "Session cookie path is not configured"}
+        (cookie_exists, cookie_content), cookie_path_absolute, cwd = await asyncio.gather(
+            asyncio.to_thread(_cookie_file_status, cookie_path),
+            asyncio.to_thread(lambda: str(cookie_path.absolute())),
+            asyncio.to_thread(os.getcwd),
+        )
 
         # Get official client status if available
         official_status = None
         if ctx.official_client:
             official_status = ctx.official_client.debug_context()
 
-        return {
-            "success": True,
-            "context": {
+        return _ok(
+            context={
                 "is_initialized": ctx.is_initialized,
                 "has_official_client": ctx.has_official_client,
                 "has_linkedin_client": ctx.has_linkedin_client,
@@ -74,35 +308,34 @@ async def debug_context() -> dict:
                 "has_browser": ctx.has_browser,
                 "linkedin_client_type": type(ctx.linkedin_client).__name__ if ctx.linkedin_client else None,
             },
-            "official_api": official_status,
-            "data_provider": {
+            official_api=official_status,
+            data_provider={
                 "initialized": ctx.has_data_provider,
                 "pnd_client": ctx.has_pnd_client,
                 "marketing_client": ctx.has_marketing_client,
                 "fresh_data_client": ctx.has_fresh_data_client,
             },
-            "settings": {
+            settings={
                 "api_enabled": settings.linkedin.api_enabled,
                 "email": settings.linkedin.email,
                 "password_set": settings.linkedin.password is not None,
                 "session_cookie_path": str(settings.session_cookie_path),
-                "session_cookie_path_absolute": str(settings.session_cookie_path.absolute()),
+                "session_cookie_path_absolute": cookie_path_absolute,
                 "rapidapi_key_set": settings.third_party.rapidapi_key is not None,
             },
-            "cookie_file": {
+            cookie_file={
                 "exists": cookie_exists,
                 "keys": cookie_content,
             },
-            "environment": {
+            environment={
                 "LINKEDIN_API_ENABLED": os.environ.get("LINKEDIN_API_ENABLED"),
                 "LINKEDIN_EMAIL": os.environ.get("LINKEDIN_EMAIL"),
                 "LINKEDIN_PASSWORD": "***" if os.environ.get("LINKEDIN_PASSWORD") else None,
                 "THIRDPARTY_RAPIDAPI_KEY": "***" if os.environ.get("THIRDPARTY_RAPIDAPI_KEY") else None,
-                "CWD": os.getcwd(),
+                "CWD": cwd,
             },
-        }
+        )
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": str(e),
@@ -127,10 +360,7 @@ async def get_my_profile() -> dict:
     Uses the Official LinkedIn API (OAuth 2.0) when available for reliable results.
     Falls back to unofficial API if official client is not configured.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
 
-    logger = get_logger(__name__)
     ctx = get_context()
 
     result = {
@@ -164,7 +394,11 @@ async def get_my_profile() -> dict:
     # Try to enrich with unofficial API data for more details
     if ctx.linkedin_client:
         try:
-            unofficial_profile = await ctx.linkedin_client.get_own_profile()
+            unofficial_profile, _ = await get_cache().get_or_fetch(
+                CacheService.OWN_PROFILE_KEY,
+                ctx.linkedin_client.get_own_profile,
+                CacheService.TTL_PROFILE,
+            )
             if unofficial_profile:
                 # Extract public_id from unofficial profile
                 public_id = (
@@ -234,16 +468,10 @@ async def get_profile(
     - Recent activity summary
     - Enrichment metadata showing data sources used
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.browser import get_browser_automation
-    from linkedin_mcp.services.cache import CacheService, get_cache
-    from linkedin_mcp.services.profile import ProfileEnrichmentEngine
-
-    logger = get_logger(__name__)
     ctx = get_context()
     cache = get_cache()
     browser = get_browser_automation()
+    get_hot_profiles().touch(profile_id)
 
     # Check if ANY data source is available
     # Fresh Data API is the most reliable (paid RapidAPI)
@@ -277,14 +505,7 @@ async def get_profile(
         f"badges={include_badges}",
     )
 
-    try:
-        # Check cache first
-        if use_cache:
-            cached_data = await cache.get(cache_key)
-            if cached_data:
-                logger.debug("Returning cached enriched profile", profile_id=profile_id)
-                return {"success": True, "profile": cached_data, "cached": True}
-
+    async def fetch_profile() -> dict:
         # Use Profile Enrichment Engine for comprehensive data
         # Pass all available sources - engine handles None gracefully
         # Priority: PND API (PRIMARY, 55 endpoints) → Fresh Data (FALLBACK) → Browser → Primary
@@ -294,15 +515,30 @@ async def get_profile(
             fresh_data_client=ctx.fresh_data_client,  # FALLBACK
             pnd_client=ctx.pnd_client,  # PRIMARY (55 endpoints)
         )
-        enriched_profile = await engine.get_enriched_profile(
+        return await engine.get_enriched_profile(
             public_id=profile_id,
             include_activity=include_activity,
             include_network=include_network,
             include_badges=include_badges,
         )
 
-        # Cache the enriched result
-        await cache.set(cache_key, enriched_profile, CacheService.TTL_PROFILE)
+    # Hot profiles are refreshed in the background during the last part of their TTL
+    ttl, grace = CacheService.refresh_ahead(CacheService.TTL_PROFILE)
+
+    try:
+        if use_cache:
+            enriched_profile, hit = await cache.get_or_revalidate(
+                cache_key, fetch_profile, ttl, grace
+            )
+            if hit and enriched_profile:
+                logger.debug("Returning cached enriched profile", profile_id=profile_id)
+                return _ok(profile=enriched_profile, cached=True)
+        else:
+            enriched_profile = await fetch_profile()
+            await cache.set(cache_key, enriched_profile, ttl, grace)
+
+        # Contact info and skills are usually requested next for the same profile
+        _schedule_prefetch(profile_id)
 
         # Check if we got meaningful data
         sources_successful = enriched_profile.get("_enrichment", {}).get("sources_successful", [])
@@ -316,11 +552,10 @@ async def get_profile(
         )
 
         if has_data:
-            return {
-                "success": True,
-                "profile": enriched_profile,
-                "cached": False,
-            }
+            return _ok(
+                profile=enriched_profile,
+                cached=False,
+            )
         else:
             # Provide guidance for limited data scenarios
             suggestions = []
@@ -338,19 +573,18 @@ async def get_profile(
                     "Install Playwright: Run 'playwright install chromium' for browser fallback"
                 )
 
-            return {
-                "success": True,
-                "profile": enriched_profile,
-                "cached": False,
-                "data_limited": True,
-                "reason": (
+            return _ok(
+                profile=enriched_profile,
+                cached=False,
+                data_limited=True,
+                reason=(
                     "Profile data is limited. LinkedIn's bot detection may have blocked some sources. "
                     "Fresh Data API (RapidAPI) is the most reliable source for profile data."
                 ),
-                "what_worked": sources_successful,
-                "profile_url": f"https://www.linkedin.com/in/{profile_id}/",
-                "suggestions": suggestions,
-            }
+                what_worked=sources_successful,
+                profile_url=f"https://www.linkedin.com/in/{profile_id}/",
+                suggestions=suggestions,
+            )
 
     except Exception as e:
         logger.error(
@@ -381,6 +615,100 @@ async def get_profile(
         }
 
 
+# Bounds background prefetches so a burst of get_profile calls cannot flood the client
+_PREFETCH_SLOTS = asyncio.Semaphore(8)
+_prefetch_tasks: set[asyncio.Task[None]] = set()
+
+
+def _schedule_prefetch(profile_id: str) -> None:
+    """Start warming the contact info and skills caches for a profile, if enabled."""
+    if not get_settings().features.predictive_prefetch or not get_context().linkedin_client:
+        return
+    task = asyncio.create_task(_prefetch_related(profile_id))
+    _prefetch_tasks.add(task)
+    task.add_done_callback(_prefetch_tasks.discard)
+
+
+async def _prefetch_related(profile_id: str) -> None:
+    """Fetch contact info and skills for a profile unless they are already cached."""
+    client = get_context().linkedin_client
+    if client is None:
+        return
+    cache = get_cache()
+    contact, skills = await cache.mget([cache.contact_key(profile_id), cache.skills_key(profile_id)])
+    loaders: list[Callable[[LinkedInClient, str], Awaitable[Any]]] = []
+    if contact is None:
+        loaders.append(_cached_contact_info)
+    if skills is None:
+        loaders.append(_cached_skills)
+
+    for load in loaders:
+        try:
+            async with _PREFETCH_SLOTS:
+                await load(client, profile_id)
+        except Exception as e:
+            logger.debug("Profile prefetch failed", profile_id=profile_id, error=str(e))
+
+
+async def _cached_contact_info(client: LinkedInClient, profile_id: str) -> tuple[dict, bool]:
+    """Get contact info for a profile, sharing one fetch between concurrent misses."""
+
+    async def fetch() -> dict:
+        return await client.get_profile_contact_info(profile_id) or {}
+
+    cache = get_cache()
+    # Hidden contact info comes back empty; remember that for a shorter time
+    return await cache.get_or_fetch(
+        cache.contact_key(profile_id),
+        fetch,
+        CacheService.TTL_PROFILE,
+        negative_ttl=CacheService.TTL_NEGATIVE,
+    )
+
+
+async def _cached_skills(client: LinkedInClient, profile_id: str) -> tuple[list[dict], bool]:
+    """Get a profile's skills sorted by endorsement count, sharing one fetch between concurrent misses."""
+
+    cache = get_cache()
+
+    async def fetch() -> list[dict]:
+        # Reuse the raw profile that batch_get_profiles and cache warming keep
+        profile, _ = await cache.get_or_fetch(
+            cache.profile_key(profile_id),
+            functools.partial(client.get_profile, profile_id),
+            CacheService.TTL_PROFILE,
+        )
+        skills = profile.get("skills", [])
+
+        # Extract and categorize skills
+        skill_data = []
+        for skill in skills:
+            skill_data.append({
+                "name": skill.get("name", ""),
+                "endorsement_count": skill.get("endorsementCount", 0),
+            })
+
+        # Sort by endorsement count
+        skill_data.sort(key=lambda x: x["endorsement_count"], reverse=True)
+        return skill_data
+
+    # An empty list is a cached "no visible skills" result
+    return await cache.get_or_fetch(
+        cache.skills_key(profile_id),
+        fetch,
+        CacheService.TTL_PROFILE,
+        negative_ttl=CacheService.TTL_NEGATIVE,
+    )
+
+
+@tool_error_handler
+@requires_client
+async def _get_profile_contact_info(client: LinkedInClient, profile_id: str) -> dict:
+    """Get contact information for a LinkedIn profile."""
+    contact_info, hit = await _cached_contact_info(client, profile_id)
+    return _ok(contact_info=contact_info, cached=hit)
+
+
 @mcp.tool()
 async def get_profile_contact_info(profile_id: str) -> dict:
     """
@@ -391,21 +719,20 @@ async def get_profile_contact_info(profile_id: str) -> dict:
 
     Returns contact info including email, phone, websites, and social profiles.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
+    return await _get_profile_contact_info(profile_id)
 
-    logger = get_logger(__name__)
-    ctx = get_context()
 
-    if not ctx.linkedin_client:
-        return {"error": "LinkedIn client not initialized"}
+@tool_error_handler
+@requires_client
+async def _get_profile_skills(client: LinkedInClient, profile_id: str) -> dict:
+    """Get skills and endorsements for a LinkedIn profile."""
+    skill_data, hit = await _cached_skills(client, profile_id)
 
-    try:
-        contact_info = await ctx.linkedin_client.get_profile_contact_info(profile_id)
-        return {"success": True, "contact_info": contact_info}
-    except Exception as e:
-        logger.error("Failed to fetch contact info", error=str(e), profile_id=profile_id)
-        return {"error": str(e)}
+    return _ok(
+        skills=skill_data,
+        total_skills=len(skill_data),
+        cached=hit,
+    )
 
 
 @mcp.tool()
@@ -418,50 +745,43 @@ async def get_profile_skills(profile_id: str) -> dict:
 
     Returns skills categorized by endorsement count with top endorsers.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.cache import CacheService, get_cache
+    return await _get_profile_skills(profile_id)
 
-    logger = get_logger(__name__)
-    ctx = get_context()
-    cache = get_cache()
-
-    if not ctx.linkedin_client:
-        return {"error": "LinkedIn client not initialized"}
 
-    cache_key = cache.make_key("skills", profile_id)
-
-    try:
-        # Check cache first
-        cached_data = await cache.get(cache_key)
-        if cached_data:
-            return {"success": True, "skills": cached_data, "cached": True}
+@mcp.tool()
+@requires_client
+async def get_profile_enriched(client: LinkedInClient, profile_id: str) -> dict:
+    """
+    Get contact info and skills for a LinkedIn profile in one call.
 
-        profile = await ctx.linkedin_client.get_profile(profile_id)
-        skills = profile.get("skills", [])
+    Both lookups run concurrently; if one fails the other is still returned
+    and the failure is listed under errors.
 
-        # Extract and categorize skills
-        skill_data = []
-        for skill in skills:
-            skill_data.append({
-                "name": skill.get("name", ""),
-                "endorsement_count": skill.get("endorsementCount", 0),
-            })
-
-        # Sort by endorsement count
-        skill_data.sort(key=lambda x: x["endorsement_count"], reverse=True)
+    Args:
+        profile_id: LinkedIn public ID
 
-        await cache.set(cache_key, skill_data, CacheService.TTL_PROFILE)
+    Returns contact info, skills sorted by endorsement count, and any per-part errors.
+    """
+    contact, skills = await asyncio.gather(
+        _cached_contact_info(client, profile_id),
+        _cached_skills(client, profile_id),
+        return_exceptions=True,
+    )
 
-        return {
-            "success": True,
-            "skills": skill_data,
-            "total_skills": len(skill_data),
-            "cached": False,
-        }
-    except Exception as e:
-        logger.error("Failed to fetch skills", error=str(e), profile_id=profile_id)
-        return {"error": str(e)}
+    errors = []
+    for part, result in (("contact_info", contact), ("skills", skills)):
+        if isinstance(result, BaseException):
+            logger.error("Failed to fetch profile part", part=part, error=str(result), profile_id=profile_id)
+            errors.append({"part": part, "error": str(result)})
+    if len(errors) == 2:
+        return {"error": errors[0]["error"], "errors": errors}
+
+    return _ok(
+        profile_id=profile_id,
+        contact_info=None if isinstance(contact, BaseException) else contact[0],
+        skills=None if isinstance(skills, BaseException) else skills[0],
+        errors=errors,
+    )
 
 
 # =============================================================================
@@ -483,11 +803,7 @@ async def get_profile_interests(profile_id: str) -> dict:
     Returns:
         Profile interests organized by category (influencers, companies, groups, topics)
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.cache import CacheService, get_cache
 
-    logger = get_logger(__name__)
     ctx = get_context()
     cache = get_cache()
 
@@ -499,7 +815,7 @@ async def get_profile_interests(profile_id: str) -> dict:
     try:
         cached_data = await cache.get(cache_key)
         if cached_data:
-            return {"success": True, "interests": cached_data, "cached": True}
+            return _ok(interests=cached_data, cached=True)
 
         interests = await ctx.pnd_client.get_profile_interests(public_id=profile_id)
 
@@ -508,15 +824,14 @@ async def get_profile_interests(profile_id: str) -> dict:
 
         await cache.set(cache_key, interests, CacheService.TTL_PROFILE)
 
-        return {
-            "success": True,
-            "profile_id": profile_id,
-            "interests": interests,
-            "cached": False,
-        }
+        return _ok(
+            profile_id=profile_id,
+            interests=interests,
+            cached=False,
+        )
     except Exception as e:
         logger.error("Failed to fetch profile interests", error=str(e), profile_id=profile_id)
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -534,11 +849,7 @@ async def get_similar_profiles(profile_id: str, limit: int = 10) -> dict:
     Returns:
         List of similar profiles with relevance scoring
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.cache import CacheService, get_cache
 
-    logger = get_logger(__name__)
     ctx = get_context()
     cache = get_cache()
 
@@ -550,7 +861,7 @@ async def get_similar_profiles(profile_id: str, limit: int = 10) -> dict:
     try:
         cached_data = await cache.get(cache_key)
         if cached_data:
-            return {"success": True, "similar_profiles": cached_data, "cached": True}
+            return _ok(similar_profiles=cached_data, cached=True)
 
         similar = await ctx.pnd_client.get_similar_profiles(public_id=profile_id, limit=limit)
 
@@ -565,16 +876,15 @@ async def get_similar_profiles(profile_id: str, limit: int = 10) -> dict:
             profiles = []
         await cache.set(cache_key, profiles, CacheService.TTL_PROFILE)
 
-        return {
-            "success": True,
-            "profile_id": profile_id,
-            "similar_profiles": profiles,
-            "count": len(profiles),
-            "cached": False,
-        }
+        return _ok(
+            profile_id=profile_id,
+            similar_profiles=profiles,
+            count=len(profiles),
+            cached=False,
+        )
     except Exception as e:
         logger.error("Failed to fetch similar profiles", error=str(e), profile_id=profile_id)
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -592,11 +902,7 @@ async def get_profile_articles(profile_id: str, limit: int = 20) -> dict:
     Returns:
         List of articles with title, content preview, and engagement metrics
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.cache import CacheService, get_cache
 
-    logger = get_logger(__name__)
     ctx = get_context()
     cache = get_cache()
 
@@ -608,7 +914,7 @@ async def get_profile_articles(profile_id: str, limit: int = 20) -> dict:
     try:
         cached_data = await cache.get(cache_key)
         if cached_data:
-            return {"success": True, "articles": cached_data, "cached": True}
+            return _ok(articles=cached_data, cached=True)
 
         articles = await ctx.pnd_client.get_profile_articles(public_id=profile_id, limit=limit)
 
@@ -623,16 +929,15 @@ async def get_profile_articles(profile_id: str, limit: int = 20) -> dict:
             article_list = []
         await cache.set(cache_key, article_list, CacheService.TTL_ARTICLES)
 
-        return {
-            "success": True,
-            "profile_id": profile_id,
-            "articles": article_list,
-            "count": len(article_list),
-            "cached": False,
-        }
+        return _ok(
+            profile_id=profile_id,
+            articles=article_list,
+            count=len(article_list),
+            cached=False,
+        )
     except Exception as e:
         logger.error("Failed to fetch profile articles", error=str(e), profile_id=profile_id)
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -649,11 +954,7 @@ async def get_article(article_url: str) -> dict:
     Returns:
         Article content with title, body, author info, and engagement data
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.cache import CacheService, get_cache
 
-    logger = get_logger(__name__)
     ctx = get_context()
     cache = get_cache()
 
@@ -661,14 +962,12 @@ async def get_article(article_url: str) -> dict:
         return {"error": "Professional Network Data API not configured. Set THIRDPARTY_RAPIDAPI_KEY."}
 
     # Create a cache key from the URL
-    import hashlib
-    url_hash = hashlib.md5(article_url.encode()).hexdigest()[:12]
-    cache_key = cache.make_key("article", url_hash)
+    cache_key = cache.digest_key("article", article_url)
 
     try:
         cached_data = await cache.get(cache_key)
         if cached_data:
-            return {"success": True, "article": cached_data, "cached": True}
+            return _ok(article=cached_data, cached=True)
 
         article = await ctx.pnd_client.get_article(article_url=article_url)
 
@@ -677,14 +976,13 @@ async def get_article(article_url: str) -> dict:
 
         await cache.set(cache_key, article, CacheService.TTL_PROFILE)
 
-        return {
-            "success": True,
-            "article": article,
-            "cached": False,
-        }
+        return _ok(
+            article=article,
+            cached=False,
+        )
     except Exception as e:
         logger.error("Failed to fetch article", error=str(e), article_url=article_url)
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -701,11 +999,7 @@ async def get_company_by_domain(domain: str) -> dict:
     Returns:
         Company information including name, industry, size, and LinkedIn URL
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.cache import CacheService, get_cache
 
-    logger = get_logger(__name__)
     ctx = get_context()
     cache = get_cache()
 
@@ -717,7 +1011,7 @@ async def get_company_by_domain(domain: str) -> dict:
     try:
         cached_data = await cache.get(cache_key)
         if cached_data:
-            return {"success": True, "company": cached_data, "cached": True}
+            return _ok(company=cached_data, cached=True)
 
         company = await ctx.pnd_client.get_company_by_domain(domain=domain)
 
@@ -729,79 +1023,35 @@ async def get_company_by_domain(domain: str) -> dict:
 
         await cache.set(cache_key, company, CacheService.TTL_COMPANY)
 
-        return {
-            "success": True,
-            "domain": domain,
-            "company": company,
-            "cached": False,
-        }
+        return _ok(
+            domain=domain,
+            company=company,
+            cached=False,
+        )
     except Exception as e:
         logger.error("Failed to fetch company by domain", error=str(e), domain=domain)
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
-async def get_network_stats() -> dict:
+@tool_error_handler
+@requires_client
+async def get_network_stats(client: LinkedInClient) -> dict:
     """
     Get statistics about the authenticated user's LinkedIn network.
 
     Returns network size, growth indicators, and connection insights.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.cache import CacheService, get_cache
-
-    logger = get_logger(__name__)
-    ctx = get_context()
-    cache = get_cache()
-
-    if not ctx.linkedin_client:
-        return {"error": "LinkedIn client not initialized"}
 
-    cache_key = "network:stats"
+    async def fetch_stats() -> dict:
+        connections = await client.get_profile_connections(limit=500)
+        return summarize_network(connections)
 
-    try:
-        cached_data = await cache.get(cache_key)
-        if cached_data:
-            return {"success": True, "stats": cached_data, "cached": True}
-
-        # Fetch connections
-        connections = await ctx.linkedin_client.get_profile_connections(limit=500)
-
-        # Analyze industries
-        industries: dict[str, int] = {}
-        locations: dict[str, int] = {}
-        companies: dict[str, int] = {}
-
-        for conn in connections:
-            industry = conn.get("industry", "Unknown")
-            industries[industry] = industries.get(industry, 0) + 1
-
-            location = conn.get("locationName", "Unknown")
-            locations[location] = locations.get(location, 0) + 1
-
-            company = conn.get("companyName", "Unknown")
-            if company != "Unknown":
-                companies[company] = companies.get(company, 0) + 1
-
-        # Sort and get top entries
-        top_industries = sorted(industries.items(), key=lambda x: x[1], reverse=True)[:10]
-        top_locations = sorted(locations.items(), key=lambda x: x[1], reverse=True)[:10]
-        top_companies = sorted(companies.items(), key=lambda x: x[1], reverse=True)[:10]
-
-        stats = {
-            "total_connections": len(connections),
-            "top_industries": dict(top_industries),
-            "top_locations": dict(top_locations),
-            "top_companies": dict(top_companies),
-        }
-
-        await cache.set(cache_key, stats, CacheService.TTL_CONNECTIONS)
-
-        return {"success": True, "stats": stats, "cached": False}
-    except Exception as e:
-        logger.error("Failed to fetch network stats", error=str(e))
-        return {"error": str(e)}
+    # Shares the fetch with the startup cache warmer if it is still running
+    stats, hit = await get_cache().get_or_fetch(
+        CacheService.NETWORK_STATS_KEY, fetch_stats, CacheService.TTL_CONNECTIONS
+    )
+    return _ok(stats=stats, cached=hit)
 
 
 @mcp.tool()
@@ -814,55 +1064,58 @@ async def batch_get_profiles(profile_ids: str) -> dict:
 
     Returns profiles with basic info and success/failure status for each.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.cache import CacheService, get_cache
-
-    logger = get_logger(__name__)
-    ctx = get_context()
-    cache = get_cache()
 
-    if not ctx.linkedin_client:
-        return {"error": "LinkedIn client not initialized"}
+    # Parse and validate IDs, dropping repeats while preserving order
+    ids = _split_csv(profile_ids, 10)
+    if ids is None:
+        return {"error": "Maximum 10 profiles per batch request"}
 
-    # Parse and validate IDs
-    ids = [p.strip() for p in profile_ids.split(",") if p.strip()]
     if not ids:
         return {"error": "No profile IDs provided"}
 
-    if len(ids) > 10:
-        return {"error": "Maximum 10 profiles per batch request"}
+    ctx = get_context()
+    cache = get_cache()
 
-    results = []
-    errors = []
+    if not ctx.linkedin_client:
+        return {"error": "LinkedIn client not initialized"}
 
+    hot_profiles = get_hot_profiles()
     for profile_id in ids:
-        cache_key = cache.make_key("profile", profile_id)
+        hot_profiles.touch(profile_id)
 
-        try:
-            # Check cache
-            cached = await cache.get(cache_key)
-            if cached:
-                results.append({"profile_id": profile_id, "profile": cached, "cached": True})
-                continue
+    # One cache round-trip for every ID, then fetch only the misses
+    cached_profiles = await cache.mget([cache.profile_key(profile_id) for profile_id in ids])
 
-            # Fetch from API
+    async def fetch_one(profile_id: str) -> dict:
+        try:
             profile = await ctx.linkedin_client.get_profile(profile_id)
-            await cache.set(cache_key, profile, CacheService.TTL_PROFILE)
-            results.append({"profile_id": profile_id, "profile": profile, "cached": False})
-
+            return {"profile_id": profile_id, "profile": profile, "cached": False}
         except Exception as e:
             logger.warning("Failed to fetch profile in batch", profile_id=profile_id, error=str(e))
-            errors.append({"profile_id": profile_id, "error": str(e)})
+            return {"profile_id": profile_id, "error": str(e)}
+
+    # Fetch concurrently; the client caps how many requests are in flight
+    misses = [profile_id for profile_id, cached in zip(ids, cached_profiles, strict=True) if not cached]
+    fetched = dict(zip(misses, await asyncio.gather(*(fetch_one(profile_id) for profile_id in misses)), strict=True))
+    await cache.mset(
+        {cache.profile_key(pid): o["profile"] for pid, o in fetched.items() if "error" not in o},
+        CacheService.TTL_PROFILE,
+    )
 
-    return {
-        "success": True,
-        "profiles": results,
-        "errors": errors,
-        "total_requested": len(ids),
-        "total_fetched": len(results),
-        "total_errors": len(errors),
-    }
+    outcomes = [
+        fetched.get(profile_id, {"profile_id": profile_id, "profile": cached, "cached": True})
+        for profile_id, cached in zip(ids, cached_profiles, strict=True)
+    ]
+    results = [o for o in outcomes if "error" not in o]
+    errors = [o for o in outcomes if "error" in o]
+
+    return _ok(
+        profiles=results,
+        errors=errors,
+        total_requested=len(ids),
+        total_fetched=len(results),
+        total_errors=len(errors),
+    )
 
 
 @mcp.tool()
@@ -872,10 +1125,9 @@ async def get_cache_stats() -> dict:
 
     Returns cache size, hit rate, and memory usage.
     """
-    from linkedin_mcp.services.cache import get_cache
 
     cache = get_cache()
-    return {"success": True, "cache": cache.stats}
+    return _ok(cache=cache.stats)
 
 
 # =============================================================================
@@ -883,7 +1135,21 @@ async def get_cache_stats() -> dict:
 # =============================================================================
 
 
+# How long past TTL_FEED a cached feed may still be served while it refreshes
+_FEED_STALE_GRACE = 300
+
+# List sizes fetched and cached upstream; requests are served from the smallest
+# bucket that covers them so nearby limits share one cache entry
+_LIMIT_BUCKETS = (10, 25, 50)
+
+
+def _limit_bucket(limit: int) -> int:
+    """Round a requested list size up to its cache bucket (sizes past the last bucket are kept)."""
+    return next((bucket for bucket in _LIMIT_BUCKETS if limit <= bucket), limit)
+
+
 @mcp.tool()
+@tool_error_handler
 async def get_feed(limit: int = 10, use_cache: bool = True) -> dict:
     """
     Get the authenticated user's LinkedIn feed.
@@ -894,46 +1160,48 @@ async def get_feed(limit: int = 10, use_cache: bool = True) -> dict:
 
     Returns recent feed posts with engagement data.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.cache import CacheService, get_cache
 
-    logger = get_logger(__name__)
     ctx = get_context()
     cache = get_cache()
 
     limit = min(limit, 50)  # Cap at 50
-    cache_key = cache.make_key("feed", str(limit))
+    bucket = _limit_bucket(limit)
+    cache_key = f"feed:{bucket}"
 
-    # Get or create a client (headless browser fallback)
-    client = ctx.linkedin_client
-    if not client:
-        try:
-            from linkedin_mcp.services.linkedin.client import LinkedInClient
-
-            client = LinkedInClient()
-            await client.initialize()
-        except Exception:
-            return {
-                "error": "LinkedIn client not available. Could not initialize feed client.",
-                "suggestion": "Ensure playwright is installed: pip install playwright && playwright install chromium",
-            }
+    async def fetch_feed() -> list:
+        # Get or create a client (headless browser fallback) only when a fetch is needed
+        client = ctx.linkedin_client
+        if not client:
+            try:
+                client = LinkedInClient()
+                await client.initialize()
+            except Exception as e:
+                raise LinkedInSessionError("Could not initialize feed client", cause=e) from e
+        return await client.get_feed(limit=bucket)
 
     try:
         if use_cache:
-            cached_data = await cache.get(cache_key)
-            if cached_data:
-                return {"success": True, "posts": cached_data, "count": len(cached_data), "cached": True}
+            # Stale entries inside the grace window are served while refreshing in the background
+            feed, hit = await cache.get_or_revalidate(
+                cache_key, fetch_feed, CacheService.TTL_FEED, _FEED_STALE_GRACE
+            )
+            feed = feed[:limit]
+            return _ok(posts=feed, count=len(feed), cached=hit)
 
-        feed = await client.get_feed(limit=limit)
-        await cache.set(cache_key, feed, CacheService.TTL_FEED)
-        return {"success": True, "posts": feed, "count": len(feed), "cached": False}
-    except Exception as e:
-        logger.error("Failed to fetch feed", error=str(e))
-        return {"error": str(e)}
+        feed = await fetch_feed()
+    except LinkedInSessionError:
+        return {
+            "error": "LinkedIn client not available. Could not initialize feed client.",
+            "suggestion": "Ensure playwright is installed: pip install playwright && playwright install chromium",
+        }
+
+    await cache.set(cache_key, feed, CacheService.TTL_FEED, _FEED_STALE_GRACE)
+    feed = feed[:limit]
+    return _ok(posts=feed, count=len(feed), cached=False)
 
 
 @mcp.tool()
+@tool_error_handler
 async def get_profile_posts(profile_id: str, limit: int = 10, use_cache: bool = True) -> dict:
     """
     Get posts from a specific LinkedIn profile.
@@ -945,40 +1213,66 @@ async def get_profile_posts(profile_id: str, limit: int = 10, use_cache: bool =
 
     Returns posts with engagement metrics (likes, comments, shares).
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.cache import CacheService, get_cache
 
-    logger = get_logger(__name__)
     ctx = get_context()
     cache = get_cache()
 
     limit = min(limit, 50)  # Cap at 50
-    cache_key = cache.make_key("posts", profile_id, str(limit))
+    bucket = _limit_bucket(limit)
+    cache_key = f"posts:{profile_id}:{bucket}"
 
-    try:
-        if use_cache:
-            cached_data = await cache.get(cache_key)
-            if cached_data:
-                return {"success": True, "posts": cached_data, "count": len(cached_data), "cached": True}
+    if not ctx.data_provider:
+        if use_cache and (cached_page := await cache.get(cache_key)):
+            cached_data = cached_page["posts"][:limit]
+            return _ok(posts=cached_data, count=len(cached_data), cached=True)
+        return {"error": "No LinkedIn data provider available. Configure API credentials."}
 
+    async def fetch_posts() -> dict | None:
         # Use data_provider with full fallback chain (PND → Fresh Data → Enhanced → Headless → Primary)
-        if ctx.data_provider:
-            result = await ctx.data_provider.get_profile_posts(profile_id, limit=limit)
-            posts = result.get("posts", result.get("data", []))
-            source = result.get("source", "data_provider")
-            if posts:
-                await cache.set(cache_key, posts, CacheService.TTL_POSTS)
-            return {"success": True, "posts": posts, "count": len(posts), "cached": False, "source": source}
+        result = await ctx.data_provider.get_profile_posts(profile_id, limit=bucket)
+        # Providers may return a full upstream page; keep only the bucket
+        posts = result.get("posts", result.get("data", []))[:bucket]
+        # Cache the source with the posts so callers sharing this fetch report it too
+        return {"posts": posts, "source": result.get("source", "data_provider")} if posts else None
+
+    ttl, grace = CacheService.refresh_ahead(CacheService.TTL_POSTS)
+    if use_cache:
+        page, hit = await cache.get_or_revalidate(cache_key, fetch_posts, ttl, grace)
+        if hit:
+            posts = page["posts"][:limit]
+            return _ok(posts=posts, count=len(posts), cached=True)
+    else:
+        page = await fetch_posts()
+        if page:
+            await cache.set(cache_key, page, ttl, grace)
 
-        return {"error": "No LinkedIn data provider available. Configure API credentials."}
-    except Exception as e:
-        logger.error("Failed to fetch posts", error=str(e), profile_id=profile_id)
-        return {"error": str(e)}
+    if not page:
+        return _ok(posts=[], count=0, cached=False, source="data_provider")
+    posts = page["posts"][:limit]
+    return _ok(posts=posts, count=len(posts), cached=False, source=page["source"])
+
+
+# Cached feeds and post lists that can include the user's own posts. The own
+# profile id is not known without an extra lookup, so every post list is dropped.
+_POST_LIST_PREFIXES = ("feed:", "posts:", "provider:posts:")
+
+
+async def _invalidate_post_lists() -> None:
+    """Drop cached feeds and post lists after the user creates, edits or deletes a post."""
+    await get_cache().clear_pattern(_POST_LIST_PREFIXES)
+
+
+async def _invalidate_post_engagement(post_urn: str) -> None:
+    """Drop cached reactions and comments for a post after the user changes them."""
+    cache = get_cache()
+    # Reactions have one exact key; comments have one per limit bucket, so the
+    # prefix keeps its trailing ":" to avoid matching longer URNs
+    await cache.delete(f"provider:reactions:{post_urn}")
+    await cache.clear_pattern(f"provider:comments:{post_urn}:")
 
 
 @mcp.tool()
-async def create_post(text: str, visibility: str = "PUBLIC") -> dict:
+async def create_post(text: _PostText, visibility: str = "PUBLIC") -> dict:
     """
     Create a new LinkedIn post using the Official API (recommended) or unofficial API.
 
@@ -991,40 +1285,30 @@ async def create_post(text: str, visibility: str = "PUBLIC") -> dict:
 
     Returns the created post details including post URN.
     """
-    from linkedin_mcp.config.constants import MAX_POST_LENGTH
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.linkedin.posts_client import LinkedInPostsClient, PostVisibility
 
-    logger = get_logger(__name__)
-    ctx = get_context()
-
-    if len(text) > MAX_POST_LENGTH:
-        return {"error": f"Post exceeds maximum length of {MAX_POST_LENGTH} characters"}
+    if error := _validate_post_length(text):
+        return error
 
     # Map visibility
-    visibility_map = {
-        "PUBLIC": PostVisibility.PUBLIC,
-        "CONNECTIONS": PostVisibility.CONNECTIONS,
-        "LOGGED_IN": PostVisibility.CONNECTIONS,  # Map to CONNECTIONS for official API
-    }
-    if visibility.upper() not in visibility_map:
+    post_visibility = _VISIBILITY_MAP.get(visibility.upper())
+    if post_visibility is None:
         return {"error": "Invalid visibility. Must be PUBLIC or CONNECTIONS"}
 
+    ctx = get_context()
+
     # Prefer Official API - TOS compliant and reliable
     if ctx.has_official_client:
         try:
-            posts_client = LinkedInPostsClient(
-                access_token=ctx.official_client._access_token,
-                member_urn=None,  # Will be fetched automatically
-            )
-            result = posts_client.create_text_post(
+            posts_client = get_posts_client(ctx.official_client._access_token)
+            result = await asyncio.to_thread(
+                posts_client.create_text_post,
                 text=text,
-                visibility=visibility_map[visibility.upper()],
+                visibility=post_visibility,
             )
             if result and result.get("success"):
                 logger.info("Created post via Official API", post_urn=result.get("post_urn"))
-                return {"success": True, "post": result, "source": "official_api"}
+                await _invalidate_post_lists()
+                return _ok(post=result, source="official_api")
             else:
                 logger.warning("Official API post failed, trying unofficial", error=result.get("error"))
         except Exception as e:
@@ -1034,16 +1318,60 @@ async def create_post(text: str, visibility: str = "PUBLIC") -> dict:
     if ctx.linkedin_client:
         try:
             result = await ctx.linkedin_client.create_post(text, visibility=visibility)
-            return {"success": True, "post": result, "source": "unofficial_api"}
+            await _invalidate_post_lists()
+            return _ok(post=result, source="unofficial_api")
         except Exception as e:
             logger.error("Failed to create post via unofficial API", error=str(e))
-            return {"error": str(e)}
+            return _err(e)
 
     return {"error": "No LinkedIn client available. Configure OAuth token or session cookies."}
 
 
+# Chunk size used when streaming downloaded media to disk
+_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+
+async def _stream_to_tempfile(response: Any, suffix: str) -> tuple[Any, int]:
+    """
+    Write a streamed httpx response to a named temp file chunk by chunk.
+
+    Returns the closed temp file and the number of bytes written, so callers
+    never hold the full media body in memory. A partial file is removed if the
+    download fails or is cancelled mid-stream.
+    """
+
+    size = 0
+    temp_file = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+    try:
+        async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+            temp_file.write(chunk)
+            size += len(chunk)
+    except BaseException:
+        temp_file.close()
+        Path(temp_file.name).unlink(missing_ok=True)
+        raise
+    temp_file.close()
+    return temp_file, size
+
+
+def _sniff_image(path: Path) -> str | None:
+    """Identify an image format from its leading magic bytes, or None if unrecognized."""
+    with path.open("rb") as f:
+        header = f.read(12)
+
+    if header.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
 @mcp.tool()
-async def create_image_post(text: str, image_path: str, alt_text: str | None = None, visibility: str = "PUBLIC") -> dict:
+async def create_image_post(text: _PostText, image_path: str, alt_text: str | None = None, visibility: str = "PUBLIC") -> dict:
     """
     Create a LinkedIn post with an image using the Official API.
 
@@ -1060,21 +1388,12 @@ async def create_image_post(text: str, image_path: str, alt_text: str | None = N
 
     Returns the created post details including post URN and image URN.
     """
-    import base64
-    import tempfile
-    from pathlib import Path
-    from urllib.parse import urlparse
 
-    import httpx
+    if error := _validate_post_length(text):
+        return error
 
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.linkedin.posts_client import LinkedInPostsClient, PostVisibility
-
-    logger = get_logger(__name__)
     ctx = get_context()
 
-    valid_extensions = (".jpg", ".jpeg", ".png", ".gif")
     temp_file = None
     image_file = None
 
@@ -1084,8 +1403,9 @@ async def create_image_post(text: str, image_path: str, alt_text: str | None = N
             # URL input - download to temp file
             logger.info("Downloading image from URL", url=image_path[:100])
             try:
-                async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                    response = await client.get(image_path)
+                async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client, client.stream(
+                    "GET", image_path
+                ) as response:
                     response.raise_for_status()
 
                     # Determine file extension from content-type or URL
@@ -1100,14 +1420,12 @@ async def create_image_post(text: str, image_path: str, alt_text: str | None = N
                         # Try to get from URL path
                         parsed = urlparse(image_path)
                         path_ext = Path(parsed.path).suffix.lower()
-                        ext = path_ext if path_ext in valid_extensions else ".jpg"
+                        ext = path_ext if path_ext in _VALID_IMAGE_EXTS else ".jpg"
 
-                    # Create temp file with proper extension
-                    temp_file = tempfile.NamedTemporaryFile(suffix=ext, delete=False)
-                    temp_file.write(response.content)
-                    temp_file.close()
+                    # Stream into a temp file with the proper extension
+                    temp_file, size = await _stream_to_tempfile(response, ext)
                     image_file = Path(temp_file.name)
-                    logger.info("Downloaded image to temp file", path=str(image_file), size=len(response.content))
+                    logger.info("Downloaded image to temp file", path=str(image_file), size=size)
 
             except httpx.HTTPStatusError as e:
                 return {"error": f"Failed to download image: HTTP {e.response.status_code}"}
@@ -1141,15 +1459,19 @@ async def create_image_post(text: str, image_path: str, alt_text: str | None = N
         else:
             # Local file path
             image_file = Path(image_path)
-            if not image_file.exists():
+            if not await asyncio.to_thread(image_file.exists):
                 return {
                     "error": f"Image file not found: {image_path}",
                     "hint": "You can also provide a URL (http/https) or base64-encoded image (data:image/...)",
                 }
 
         # Validate file extension
-        if not image_file.suffix.lower() in valid_extensions:
-            return {"error": f"Invalid image format. Supported: {', '.join(valid_extensions)}"}
+        if not image_file.suffix.lower() in _VALID_IMAGE_EXTS:
+            return {"error": f"Invalid image format. Supported: {', '.join(_VALID_IMAGE_EXTS)}"}
+
+        # Reject mislabeled files before spending an upload on them
+        if _sniff_image(image_file) not in ("jpeg", "png", "gif"):
+            return {"error": "Image bytes do not match format. Supported: JPEG, PNG, GIF"}
 
         # Check official API availability
         if not ctx.has_official_client:
@@ -1158,12 +1480,11 @@ async def create_image_post(text: str, image_path: str, alt_text: str | None = N
                 "hint": "Enable 'Share on LinkedIn' product in your LinkedIn Developer app.",
             }
 
-        visibility_enum = PostVisibility.PUBLIC if visibility.upper() == "PUBLIC" else PostVisibility.CONNECTIONS
+        visibility_enum = _VISIBILITY_MAP.get(visibility.upper(), PostVisibility.CONNECTIONS)
 
-        posts_client = LinkedInPostsClient(
-            access_token=ctx.official_client._access_token,
-        )
-        result = posts_client.create_image_post(
+        posts_client = get_posts_client(ctx.official_client._access_token)
+        result = await asyncio.to_thread(
+            posts_client.create_image_post,
             text=text,
             image_path=image_file,
             alt_text=alt_text,
@@ -1172,18 +1493,18 @@ async def create_image_post(text: str, image_path: str, alt_text: str | None = N
 
         if result and result.get("success"):
             logger.info("Created image post", post_urn=result.get("post_urn"))
-            return {"success": True, "post": result, "source": "official_api"}
+            await _invalidate_post_lists()
+            return _ok(post=result, source="official_api")
         else:
             return {"success": False, "error": result.get("error", "Unknown error")}
 
     except Exception as e:
         logger.error("Failed to create image post", error=str(e))
-        return {"error": str(e)}
+        return _err(e)
 
     finally:
         # Clean up temp file if we created one
         if temp_file is not None:
-            import os
             try:
                 os.unlink(temp_file.name)
                 logger.debug("Cleaned up temp image file", path=temp_file.name)
@@ -1214,19 +1535,9 @@ async def create_video_post(text: str, video_path: str, title: str | None = None
     Returns the created post details including post URN and video URN.
     Note: Video may take a few minutes to process before appearing in the feed.
     """
-    import tempfile
-    from pathlib import Path
 
-    import httpx
-
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.linkedin.posts_client import LinkedInPostsClient, PostVisibility
-
-    logger = get_logger(__name__)
     ctx = get_context()
 
-    valid_extensions = (".mp4", ".mov")
     temp_file = None
     video_file = None
 
@@ -1236,8 +1547,9 @@ async def create_video_post(text: str, video_path: str, title: str | None = None
             # URL input - download to temp file
             logger.info("Downloading video from URL", url=video_path[:100])
             try:
-                async with httpx.AsyncClient(timeout=120.0, follow_redirects=True) as client:
-                    response = await client.get(video_path)
+                async with httpx.AsyncClient(timeout=120.0, follow_redirects=True) as client, client.stream(
+                    "GET", video_path
+                ) as response:
                     response.raise_for_status()
 
                     # Determine file extension from content-type or URL
@@ -1247,12 +1559,10 @@ async def create_video_post(text: str, video_path: str, title: str | None = None
                     else:
                         ext = ".mp4"
 
-                    # Save to temp file
-                    temp_file = tempfile.NamedTemporaryFile(suffix=ext, delete=False)
-                    temp_file.write(response.content)
-                    temp_file.close()
+                    # Stream to temp file
+                    temp_file, size = await _stream_to_tempfile(response, ext)
                     video_file = Path(temp_file.name)
-                    logger.info("Downloaded video to temp file", path=str(video_file), size_mb=len(response.content) / 1024 / 1024)
+                    logger.info("Downloaded video to temp file", path=str(video_file), size_mb=size / 1024 / 1024)
 
             except httpx.HTTPError as e:
                 return {"error": f"Failed to download video from URL: {str(e)}"}
@@ -1260,15 +1570,15 @@ async def create_video_post(text: str, video_path: str, title: str | None = None
         else:
             # Local file path
             video_file = Path(video_path)
-            if not video_file.exists():
+            if not await asyncio.to_thread(video_file.exists):
                 return {
                     "error": f"Video file not found: {video_path}",
                     "hint": "You can also provide a URL (http/https) to download the video.",
                 }
 
         # Validate file extension
-        if video_file.suffix.lower() not in valid_extensions:
-            return {"error": f"Invalid video format. Supported: {', '.join(valid_extensions)}"}
+        if video_file.suffix.lower() not in _VALID_VIDEO_EXTS:
+            return {"error": f"Invalid video format. Supported: {', '.join(_VALID_VIDEO_EXTS)}"}
 
         # Check official API availability
         if not ctx.has_official_client:
@@ -1277,12 +1587,11 @@ async def create_video_post(text: str, video_path: str, title: str | None = None
                 "hint": "Enable 'Share on LinkedIn' product in your LinkedIn Developer app.",
             }
 
-        visibility_enum = PostVisibility.PUBLIC if visibility.upper() == "PUBLIC" else PostVisibility.CONNECTIONS
+        visibility_enum = _VISIBILITY_MAP.get(visibility.upper(), PostVisibility.CONNECTIONS)
 
-        posts_client = LinkedInPostsClient(
-            access_token=ctx.official_client._access_token,
-        )
-        result = posts_client.create_video_post(
+        posts_client = get_posts_client(ctx.official_client._access_token)
+        result = await asyncio.to_thread(
+            posts_client.create_video_post,
             text=text,
             video_path=video_file,
             title=title,
@@ -1291,18 +1600,18 @@ async def create_video_post(text: str, video_path: str, title: str | None = None
 
         if result and result.get("success"):
             logger.info("Created video post", post_urn=result.get("post_urn"))
-            return {"success": True, "post": result, "source": "official_api"}
+            await _invalidate_post_lists()
+            return _ok(post=result, source="official_api")
         else:
             return {"success": False, "error": result.get("error", "Unknown error")}
 
     except Exception as e:
         logger.error("Failed to create video post", error=str(e))
-        return {"error": str(e)}
+        return _err(e)
 
     finally:
         # Clean up temp file if we created one
         if temp_file is not None:
-            import os
             try:
                 os.unlink(temp_file.name)
                 logger.debug("Cleaned up temp video file", path=temp_file.name)
@@ -1333,19 +1642,9 @@ async def create_document_post(text: str, document_path: str, title: str | None
 
     Returns the created post details including post URN and document URN.
     """
-    import tempfile
-    from pathlib import Path
 
-    import httpx
-
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.linkedin.posts_client import LinkedInPostsClient, PostVisibility
-
-    logger = get_logger(__name__)
     ctx = get_context()
 
-    valid_extensions = (".pdf", ".pptx", ".docx")
     temp_file = None
     document_file = None
 
@@ -1355,8 +1654,9 @@ async def create_document_post(text: str, document_path: str, title: str | None
             # URL input - download to temp file
             logger.info("Downloading document from URL", url=document_path[:100])
             try:
-                async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
-                    response = await client.get(document_path)
+                async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client, client.stream(
+                    "GET", document_path
+                ) as response:
                     response.raise_for_status()
 
                     # Determine file extension from content-type or URL
@@ -1369,17 +1669,14 @@ async def create_document_post(text: str, document_path: str, title: str | None
                         ext = ".docx"
                     else:
                         # Try to infer from URL
-                        from urllib.parse import urlparse
                         parsed = urlparse(document_path)
                         path_ext = Path(parsed.path).suffix.lower()
-                        ext = path_ext if path_ext in valid_extensions else ".pdf"
+                        ext = path_ext if path_ext in _VALID_DOCUMENT_EXTS else ".pdf"
 
-                    # Save to temp file
-                    temp_file = tempfile.NamedTemporaryFile(suffix=ext, delete=False)
-                    temp_file.write(response.content)
-                    temp_file.close()
+                    # Stream to temp file
+                    temp_file, size = await _stream_to_tempfile(response, ext)
                     document_file = Path(temp_file.name)
-                    logger.info("Downloaded document to temp file", path=str(document_file), size_mb=len(response.content) / 1024 / 1024)
+                    logger.info("Downloaded document to temp file", path=str(document_file), size_mb=size / 1024 / 1024)
 
             except httpx.HTTPError as e:
                 return {"error": f"Failed to download document from URL: {str(e)}"}
@@ -1387,15 +1684,15 @@ async def create_document_post(text: str, document_path: str, title: str | None
         else:
             # Local file path
             document_file = Path(document_path)
-            if not document_file.exists():
+            if not await asyncio.to_thread(document_file.exists):
                 return {
                     "error": f"Document file not found: {document_path}",
                     "hint": "You can also provide a URL (http/https) to download the document.",
                 }
 
         # Validate file extension
-        if document_file.suffix.lower() not in valid_extensions:
-            return {"error": f"Invalid document format. Supported: {', '.join(valid_extensions)}"}
+        if document_file.suffix.lower() not in _VALID_DOCUMENT_EXTS:
+            return {"error": f"Invalid document format. Supported: {', '.join(_VALID_DOCUMENT_EXTS)}"}
 
         # Check official API availability
         if not ctx.has_official_client:
@@ -1404,12 +1701,11 @@ async def create_document_post(text: str, document_path: str, title: str | None
                 "hint": "Enable 'Share on LinkedIn' product in your LinkedIn Developer app.",
             }
 
-        visibility_enum = PostVisibility.PUBLIC if visibility.upper() == "PUBLIC" else PostVisibility.CONNECTIONS
+        visibility_enum = _VISIBILITY_MAP.get(visibility.upper(), PostVisibility.CONNECTIONS)
 
-        posts_client = LinkedInPostsClient(
-            access_token=ctx.official_client._access_token,
-        )
-        result = posts_client.create_document_post(
+        posts_client = get_posts_client(ctx.official_client._access_token)
+        result = await asyncio.to_thread(
+            posts_client.create_document_post,
             text=text,
             document_path=document_file,
             title=title,
@@ -1418,18 +1714,18 @@ async def create_document_post(text: str, document_path: str, title: str | None
 
         if result and result.get("success"):
             logger.info("Created document post", post_urn=result.get("post_urn"))
-            return {"success": True, "post": result, "source": "official_api"}
+            await _invalidate_post_lists()
+            return _ok(post=result, source="official_api")
         else:
             return {"success": False, "error": result.get("error", "Unknown error")}
 
     except Exception as e:
         logger.error("Failed to create document post", error=str(e))
-        return {"error": str(e)}
+        return _err(e)
 
     finally:
         # Clean up temp file if we created one
         if temp_file is not None:
-            import os
             try:
                 os.unlink(temp_file.name)
                 logger.debug("Cleaned up temp document file", path=temp_file.name)
@@ -1439,7 +1735,7 @@ async def create_document_post(text: str, document_path: str, title: str | None
 
 @mcp.tool()
 async def create_poll(
-    question: str,
+    question: _PollQuestion,
     options: str,
     duration_days: int = 7,
     visibility: str = "PUBLIC",
@@ -1451,28 +1747,29 @@ async def create_poll(
 
     Args:
         question: Poll question (also displayed as post text, max 140 characters)
-        options: Comma-separated poll options (2-4 options, each max 140 characters)
+        options: Comma-separated poll options (2-4 distinct options, each max 140 characters)
         duration_days: Poll duration - 1, 3, 7, or 14 days (default: 7)
         visibility: Post visibility - PUBLIC or CONNECTIONS
 
     Returns the created poll post details.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.linkedin.posts_client import LinkedInPostsClient, PostVisibility
 
-    logger = get_logger(__name__)
-    ctx = get_context()
+    if error := _validate_post_length(question, MAX_POLL_QUESTION_LENGTH, "Poll question"):
+        return error
 
     # Parse options
-    option_list = [opt.strip() for opt in options.split(",") if opt.strip()]
-    if len(option_list) < 2 or len(option_list) > 4:
+    option_list = _split_csv(options, 4, unique=False)
+    if option_list is None or len(option_list) < 2:
         return {"error": "Poll must have 2-4 options (comma-separated)"}
+    if len(set(option_list)) != len(option_list):
+        return {"error": "Poll options must be unique"}
 
     # Validate duration
-    if duration_days not in (1, 3, 7, 14):
+    if duration_days not in _VALID_POLL_DURATIONS:
         return {"error": "Poll duration must be 1, 3, 7, or 14 days"}
 
+    ctx = get_context()
+
     # Check official API availability
     if not ctx.has_official_client:
         return {
@@ -1480,13 +1777,12 @@ async def create_poll(
             "hint": "Enable 'Share on LinkedIn' product in your LinkedIn Developer app.",
         }
 
-    visibility_enum = PostVisibility.PUBLIC if visibility.upper() == "PUBLIC" else PostVisibility.CONNECTIONS
+    visibility_enum = _VISIBILITY_MAP.get(visibility.upper(), PostVisibility.CONNECTIONS)
 
     try:
-        posts_client = LinkedInPostsClient(
-            access_token=ctx.official_client._access_token,
-        )
-        result = posts_client.create_poll(
+        posts_client = get_posts_client(ctx.official_client._access_token)
+        result = await asyncio.to_thread(
+            posts_client.create_poll,
             question=question,
             options=option_list,
             duration_days=duration_days,
@@ -1495,13 +1791,14 @@ async def create_poll(
 
         if result and result.get("success"):
             logger.info("Created poll", post_urn=result.get("post_urn"))
-            return {"success": True, "poll": result, "source": "official_api"}
+            await _invalidate_post_lists()
+            return _ok(poll=result, source="official_api")
         else:
             return {"success": False, "error": result.get("error", "Unknown error")}
 
     except Exception as e:
         logger.error("Failed to create poll", error=str(e))
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -1516,11 +1813,10 @@ async def delete_post(post_urn: str) -> dict:
 
     Returns success status.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.linkedin.posts_client import LinkedInPostsClient
 
-    logger = get_logger(__name__)
+    if error := _check_post_urn(post_urn):
+        return error
+
     ctx = get_context()
 
     if not ctx.has_official_client:
@@ -1529,20 +1825,19 @@ async def delete_post(post_urn: str) -> dict:
         }
 
     try:
-        posts_client = LinkedInPostsClient(
-            access_token=ctx.official_client._access_token,
-        )
-        result = posts_client.delete_post(post_urn)
+        posts_client = get_posts_client(ctx.official_client._access_token)
+        result = await asyncio.to_thread(posts_client.delete_post, post_urn)
 
         if result and result.get("success"):
             logger.info("Deleted post", post_urn=post_urn)
-            return {"success": True, "message": f"Post {post_urn} deleted", "source": "official_api"}
+            await _invalidate_post_lists()
+            return _ok(message=f"Post {post_urn} deleted", source="official_api")
         else:
             return {"success": False, "error": result.get("error", "Unknown error")}
 
     except Exception as e:
         logger.error("Failed to delete post", error=str(e), post_urn=post_urn)
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -1570,13 +1865,10 @@ async def edit_post(
         At least one of 'text' or 'image_path' must be provided.
         This uses LinkedIn's PARTIAL_UPDATE method to update only specified fields.
     """
-    from pathlib import Path
 
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.linkedin.posts_client import LinkedInPostsClient
+    if error := _check_post_urn(post_urn):
+        return error
 
-    logger = get_logger(__name__)
     ctx = get_context()
 
     if not ctx.has_official_client:
@@ -1585,14 +1877,13 @@ async def edit_post(
         }
 
     try:
-        posts_client = LinkedInPostsClient(
-            access_token=ctx.official_client._access_token,
-        )
+        posts_client = get_posts_client(ctx.official_client._access_token)
 
         # Convert string path to Path object if provided
         image = Path(image_path) if image_path else None
 
-        result = posts_client.update_post(
+        result = await asyncio.to_thread(
+            posts_client.update_post,
             post_urn=post_urn,
             text=text,
             image_path=image,
@@ -1605,19 +1896,19 @@ async def edit_post(
                 post_urn=post_urn,
                 updated_fields=result.get("updated_fields"),
             )
-            return {
-                "success": True,
-                "message": f"Post {post_urn} updated successfully",
-                "updated_fields": result.get("updated_fields"),
-                "new_image_urn": result.get("new_image_urn"),
-                "source": "official_api",
-            }
+            await _invalidate_post_lists()
+            return _ok(
+                message=f"Post {post_urn} updated successfully",
+                updated_fields=result.get("updated_fields"),
+                new_image_urn=result.get("new_image_urn"),
+                source="official_api",
+            )
         else:
             return {"success": False, "error": result.get("error", "Unknown error")}
 
     except Exception as e:
         logger.error("Failed to edit post", error=str(e), post_urn=post_urn)
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -1651,25 +1942,9 @@ async def create_comment(
     allows creating posts, not comments. If you receive a permission error,
     you'll need to apply for Community Management API access in your Developer Portal.
     """
-    import base64
-    import tempfile
-    from pathlib import Path
-    from urllib.parse import urlparse
-
-    import httpx
 
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.linkedin.posts_client import LinkedInPostsClient
-
-    logger = get_logger(__name__)
-    ctx = get_context()
-
-    if not ctx.has_official_client:
-        return {
-            "error": "Official API required to create comments. Run 'linkedin-mcp-auth oauth' to authenticate.",
-            "hint": "Enable 'Share on LinkedIn' product in your LinkedIn Developer app.",
-        }
+    if error := _check_post_urn(post_urn):
+        return error
 
     if not text or not text.strip():
         return {"error": "Comment text cannot be empty"}
@@ -1685,7 +1960,14 @@ async def create_comment(
             "hint": "First create a text comment, then use the returned comment_id as parent_comment_urn for an image reply.",
         }
 
-    valid_extensions = (".jpg", ".jpeg", ".png", ".gif")
+    ctx = get_context()
+
+    if not ctx.has_official_client:
+        return {
+            "error": "Official API required to create comments. Run 'linkedin-mcp-auth oauth' to authenticate.",
+            "hint": "Enable 'Share on LinkedIn' product in your LinkedIn Developer app.",
+        }
+
     temp_file = None
     image_file = None
 
@@ -1710,7 +1992,7 @@ async def create_comment(
                         else:
                             parsed = urlparse(image_path)
                             path_ext = Path(parsed.path).suffix.lower()
-                            ext = path_ext if path_ext in valid_extensions else ".jpg"
+                            ext = path_ext if path_ext in _VALID_IMAGE_EXTS else ".jpg"
 
                         temp_file = tempfile.NamedTemporaryFile(suffix=ext, delete=False)
                         temp_file.write(response.content)
@@ -1745,20 +2027,19 @@ async def create_comment(
             else:
                 # Local file path
                 image_file = Path(image_path)
-                if not image_file.exists():
+                if not await asyncio.to_thread(image_file.exists):
                     return {
                         "error": f"Image file not found: {image_path}",
                         "hint": "You can also provide a URL (http/https) or base64-encoded image (data:image/...)",
                     }
 
             # Validate extension
-            if not image_file.suffix.lower() in valid_extensions:
-                return {"error": f"Invalid image format. Supported: {', '.join(valid_extensions)}"}
+            if not image_file.suffix.lower() in _VALID_IMAGE_EXTS:
+                return {"error": f"Invalid image format. Supported: {', '.join(_VALID_IMAGE_EXTS)}"}
 
-        posts_client = LinkedInPostsClient(
-            access_token=ctx.official_client._access_token,
-        )
-        result = posts_client.create_comment(
+        posts_client = get_posts_client(ctx.official_client._access_token)
+        result = await asyncio.to_thread(
+            posts_client.create_comment,
             post_urn=post_urn,
             text=text,
             parent_comment_urn=parent_comment_urn,
@@ -1767,18 +2048,18 @@ async def create_comment(
 
         if result and result.get("success"):
             logger.info("Created comment", comment_id=result.get("comment_id"), post_urn=post_urn)
-            return {"success": True, "comment": result, "source": "official_api"}
+            await _invalidate_post_engagement(post_urn)
+            return _ok(comment=result, source="official_api")
         else:
             return {"success": False, "error": result.get("error", "Unknown error")}
 
     except Exception as e:
         logger.error("Failed to create comment", error=str(e), post_urn=post_urn)
-        return {"error": str(e)}
+        return _err(e)
 
     finally:
         # Clean up temp file if we created one
         if temp_file is not None:
-            import os
             try:
                 os.unlink(temp_file.name)
             except OSError:
@@ -1803,11 +2084,10 @@ async def delete_comment(
 
     Note: You can only delete comments that you have authored.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.linkedin.posts_client import LinkedInPostsClient
 
-    logger = get_logger(__name__)
+    if error := _check_post_urn(post_urn):
+        return error
+
     ctx = get_context()
 
     if not ctx.has_official_client:
@@ -1817,23 +2097,23 @@ async def delete_comment(
         }
 
     try:
-        posts_client = LinkedInPostsClient(
-            access_token=ctx.official_client._access_token,
-        )
-        result = posts_client.delete_comment(
+        posts_client = get_posts_client(ctx.official_client._access_token)
+        result = await asyncio.to_thread(
+            posts_client.delete_comment,
             post_urn=post_urn,
             comment_id=comment_id,
         )
 
         if result and result.get("success"):
             logger.info("Deleted comment", comment_id=comment_id, post_urn=post_urn)
-            return {"success": True, "result": result, "source": "official_api"}
+            await _invalidate_post_engagement(post_urn)
+            return _ok(result=result, source="official_api")
         else:
             return {"success": False, "error": result.get("error", "Unknown error")}
 
     except Exception as e:
         logger.error("Failed to delete comment", error=str(e), post_urn=post_urn)
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -1863,11 +2143,10 @@ async def get_comments_official(
 
     Use the returned comment URN as parent_comment_urn in create_comment to reply to a comment.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.linkedin.posts_client import LinkedInPostsClient
 
-    logger = get_logger(__name__)
+    if error := _check_post_urn(post_urn):
+        return error
+
     ctx = get_context()
 
     if not ctx.has_official_client:
@@ -1877,10 +2156,9 @@ async def get_comments_official(
         }
 
     try:
-        posts_client = LinkedInPostsClient(
-            access_token=ctx.official_client._access_token,
-        )
-        result = posts_client.get_post_comments(
+        posts_client = get_posts_client(ctx.official_client._access_token)
+        result = await asyncio.to_thread(
+            posts_client.get_post_comments,
             post_urn=post_urn,
             start=start,
             count=count,
@@ -1893,13 +2171,12 @@ async def get_comments_official(
                 post_urn=post_urn,
                 comment_count=len(comments),
             )
-            return {
-                "success": True,
-                "comments": comments,
-                "total": result.get("total", len(comments)),
-                "paging": result.get("paging", {}),
-                "source": "official_api",
-            }
+            return _ok(
+                comments=comments,
+                total=result.get("total", len(comments)),
+                paging=result.get("paging", {}),
+                source="official_api",
+            )
         else:
             return {"success": False, "error": result.get("error", "Unknown error"), "comments": []}
 
@@ -1934,11 +2211,10 @@ async def create_reaction(
 
     Note: The MAYBE reaction type is deprecated and no longer supported.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.linkedin.posts_client import LinkedInPostsClient
 
-    logger = get_logger(__name__)
+    if error := _check_post_urn(target_urn, allow_comment=True):
+        return error
+
     ctx = get_context()
 
     if not ctx.has_official_client:
@@ -1948,10 +2224,9 @@ async def create_reaction(
         }
 
     try:
-        posts_client = LinkedInPostsClient(
-            access_token=ctx.official_client._access_token,
-        )
-        result = posts_client.create_reaction(
+        posts_client = get_posts_client(ctx.official_client._access_token)
+        result = await asyncio.to_thread(
+            posts_client.create_reaction,
             target_urn=target_urn,
             reaction_type=reaction_type,
         )
@@ -1962,13 +2237,14 @@ async def create_reaction(
                 reaction_type=result.get("reaction_type"),
                 target_urn=target_urn,
             )
-            return {"success": True, "reaction": result, "source": "official_api"}
+            await _invalidate_post_engagement(target_urn)
+            return _ok(reaction=result, source="official_api")
         else:
             return {"success": False, "error": result.get("error", "Unknown error")}
 
     except Exception as e:
         logger.error("Failed to create reaction", error=str(e), target_urn=target_urn)
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -1988,11 +2264,10 @@ async def delete_reaction(
 
     Note: This removes your reaction from the specified content.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.linkedin.posts_client import LinkedInPostsClient
 
-    logger = get_logger(__name__)
+    if error := _check_post_urn(target_urn, allow_comment=True):
+        return error
+
     ctx = get_context()
 
     if not ctx.has_official_client:
@@ -2002,20 +2277,41 @@ async def delete_reaction(
         }
 
     try:
-        posts_client = LinkedInPostsClient(
-            access_token=ctx.official_client._access_token,
-        )
-        result = posts_client.delete_reaction(target_urn=target_urn)
+        posts_client = get_posts_client(ctx.official_client._access_token)
+        result = await asyncio.to_thread(posts_client.delete_reaction, target_urn=target_urn)
 
         if result and result.get("success"):
             logger.info("Deleted reaction", target_urn=target_urn)
-            return {"success": True, "result": result, "source": "official_api"}
+            await _invalidate_post_engagement(target_urn)
+            return _ok(result=result, source="official_api")
         else:
             return {"success": False, "error": result.get("error", "Unknown error")}
 
     except Exception as e:
         logger.error("Failed to delete reaction", error=str(e), target_urn=target_urn)
-        return {"error": str(e)}
+        return _err(e)
+
+
+# Official API features unlocked by each OAuth scope, in display order
+_SCOPE_FEATURES: dict[str, tuple[str, ...]] = {
+    "w_member_social": (
+        "create_post",
+        "create_image_post",
+        "create_video_post",
+        "create_document_post",
+        "create_poll",
+        "delete_post",
+    ),
+    "profile": ("get_my_profile",),
+    "openid": ("get_my_profile",),
+}
+
+# Auth status is polled by agents on most turns; storage reads hit the keychain.
+# Re-authentication happens in the linkedin-mcp-auth CLI, a separate process,
+# so the short TTL is what bounds how long a stale status can be served.
+_AUTH_STATUS_TTL = 5.0
+_auth_status_cache: tuple[float, dict] | None = None
+_auth_status_lock = asyncio.Lock()
 
 
 @mcp.tool()
@@ -2028,9 +2324,19 @@ async def get_auth_status() -> dict:
     - Unofficial API status (cookie freshness, available features)
     - Recommended actions if not authenticated
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.services.storage.token_storage import get_official_token, get_unofficial_cookies
+    global _auth_status_cache
+
+    async with _auth_status_lock:
+        if _auth_status_cache and time.monotonic() - _auth_status_cache[0] < _AUTH_STATUS_TTL:
+            return _auth_status_cache[1]
+
+        result = await _build_auth_status()
+        _auth_status_cache = (time.monotonic(), result)
+        return result
+
 
+async def _build_auth_status() -> dict:
+    """Assemble the get_auth_status response from context and token storage."""
     ctx = get_context()
 
     result = {
@@ -2054,7 +2360,7 @@ async def get_auth_status() -> dict:
     }
 
     # Check official API
-    official_token = get_official_token()
+    official_token = await asyncio.to_thread(get_official_token)
     if official_token:
         if official_token.is_expired:
             result["official_api"]["status"] = "expired"
@@ -2069,10 +2375,12 @@ async def get_auth_status() -> dict:
             result["official_api"]["scopes"] = official_token.scopes
 
         # List available features based on scopes
-        if "w_member_social" in official_token.scopes:
-            result["official_api"]["features"].extend(["create_post", "create_image_post", "create_video_post", "create_document_post", "create_poll", "delete_post"])
-        if "profile" in official_token.scopes or "openid" in official_token.scopes:
-            result["official_api"]["features"].append("get_my_profile")
+        result["official_api"]["features"] = list(dict.fromkeys(
+            feature
+            for scope, features in _SCOPE_FEATURES.items()
+            if scope in official_token.scopes
+            for feature in features
+        ))
     else:
         result["recommendations"].append("Run 'linkedin-mcp-auth oauth' to enable official API features")
 
@@ -2090,7 +2398,7 @@ async def get_auth_status() -> dict:
         result["ad_library_api"]["status"] = "requires_oauth"
 
     # Check unofficial API
-    cookies = get_unofficial_cookies()
+    cookies = await asyncio.to_thread(get_unofficial_cookies)
     if cookies:
         if cookies.is_stale:
             result["unofficial_api"]["status"] = "stale"
@@ -2144,15 +2452,12 @@ async def search_ads(
         - Ad content (text, images, videos)
         - Impression data and targeting parameters
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
-    ctx = get_context()
 
     if not keyword and not advertiser:
         return {"error": "At least one of 'keyword' or 'advertiser' must be provided"}
 
+    ctx = get_context()
+
     if not ctx.has_ad_library_client:
         return {
             "error": "Ad Library API not available. Requires OAuth authentication and Ad Library product enabled.",
@@ -2180,7 +2485,7 @@ async def search_ads(
 
     except Exception as e:
         logger.error("Ad Library search failed", error=str(e))
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -2202,10 +2507,7 @@ async def search_ads_by_advertiser(
     Returns:
         List of ads from the specified advertiser with full details.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
 
-    logger = get_logger(__name__)
     ctx = get_context()
 
     if not ctx.has_ad_library_client:
@@ -2233,7 +2535,7 @@ async def search_ads_by_advertiser(
 
     except Exception as e:
         logger.error("Advertiser ad search failed", error=str(e))
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -2255,10 +2557,7 @@ async def search_ads_by_keyword(
     Returns:
         List of ads matching the keyword with full details.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
 
-    logger = get_logger(__name__)
     ctx = get_context()
 
     if not ctx.has_ad_library_client:
@@ -2286,7 +2585,7 @@ async def search_ads_by_keyword(
 
     except Exception as e:
         logger.error("Keyword ad search failed", error=str(e))
-        return {"error": str(e)}
+        return _err(e)
 
 
 # =============================================================================
@@ -2305,8 +2604,6 @@ async def analyze_draft_content(content: str, industry: str | None = None) -> di
 
     Returns content analysis with score, suggestions, and recommended hashtags.
     """
-    from linkedin_mcp.services.scheduler import get_suggestion_engine
-
     engine = get_suggestion_engine()
 
     analysis = engine.analyze_content(content)
@@ -2314,7 +2611,7 @@ async def analyze_draft_content(content: str, industry: str | None = None) -> di
 
     analysis["suggested_hashtags"] = suggested_hashtags
 
-    return {"success": True, "analysis": analysis}
+    return _ok(analysis=analysis)
 
 
 @mcp.tool()
@@ -2333,7 +2630,6 @@ async def create_draft(
 
     Returns the created draft details.
     """
-    from linkedin_mcp.services.scheduler import get_draft_manager
 
     manager = get_draft_manager()
 
@@ -2341,7 +2637,7 @@ async def create_draft(
 
     draft = manager.create_draft(content=content, title=title, tags=tag_list)
 
-    return {"success": True, "draft": draft}
+    return _ok(draft=draft)
 
 
 @mcp.tool()
@@ -2354,13 +2650,12 @@ async def list_drafts(tag: str | None = None) -> dict:
 
     Returns list of drafts sorted by last update.
     """
-    from linkedin_mcp.services.scheduler import get_draft_manager
 
     manager = get_draft_manager()
 
     drafts = manager.list_drafts(tag=tag)
 
-    return {"success": True, "drafts": drafts, "count": len(drafts)}
+    return _ok(drafts=drafts, count=len(drafts))
 
 
 @mcp.tool()
@@ -2373,7 +2668,6 @@ async def get_draft(draft_id: str) -> dict:
 
     Returns the draft details.
     """
-    from linkedin_mcp.services.scheduler import get_draft_manager
 
     manager = get_draft_manager()
 
@@ -2382,7 +2676,7 @@ async def get_draft(draft_id: str) -> dict:
     if not draft:
         return {"error": f"Draft not found: {draft_id}"}
 
-    return {"success": True, "draft": draft}
+    return _ok(draft=draft)
 
 
 @mcp.tool()
@@ -2403,7 +2697,6 @@ async def update_draft(
 
     Returns the updated draft.
     """
-    from linkedin_mcp.services.scheduler import get_draft_manager
 
     manager = get_draft_manager()
 
@@ -2419,7 +2712,7 @@ async def update_draft(
     if not draft:
         return {"error": f"Draft not found: {draft_id}"}
 
-    return {"success": True, "draft": draft}
+    return _ok(draft=draft)
 
 
 @mcp.tool()
@@ -2432,18 +2725,18 @@ async def delete_draft(draft_id: str) -> dict:
 
     Returns success status.
     """
-    from linkedin_mcp.services.scheduler import get_draft_manager
 
     manager = get_draft_manager()
 
     if manager.delete_draft(draft_id):
-        return {"success": True, "message": f"Draft {draft_id} deleted"}
+        return _ok(message=f"Draft {draft_id} deleted")
 
     return {"error": f"Draft not found: {draft_id}"}
 
 
 @mcp.tool()
-async def publish_draft(draft_id: str, visibility: str = "PUBLIC") -> dict:
+@requires_client
+async def publish_draft(client: LinkedInClient, draft_id: str, visibility: str = "PUBLIC") -> dict:
     """
     Publish a draft as a LinkedIn post.
 
@@ -2453,44 +2746,34 @@ async def publish_draft(draft_id: str, visibility: str = "PUBLIC") -> dict:
 
     Returns the published post details.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.scheduler import get_draft_manager
 
-    logger = get_logger(__name__)
-    ctx = get_context()
     manager = get_draft_manager()
 
-    if not ctx.linkedin_client:
-        return {"error": "LinkedIn client not initialized"}
-
-    draft = manager.get_draft(draft_id)
-    if not draft:
-        return {"error": f"Draft not found: {draft_id}"}
+    # Claim the draft first so a concurrent call cannot publish it twice
+    content = manager.pop_draft_for_publish(draft_id)
+    if content is None:
+        return {"error": f"Draft not found or already published: {draft_id}"}
 
     try:
-        result = await ctx.linkedin_client.create_post(
-            draft["content"],
+        result = await client.create_post(
+            content,
             visibility=visibility,
         )
+        await _invalidate_post_lists()
 
-        # Mark draft as published
-        draft["status"] = "published"
-        draft["published_at"] = result.get("created", "")
-
-        return {
-            "success": True,
-            "draft_id": draft_id,
-            "post": result,
-        }
+        return _ok(
+            draft_id=draft_id,
+            post=result,
+        )
     except Exception as e:
+        manager.reopen_draft(draft_id)
         logger.error("Failed to publish draft", error=str(e), draft_id=draft_id)
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
 async def schedule_post(
-    content: str,
+    content: _PostText,
     scheduled_time: str,
     visibility: str = "PUBLIC",
     timezone: str = "UTC",
@@ -2506,31 +2789,25 @@ async def schedule_post(
 
     Returns the scheduled post details with job_id.
     """
-    from datetime import datetime
 
-    from linkedin_mcp.config.constants import MAX_POST_LENGTH
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.scheduler import get_post_manager
-
-    logger = get_logger(__name__)
     manager = get_post_manager()
 
     # Validate content length
-    if len(content) > MAX_POST_LENGTH:
-        return {"error": f"Post exceeds maximum length of {MAX_POST_LENGTH} characters"}
+    if error := _validate_post_length(content):
+        return error
 
     # Validate visibility
-    if visibility not in ("PUBLIC", "CONNECTIONS", "LOGGED_IN"):
+    if visibility not in _VALID_SCHEDULE_VIS:
         return {"error": "Invalid visibility. Must be PUBLIC, CONNECTIONS, or LOGGED_IN"}
 
     # Parse scheduled time
     try:
-        scheduled_dt = datetime.fromisoformat(scheduled_time.replace("Z", "+00:00"))
+        scheduled_dt = datetime.fromisoformat(scheduled_time)
     except ValueError as e:
         return {"error": f"Invalid datetime format: {e}"}
 
-    # Check if time is in the future
-    if scheduled_dt <= datetime.now():
+    # Check if time is in the future (compare in the input's own timezone, if any)
+    if scheduled_dt <= datetime.now(scheduled_dt.tzinfo):
         return {"error": "Scheduled time must be in the future"}
 
     post = manager.schedule_post(
@@ -2542,7 +2819,7 @@ async def schedule_post(
 
     logger.info("Post scheduled", job_id=post["job_id"])
 
-    return {"success": True, "scheduled_post": post}
+    return _ok(scheduled_post=post)
 
 
 @mcp.tool()
@@ -2555,13 +2832,12 @@ async def list_scheduled_posts(status: str | None = None) -> dict:
 
     Returns list of scheduled posts.
     """
-    from linkedin_mcp.services.scheduler import get_post_manager
 
     manager = get_post_manager()
 
     posts = manager.list_scheduled_posts(status=status)
 
-    return {"success": True, "scheduled_posts": posts, "count": len(posts)}
+    return _ok(scheduled_posts=posts, count=len(posts))
 
 
 @mcp.tool()
@@ -2574,7 +2850,6 @@ async def get_scheduled_post(job_id: str) -> dict:
 
     Returns the scheduled post details.
     """
-    from linkedin_mcp.services.scheduler import get_post_manager
 
     manager = get_post_manager()
 
@@ -2583,7 +2858,7 @@ async def get_scheduled_post(job_id: str) -> dict:
     if not post:
         return {"error": f"Scheduled post not found: {job_id}"}
 
-    return {"success": True, "scheduled_post": post}
+    return _ok(scheduled_post=post)
 
 
 @mcp.tool()
@@ -2596,12 +2871,11 @@ async def cancel_scheduled_post(job_id: str) -> dict:
 
     Returns success status.
     """
-    from linkedin_mcp.services.scheduler import get_post_manager
 
     manager = get_post_manager()
 
     if manager.cancel_scheduled_post(job_id):
-        return {"success": True, "message": f"Scheduled post {job_id} cancelled"}
+        return _ok(message=f"Scheduled post {job_id} cancelled")
 
     return {"error": f"Cannot cancel post: {job_id}. Post may not exist or is not pending."}
 
@@ -2624,9 +2898,6 @@ async def update_scheduled_post(
 
     Returns the updated scheduled post.
     """
-    from datetime import datetime
-
-    from linkedin_mcp.services.scheduler import get_post_manager
 
     manager = get_post_manager()
 
@@ -2634,7 +2905,7 @@ async def update_scheduled_post(
     scheduled_dt = None
     if scheduled_time:
         try:
-            scheduled_dt = datetime.fromisoformat(scheduled_time.replace("Z", "+00:00"))
+            scheduled_dt = datetime.fromisoformat(scheduled_time)
         except ValueError as e:
             return {"error": f"Invalid datetime format: {e}"}
 
@@ -2648,50 +2919,89 @@ async def update_scheduled_post(
     if not post:
         return {"error": f"Cannot update post: {job_id}. Post may not exist or is not pending."}
 
-    return {"success": True, "scheduled_post": post}
+    return _ok(scheduled_post=post)
 
 
 # =============================================================================
 # Engagement Tools
 # =============================================================================
 
+# Analytics tools re-read the same post and profile data within seconds of each
+# other, so data_provider results are cached briefly at the tool layer.
 
-@mcp.tool()
-async def get_post_reactions(post_urn: str) -> dict:
-    """
-    Get reactions/likes on a specific post.
 
-    Args:
-        post_urn: LinkedIn post URN (e.g., "urn:li:activity:123456789")
+async def _provider_post_reactions(provider: Any, post_urn: str) -> dict:
+    """data_provider.get_post_reactions, cached for TTL_ANALYTICS."""
+    result, _ = await get_cache().get_or_fetch(
+        f"provider:reactions:{post_urn}",
+        lambda: provider.get_post_reactions(post_urn),
+        CacheService.TTL_ANALYTICS,
+    )
+    return result
 
-    Returns list of users who reacted and reaction types.
+
+async def _provider_post_comments(provider: Any, post_urn: str, limit: int = 50) -> dict:
+    """data_provider.get_post_comments, cached for TTL_ANALYTICS per limit bucket."""
+    bucket = _limit_bucket(limit)
+    result, _ = await get_cache().get_or_fetch(
+        f"provider:comments:{post_urn}:{bucket}",
+        lambda: provider.get_post_comments(post_urn, limit=bucket),
+        CacheService.TTL_ANALYTICS,
+    )
+    return result
+
+
+def _first(items: Any, limit: int) -> Any:
+    """Trim a bucket-sized provider list to ``limit``; other payload shapes pass through."""
+    return items[:limit] if isinstance(items, list) else items
+
+
+async def _provider_profile_posts(provider: Any, profile_id: str, limit: int) -> dict:
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
+    data_provider.get_profile_posts, cached for TTL_ANALYTICS.
+
+    One entry per profile holds the widest fetch so far; smaller limits are
+    served by slicing it.
+    """
+    cache = get_cache()
+    cache_key = f"provider:posts:{profile_id}"
+    cached = await cache.get(cache_key)
+    if cached is not None and cached["limit"] >= limit:
+        result = cached["result"]
+        for key in ("posts", "data"):
+            if isinstance(result.get(key), list):
+                return {**result, key: result[key][:limit]}
+        return result
+
+    result = await provider.get_profile_posts(profile_id, limit=limit)
+    await cache.set(cache_key, {"limit": limit, "result": result}, CacheService.TTL_ANALYTICS)
+    return result
+
+
+async def _get_post_reactions(post_urn: str) -> dict:
+    """Get reactions/likes on a specific post."""
+    if error := _check_post_urn(post_urn):
+        return error
 
-    logger = get_logger(__name__)
     ctx = get_context()
 
     try:
         # Use data_provider with full fallback chain (PND → Fresh Data → Enhanced → Headless → Primary)
         if ctx.data_provider:
-            result = await ctx.data_provider.get_post_reactions(post_urn)
+            result = await _provider_post_reactions(ctx.data_provider, post_urn)
             reactions = result.get("reactions", result.get("data", []))
             source = result.get("source", "data_provider")
-            return {
-                "success": True,
-                "reactions": reactions,
-                "count": len(reactions),
-                "summary": result.get("summary", {}),
-                "source": source,
-            }
+            return _ok(
+                reactions=reactions,
+                count=len(reactions),
+                summary=result.get("summary", {}),
+                source=source,
+            )
 
         # Fall back to linkedin_client or headless browser
         client = ctx.linkedin_client
         if not client:
             try:
-                from linkedin_mcp.services.linkedin.client import LinkedInClient
-
                 client = LinkedInClient()
                 await client.initialize()
             except Exception:
@@ -2701,53 +3011,52 @@ async def get_post_reactions(post_urn: str) -> dict:
                 }
 
         reactions = await client.get_post_reactions(post_urn)
-        return {
-            "success": True,
-            "reactions": reactions,
-            "count": len(reactions),
-            "source": "linkedin_client",
-        }
+        return _ok(
+            reactions=reactions,
+            count=len(reactions),
+            source="linkedin_client",
+        )
     except Exception as e:
         logger.error("Failed to fetch reactions", error=str(e), post_urn=post_urn)
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
-async def get_post_comments(post_urn: str, limit: int = 50) -> dict:
+async def get_post_reactions(post_urn: str) -> dict:
     """
-    Get comments on a specific post.
+    Get reactions/likes on a specific post.
 
     Args:
-        post_urn: LinkedIn post URN
-        limit: Maximum comments to return (default: 50)
+        post_urn: LinkedIn post URN (e.g., "urn:li:activity:123456789")
 
-    Returns list of comments with author info.
+    Returns list of users who reacted and reaction types.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
+    return await _get_post_reactions(post_urn)
+
+
+async def _get_post_comments(post_urn: str, limit: int = 50) -> dict:
+    """Get comments on a specific post."""
+    if error := _check_post_urn(post_urn):
+        return error
 
-    logger = get_logger(__name__)
     ctx = get_context()
 
     try:
         # Use data_provider with full fallback chain (PND → Fresh Data → Enhanced → Headless → Primary)
         if ctx.data_provider:
-            result = await ctx.data_provider.get_post_comments(post_urn, limit=limit)
-            comments = result.get("comments", result.get("data", []))
+            result = await _provider_post_comments(ctx.data_provider, post_urn, limit)
+            comments = _first(result.get("comments", result.get("data", [])), limit)
             source = result.get("source", "data_provider")
-            return {
-                "success": True,
-                "comments": comments,
-                "count": len(comments),
-                "source": source,
-            }
+            return _ok(
+                comments=comments,
+                count=len(comments),
+                source=source,
+            )
 
         # Fall back to linkedin_client or headless browser
         client = ctx.linkedin_client
         if not client:
             try:
-                from linkedin_mcp.services.linkedin.client import LinkedInClient
-
                 client = LinkedInClient()
                 await client.initialize()
             except Exception:
@@ -2757,15 +3066,103 @@ async def get_post_comments(post_urn: str, limit: int = 50) -> dict:
                 }
 
         comments = await client.get_post_comments(post_urn, limit=limit)
-        return {
-            "success": True,
-            "comments": comments,
-            "count": len(comments),
-            "source": "linkedin_client",
-        }
+        return _ok(
+            comments=comments,
+            count=len(comments),
+            source="linkedin_client",
+        )
     except Exception as e:
         logger.error("Failed to fetch comments", error=str(e), post_urn=post_urn)
-        return {"error": str(e)}
+        return _err(e)
+
+
+@mcp.tool()
+async def get_post_comments(post_urn: str, limit: int = 50) -> dict:
+    """
+    Get comments on a specific post.
+
+    Args:
+        post_urn: LinkedIn post URN
+        limit: Maximum comments to return (default: 50)
+
+    Returns list of comments with author info.
+    """
+    return await _get_post_comments(post_urn, limit)
+
+
+async def _get_post_engagement(post_urn: str, limit: int = 50) -> dict:
+    """Get reactions and comments on a specific post in one call."""
+    if error := _check_post_urn(post_urn):
+        return error
+
+    ctx = get_context()
+    reactions_call: Awaitable[Any]
+    comments_call: Awaitable[Any]
+    reactions_result: Any
+    comments_result: Any
+
+    try:
+        # Use data_provider with full fallback chain (PND → Fresh Data → Enhanced → Headless → Primary)
+        if ctx.data_provider:
+            # Share cached provider results with get_post_reactions/get_post_comments
+            reactions_call = _provider_post_reactions(ctx.data_provider, post_urn)
+            comments_call = _provider_post_comments(ctx.data_provider, post_urn, limit)
+        else:
+            source = ctx.linkedin_client
+            if not source:
+                try:
+                    source = LinkedInClient()
+                    await source.initialize()
+                except Exception:
+                    return {
+                        "error": "No LinkedIn data provider available. Configure API credentials.",
+                        "suggestion": "Ensure playwright is installed for headless browser fallback.",
+                    }
+            reactions_call = source.get_post_reactions(post_urn)
+            comments_call = source.get_post_comments(post_urn, limit=limit)
+
+        reactions_result, comments_result = await asyncio.gather(
+            reactions_call, comments_call, return_exceptions=True
+        )
+    except Exception as e:
+        logger.error("Failed to fetch engagement", error=str(e), post_urn=post_urn)
+        return _err(e)
+
+    fields: dict[str, Any] = {}
+    for name, result in (("reactions", reactions_result), ("comments", comments_result)):
+        if isinstance(result, BaseException):
+            logger.error("Failed to fetch engagement", part=name, error=str(result), post_urn=post_urn)
+            fields[name] = []
+            fields[f"{name}_error"] = str(result)
+        elif isinstance(result, dict):
+            # data_provider responses wrap the list alongside source metadata
+            fields[name] = result.get(name, result.get("data", []))
+            if name == "comments":
+                fields[name] = _first(fields[name], limit)
+        else:
+            fields[name] = result
+        fields[f"{name[:-1]}_count"] = len(fields[name])
+
+    if "reactions_error" in fields and "comments_error" in fields:
+        return {"error": fields["reactions_error"]}
+    return _ok(**fields)
+
+
+@mcp.tool()
+async def get_post_engagement(post_urn: str, limit: int = 50) -> dict:
+    """
+    Get reactions and comments on a specific post in one call.
+
+    Both are fetched concurrently; if one fails the other is still returned
+    alongside an error entry for the failed half.
+
+    Args:
+        post_urn: LinkedIn post URN (e.g., "urn:li:activity:123456789")
+        limit: Maximum comments to return (default: 50)
+
+    Returns reactions, comments, and their counts.
+    """
+    return await _get_post_engagement(post_urn, limit)
 
 
 # =============================================================================
@@ -2809,13 +3206,23 @@ async def search_people(
     1. Fresh Data API (requires Pro plan $45/mo for search-leads endpoint)
     2. linkedin-api (cookie-based, may be blocked by LinkedIn bot detection)
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
 
-    logger = get_logger(__name__)
     ctx = get_context()
+    cache = get_cache()
 
     limit = min(limit, 50)  # Cap at 50
+
+    cache_key = cache.digest_key(
+        "search_people",
+        keywords or "",
+        str(limit),
+        keyword_title or "",
+        keyword_company or "",
+    )
+    cached_result = await cache.get(cache_key)
+    if cached_result:
+        return {**cached_result, "cached": True}
+
     sources_tried = []
     errors_encountered = []
 
@@ -2843,12 +3250,14 @@ async def search_people(
             source = result.get("source", "unknown")
             data = result.get("data", [])
             logger.info("Search completed via data_provider", source=source, count=len(data))
-            return {
+            response = {
                 "success": True,
                 "results": data,
                 "count": len(data),
                 "source": source,
             }
+            await cache.set(cache_key, response, CacheService.TTL_SEARCH)
+            return response
         except PermissionError as e:
             # Fresh Data API subscription limitation (Basic plan doesn't have search)
             sources_tried.append("fresh_data_api")
@@ -2873,13 +3282,15 @@ async def search_people(
                 keyword_company=keyword_company,
             )
             logger.info("Search completed via linkedin_client", count=len(results))
-            return {
+            response = {
                 "success": True,
                 "results": results,
                 "count": len(results),
                 "source": "linkedin_api",
                 "note": "Using cookie-based linkedin-api. Results may be limited if LinkedIn detects bot activity.",
             }
+            await cache.set(cache_key, response, CacheService.TTL_SEARCH)
+            return response
         except Exception as e:
             sources_tried.append("linkedin_api")
             errors_encountered.append(f"linkedin-api: {str(e)}")
@@ -2888,8 +3299,6 @@ async def search_people(
     # Fall back to headless browser as last resort
     if not client:
         try:
-            from linkedin_mcp.services.linkedin.client import LinkedInClient
-
             client = LinkedInClient()
             await client.initialize()
         except Exception:
@@ -2905,18 +3314,19 @@ async def search_people(
                 search_query = f"{search_query} {keyword_company}".strip()
             results = await client.search_people_headless(keywords=search_query, limit=limit)
             logger.info("Search completed via headless browser", count=len(results))
-            return {
+            response = {
                 "success": True,
                 "results": results,
                 "count": len(results),
                 "source": "headless_browser",
             }
+            await cache.set(cache_key, response, CacheService.TTL_SEARCH)
+            return response
         except Exception as e:
             sources_tried.append("headless_browser")
             errors_encountered.append(f"headless_browser: {str(e)}")
             logger.error("Headless browser people search failed", error=str(e))
 
-    from linkedin_mcp.core.exceptions import format_error_response
     logger.error(
         "All search sources failed",
         sources_tried=sources_tried,
@@ -2949,10 +3359,7 @@ async def search_companies(keywords: str, limit: int = 10) -> dict:
     1. Fresh Data API (requires Pro plan $45/mo for search-companies endpoint)
     2. linkedin-api (cookie-based, may be blocked by LinkedIn bot detection)
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
 
-    logger = get_logger(__name__)
     ctx = get_context()
 
     limit = min(limit, 50)  # Cap at 50
@@ -2969,12 +3376,11 @@ async def search_companies(keywords: str, limit: int = 10) -> dict:
             source = result.get("source", "unknown")
             data = result.get("data", [])
             logger.info("Company search completed via data_provider", source=source, count=len(data))
-            return {
-                "success": True,
-                "results": data,
-                "count": len(data),
-                "source": source,
-            }
+            return _ok(
+                results=data,
+                count=len(data),
+                source=source,
+            )
         except PermissionError as e:
             sources_tried.append("fresh_data_api")
             errors_encountered.append(f"Fresh Data API: {str(e)}")
@@ -2993,13 +3399,12 @@ async def search_companies(keywords: str, limit: int = 10) -> dict:
             logger.debug("Trying linkedin_client.search_companies (cookie-based)")
             results = await client.search_companies(keywords=keywords, limit=limit)
             logger.info("Company search completed via linkedin_client", count=len(results))
-            return {
-                "success": True,
-                "results": results,
-                "count": len(results),
-                "source": "linkedin_api",
-                "note": "Using cookie-based linkedin-api. Results may be limited if LinkedIn detects bot activity.",
-            }
+            return _ok(
+                results=results,
+                count=len(results),
+                source="linkedin_api",
+                note="Using cookie-based linkedin-api. Results may be limited if LinkedIn detects bot activity.",
+            )
         except Exception as e:
             sources_tried.append("linkedin_api")
             errors_encountered.append(f"linkedin-api: {str(e)}")
@@ -3008,8 +3413,6 @@ async def search_companies(keywords: str, limit: int = 10) -> dict:
     # Fall back to headless browser as last resort
     if not client:
         try:
-            from linkedin_mcp.services.linkedin.client import LinkedInClient
-
             client = LinkedInClient()
             await client.initialize()
         except Exception:
@@ -3020,12 +3423,11 @@ async def search_companies(keywords: str, limit: int = 10) -> dict:
             logger.debug("Trying headless browser company search")
             results = await client.search_companies_headless(keywords=keywords, limit=limit)
             logger.info("Company search completed via headless browser", count=len(results))
-            return {
-                "success": True,
-                "results": results,
-                "count": len(results),
-                "source": "headless_browser",
-            }
+            return _ok(
+                results=results,
+                count=len(results),
+                source="headless_browser",
+            )
         except Exception as e:
             sources_tried.append("headless_browser")
             errors_encountered.append(f"headless_browser: {str(e)}")
@@ -3069,20 +3471,16 @@ async def search_content(
 
     Returns posts with author info, engagement metrics, and content preview.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
 
-    logger = get_logger(__name__)
     ctx = get_context()
 
     limit = min(limit, 50)
 
     # Validate date_posted filter
-    valid_date_filters = {"past-24h", "past-week", "past-month", ""}
-    if date_posted not in valid_date_filters:
+    if date_posted not in _VALID_DATE_FILTERS:
         return {
             "error": f"Invalid date_posted value: '{date_posted}'",
-            "valid_values": sorted(valid_date_filters - {""}),
+            "valid_values": list(_DATE_FILTER_VALUES),
             "suggestion": "Use 'past-24h', 'past-week', 'past-month', or '' for any time.",
         }
 
@@ -3090,8 +3488,6 @@ async def search_content(
     client = ctx.linkedin_client
     if not client:
         try:
-            from linkedin_mcp.services.linkedin.client import LinkedInClient
-
             client = LinkedInClient()
             await client.initialize()
         except Exception:
@@ -3106,17 +3502,16 @@ async def search_content(
             date_posted=date_posted,
             limit=limit,
         )
-        return {
-            "success": True,
-            "results": results,
-            "count": len(results),
-            "keywords": keywords,
-            "date_filter": date_posted or "any",
-            "source": "headless_browser",
-        }
+        return _ok(
+            results=results,
+            count=len(results),
+            keywords=keywords,
+            date_filter=date_posted or "any",
+            source="headless_browser",
+        )
     except Exception as e:
         logger.error("Content search failed", error=str(e), keywords=keywords)
-        return {"error": str(e)}
+        return _err(e)
 
 
 # =============================================================================
@@ -3152,11 +3547,6 @@ async def search_jobs(
 
     WARNING: Uses unofficial API. May trigger LinkedIn bot detection with heavy use.
     """
-    from linkedin_mcp.config.settings import get_settings
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
     ctx = get_context()
     settings = get_settings()
 
@@ -3170,8 +3560,6 @@ async def search_jobs(
     client = ctx.linkedin_client
     if not client:
         try:
-            from linkedin_mcp.services.linkedin.client import LinkedInClient
-
             client = LinkedInClient()
             await client.initialize()
         except Exception:
@@ -3199,16 +3587,13 @@ async def search_jobs(
             limit=limit,
         )
 
-        return {
-            "success": True,
-            "jobs": results,
-            "count": len(results) if results else 0,
-            "source": "linkedin_api",
-            "note": "Uses unofficial API. Results may be limited by LinkedIn bot detection.",
-        }
+        return _ok(
+            jobs=results,
+            count=len(results) if results else 0,
+            source="linkedin_api",
+            note="Uses unofficial API. Results may be limited by LinkedIn bot detection.",
+        )
     except Exception as e:
-        from linkedin_mcp.core.exceptions import format_error_response
-
         logger.error("Job search failed", error=str(e), keywords=keywords)
         return format_error_response(e)
 
@@ -3225,11 +3610,6 @@ async def get_job(job_id: str) -> dict:
 
     WARNING: Uses unofficial API.
     """
-    from linkedin_mcp.config.settings import get_settings
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
     ctx = get_context()
     settings = get_settings()
 
@@ -3241,10 +3621,8 @@ async def get_job(job_id: str) -> dict:
 
     try:
         job = await ctx.linkedin_client.get_job(job_id)
-        return {"success": True, "job": job, "source": "linkedin_api"}
+        return _ok(job=job, source="linkedin_api")
     except Exception as e:
-        from linkedin_mcp.core.exceptions import format_error_response
-
         logger.error("Failed to fetch job", error=str(e), job_id=job_id)
         return format_error_response(e)
 
@@ -3261,11 +3639,6 @@ async def get_job_skills(job_id: str) -> dict:
 
     WARNING: Uses unofficial API.
     """
-    from linkedin_mcp.config.settings import get_settings
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
     ctx = get_context()
     settings = get_settings()
 
@@ -3277,16 +3650,15 @@ async def get_job_skills(job_id: str) -> dict:
 
     try:
         skills = await ctx.linkedin_client.get_job_skills(job_id)
-        return {"success": True, "skills": skills, "source": "linkedin_api"}
+        return _ok(skills=skills, source="linkedin_api")
     except Exception as e:
-        from linkedin_mcp.core.exceptions import format_error_response
-
         logger.error("Failed to fetch job skills", error=str(e), job_id=job_id)
         return format_error_response(e)
 
 
 @mcp.tool()
-async def get_profile_views() -> dict:
+@requires_client
+async def get_profile_views(client: LinkedInClient) -> dict:
     """
     Get profile view statistics for the authenticated user.
 
@@ -3295,21 +3667,11 @@ async def get_profile_views() -> dict:
 
     WARNING: Uses unofficial API.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
-    ctx = get_context()
-
-    if not ctx.linkedin_client:
-        return {"error": "LinkedIn client not available"}
 
     try:
-        views = await ctx.linkedin_client.get_current_profile_views()
-        return {"success": True, "profile_views": views, "source": "linkedin_api"}
+        views = await client.get_current_profile_views()
+        return _ok(profile_views=views, source="linkedin_api")
     except Exception as e:
-        from linkedin_mcp.core.exceptions import format_error_response
-
         logger.error("Failed to fetch profile views", error=str(e))
         return format_error_response(e)
 
@@ -3319,6 +3681,11 @@ async def get_profile_views() -> dict:
 # =============================================================================
 
 
+# Inbox listing is cached under one key holding the widest fetch so far;
+# smaller limits are served by slicing it
+_CONVERSATIONS_CACHE_KEY = "conversations"
+
+
 @mcp.tool()
 async def get_conversations(limit: int = 20, search: str | None = None) -> dict:
     """
@@ -3332,11 +3699,6 @@ async def get_conversations(limit: int = 20, search: str | None = None) -> dict:
 
     WARNING: Uses unofficial API. May trigger LinkedIn bot detection.
     """
-    from linkedin_mcp.config.settings import get_settings
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
     ctx = get_context()
     settings = get_settings()
 
@@ -3350,8 +3712,6 @@ async def get_conversations(limit: int = 20, search: str | None = None) -> dict:
     client = ctx.linkedin_client
     if not client:
         try:
-            from linkedin_mcp.services.linkedin.client import LinkedInClient
-
             client = LinkedInClient()
             await client.initialize()
         except Exception:
@@ -3364,18 +3724,25 @@ async def get_conversations(limit: int = 20, search: str | None = None) -> dict:
         if search:
             conversations = await client.search_conversations(search, limit=limit)
         else:
-            conversations = await client.get_conversations(limit=limit)
+            cache = get_cache()
+            cached = await cache.get(_CONVERSATIONS_CACHE_KEY)
+            if cached and cached["limit"] >= limit:
+                conversations = cached["conversations"][:limit]
+            else:
+                conversations = await client.get_conversations(limit=limit)
+                await cache.set(
+                    _CONVERSATIONS_CACHE_KEY,
+                    {"limit": limit, "conversations": conversations},
+                    CacheService.TTL_CONVERSATIONS,
+                )
 
-        return {
-            "success": True,
-            "conversations": conversations,
-            "count": len(conversations),
-            "source": "graphql_messaging_api",
-            "search_query": search,
-        }
+        return _ok(
+            conversations=conversations,
+            count=len(conversations),
+            source="graphql_messaging_api",
+            search_query=search,
+        )
     except Exception as e:
-        from linkedin_mcp.core.exceptions import format_error_response
-
         logger.error("Failed to fetch conversations", error=str(e))
         return format_error_response(e)
 
@@ -3398,11 +3765,6 @@ async def get_conversation(
 
     WARNING: Uses unofficial API.
     """
-    from linkedin_mcp.config.settings import get_settings
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
     ctx = get_context()
     settings = get_settings()
 
@@ -3412,8 +3774,6 @@ async def get_conversation(
     client = ctx.linkedin_client
     if not client:
         try:
-            from linkedin_mcp.services.linkedin.client import LinkedInClient
-
             client = LinkedInClient()
             await client.initialize()
         except Exception:
@@ -3431,8 +3791,6 @@ async def get_conversation(
             "source": "graphql_messaging_api",
         }
     except Exception as e:
-        from linkedin_mcp.core.exceptions import format_error_response
-
         logger.error("Failed to fetch conversation", error=str(e), conversation_id=conversation_id)
         return format_error_response(e)
 
@@ -3451,11 +3809,6 @@ async def get_conversation_details(profile_id: str) -> dict:
 
     WARNING: Uses unofficial API.
     """
-    from linkedin_mcp.config.settings import get_settings
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
     ctx = get_context()
     settings = get_settings()
 
@@ -3467,14 +3820,11 @@ async def get_conversation_details(profile_id: str) -> dict:
 
     try:
         details = await ctx.linkedin_client.get_conversation_details(profile_id)
-        return {
-            "success": True,
-            "conversation_details": details,
-            "source": "linkedin_api",
-        }
+        return _ok(
+            conversation_details=details,
+            source="linkedin_api",
+        )
     except Exception as e:
-        from linkedin_mcp.core.exceptions import format_error_response
-
         logger.error("Failed to fetch conversation details", error=str(e), profile_id=profile_id)
         return format_error_response(e)
 
@@ -3498,12 +3848,6 @@ async def send_message(
     Sending too many messages may result in account restrictions.
     Use responsibly and respect LinkedIn's terms of service.
     """
-    from linkedin_mcp.config.settings import get_settings
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
-    ctx = get_context()
     settings = get_settings()
 
     if not settings.features.messaging_enabled:
@@ -3512,18 +3856,20 @@ async def send_message(
             "suggestion": "Set FEATURE_MESSAGING_ENABLED=true to enable messaging tools",
         }
 
+    # Drop blanks and repeats so each person is looked up and messaged once
+    recipients = list(dict.fromkeys(r.strip() for r in recipients if r.strip()))
     if not recipients:
         return {"error": "At least one recipient is required"}
 
     if not text or not text.strip():
         return {"error": "Message text cannot be empty"}
 
+    ctx = get_context()
+
     # Get or create a client for messaging (uses headless browser transport)
     client = ctx.linkedin_client
     if not client:
         try:
-            from linkedin_mcp.services.linkedin.client import LinkedInClient
-
             client = LinkedInClient()
             await client.initialize()
         except Exception:
@@ -3536,6 +3882,7 @@ async def send_message(
     try:
         result = await client.send_message(recipients, text)
         if result.get("success"):
+            await get_cache().delete(_CONVERSATIONS_CACHE_KEY)
             return {
                 **result,
                 "source": "linkedin_api",
@@ -3546,13 +3893,12 @@ async def send_message(
     # Fallback: headless browser transport
     try:
         result = await client.send_message_headless(text=text, recipients=recipients, image_path=image_path)
+        await get_cache().delete(_CONVERSATIONS_CACHE_KEY)
         return {
             **result,
             "source": "headless_browser",
         }
     except Exception as e:
-        from linkedin_mcp.core.exceptions import format_error_response
-
         logger.error("Failed to send message", error=str(e), recipient_count=len(recipients))
         return format_error_response(e)
 
@@ -3576,12 +3922,6 @@ async def reply_to_conversation(
 
     Returns success status and details.
     """
-    from linkedin_mcp.config.settings import get_settings
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
-    ctx = get_context()
     settings = get_settings()
 
     if not settings.features.messaging_enabled:
@@ -3596,11 +3936,11 @@ async def reply_to_conversation(
     if not text or not text.strip():
         return {"error": "Message text cannot be empty"}
 
+    ctx = get_context()
+
     client = ctx.linkedin_client
     if not client:
         try:
-            from linkedin_mcp.services.linkedin.client import LinkedInClient
-
             client = LinkedInClient()
             await client.initialize()
         except Exception:
@@ -3615,13 +3955,12 @@ async def reply_to_conversation(
             conversation_id=conversation_id,
             image_path=image_path,
         )
+        await get_cache().delete(_CONVERSATIONS_CACHE_KEY)
         return {
             **result,
             "source": "headless_browser",
         }
     except Exception as e:
-        from linkedin_mcp.core.exceptions import format_error_response
-
         logger.error(
             "Failed to reply to conversation",
             error=str(e),
@@ -3642,11 +3981,6 @@ async def mark_conversation_as_seen(conversation_urn: str) -> dict:
 
     WARNING: Uses unofficial API.
     """
-    from linkedin_mcp.config.settings import get_settings
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
     ctx = get_context()
     settings = get_settings()
 
@@ -3658,10 +3992,9 @@ async def mark_conversation_as_seen(conversation_urn: str) -> dict:
 
     try:
         result = await ctx.linkedin_client.mark_conversation_as_seen(conversation_urn)
+        await get_cache().delete(_CONVERSATIONS_CACHE_KEY)
         return {**result, "source": "linkedin_api"}
     except Exception as e:
-        from linkedin_mcp.core.exceptions import format_error_response
-
         logger.error("Failed to mark conversation as seen", error=str(e))
         return format_error_response(e)
 
@@ -3671,6 +4004,25 @@ async def mark_conversation_as_seen(conversation_urn: str) -> dict:
 # =============================================================================
 
 
+# Mutating connection endpoints allow a few calls in flight per endpoint and
+# share a short rate window, so an agent burst is refused locally instead of
+# being answered with 429s by LinkedIn
+_ENDPOINT_LIMITS: defaultdict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(3))
+_CONNECTION_RATE_LIMITER = RateLimiter(max_requests=10, window_seconds=10)
+
+
+@contextlib.asynccontextmanager
+async def _throttled(endpoint: str) -> AsyncIterator[None]:
+    """Hold an endpoint slot and a rate token for the duration of one API call."""
+    async with _ENDPOINT_LIMITS[endpoint]:
+        await _CONNECTION_RATE_LIMITER.acquire()
+        yield
+
+
+# Received invitations share one cache entry holding the widest fetch so far
+_INVITATIONS_CACHE_KEY = "invitations:received"
+
+
 @mcp.tool()
 async def get_invitations(limit: int = 50) -> dict:
     """
@@ -3686,11 +4038,6 @@ async def get_invitations(limit: int = 50) -> dict:
 
     WARNING: Uses unofficial API.
     """
-    from linkedin_mcp.config.settings import get_settings
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
     ctx = get_context()
     settings = get_settings()
 
@@ -3704,18 +4051,25 @@ async def get_invitations(limit: int = 50) -> dict:
         return {"error": "LinkedIn client not available"}
 
     try:
-        invitations = await ctx.linkedin_client.get_pending_invitations(limit=limit)
-        return {
-            "success": True,
-            "invitations": invitations,
-            "count": len(invitations) if invitations else 0,
-            "type": "received",
-            "source": "linkedin_api",
-            "note": "Only received invitations are available. Sent invitations not supported by API.",
-        }
+        cache = get_cache()
+        cached = await cache.get(_INVITATIONS_CACHE_KEY)
+        if cached and cached["limit"] >= limit:
+            invitations = cached["invitations"][:limit]
+        else:
+            invitations = await ctx.linkedin_client.get_pending_invitations(limit=limit) or []
+            await cache.set(
+                _INVITATIONS_CACHE_KEY,
+                {"limit": limit, "invitations": invitations},
+                CacheService.TTL_INVITATIONS,
+            )
+        return _ok(
+            invitations=invitations,
+            count=len(invitations),
+            type="received",
+            source="linkedin_api",
+            note="Only received invitations are available. Sent invitations not supported by API.",
+        )
     except Exception as e:
-        from linkedin_mcp.core.exceptions import format_error_response
-
         logger.error("Failed to fetch invitations", error=str(e))
         return format_error_response(e)
 
@@ -3734,11 +4088,6 @@ async def send_connection_request(profile_id: str, message: str | None = None) -
     WARNING: Uses unofficial API. May trigger LinkedIn bot detection.
     LinkedIn limits connection requests. Use responsibly.
     """
-    from linkedin_mcp.config.settings import get_settings
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
     ctx = get_context()
     settings = get_settings()
 
@@ -3752,15 +4101,14 @@ async def send_connection_request(profile_id: str, message: str | None = None) -
         return {"error": "LinkedIn client not available"}
 
     try:
-        result = await ctx.linkedin_client.send_connection_request(profile_id, message=message)
+        async with _throttled("connection_request"):
+            result = await ctx.linkedin_client.send_connection_request(profile_id, message=message)
         return {
             **result,
             "source": "linkedin_api",
             "warning": "Connection request sent via unofficial API. LinkedIn limits daily connection requests.",
         }
     except Exception as e:
-        from linkedin_mcp.core.exceptions import format_error_response
-
         logger.error("Failed to send connection request", error=str(e), profile_id=profile_id)
         return format_error_response(e)
 
@@ -3779,33 +4127,29 @@ async def reply_invitation(invitation_id: str, shared_secret: str, action: str =
 
     WARNING: Uses unofficial API.
     """
-    from linkedin_mcp.config.settings import get_settings
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
-    ctx = get_context()
     settings = get_settings()
 
     if not settings.features.connections_enabled:
         return {"error": "Connections feature is disabled"}
 
-    if not ctx.linkedin_client:
-        return {"error": "LinkedIn client not available"}
-
     if action not in ("accept", "reject"):
         return {"error": "Action must be 'accept' or 'reject'"}
 
+    ctx = get_context()
+
+    if not ctx.linkedin_client:
+        return {"error": "LinkedIn client not available"}
+
     try:
-        if action == "accept":
-            result = await ctx.linkedin_client.accept_invitation(invitation_id, shared_secret)
-        else:
-            result = await ctx.linkedin_client.reject_invitation(invitation_id, shared_secret)
+        async with _throttled("invitation"):
+            if action == "accept":
+                result = await ctx.linkedin_client.accept_invitation(invitation_id, shared_secret)
+            else:
+                result = await ctx.linkedin_client.reject_invitation(invitation_id, shared_secret)
 
+        await get_cache().delete(_INVITATIONS_CACHE_KEY)
         return {**result, "action": action, "source": "linkedin_api"}
     except Exception as e:
-        from linkedin_mcp.core.exceptions import format_error_response
-
         logger.error("Failed to reply to invitation", error=str(e), action=action)
         return format_error_response(e)
 
@@ -3823,11 +4167,6 @@ async def remove_connection(profile_id: str) -> dict:
     WARNING: This action is IRREVERSIBLE. The person will need to re-request
     connection and you'll need to accept. Uses unofficial API.
     """
-    from linkedin_mcp.config.settings import get_settings
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
     ctx = get_context()
     settings = get_settings()
 
@@ -3838,15 +4177,14 @@ async def remove_connection(profile_id: str) -> dict:
         return {"error": "LinkedIn client not available"}
 
     try:
-        result = await ctx.linkedin_client.remove_connection(profile_id)
+        async with _throttled("remove_connection"):
+            result = await ctx.linkedin_client.remove_connection(profile_id)
         return {
             **result,
             "source": "linkedin_api",
             "warning": "Connection removed. This action is irreversible.",
         }
     except Exception as e:
-        from linkedin_mcp.core.exceptions import format_error_response
-
         logger.error("Failed to remove connection", error=str(e), profile_id=profile_id)
         return format_error_response(e)
 
@@ -3856,28 +4194,24 @@ async def remove_connection(profile_id: str) -> dict:
 # =============================================================================
 
 
-@mcp.tool()
-async def get_company(public_id: str) -> dict:
-    """
-    Get detailed company information.
-
-    Args:
-        public_id: Company's public identifier (URL slug, e.g., 'microsoft')
-
-    Returns company details including description, industry, employee count, etc.
-    """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
+async def _get_company(public_id: str) -> dict:
+    """Get detailed company information."""
     ctx = get_context()
+    cache = get_cache()
+    cache_key = f"company:{public_id}"
+
+    cached = await cache.get(cache_key)
+    if cached:
+        return {**cached, "cached": True}
 
     # Try data provider first (uses marketing API with fallback chain)
     if ctx.has_data_provider:
         try:
             company = await ctx.data_provider.get_organization(vanity_name=public_id)
             if company:
-                return {"success": True, "company": company, "source": "data_provider"}
+                response = _ok(company=company, source="data_provider")
+                await cache.set(cache_key, response, CacheService.TTL_COMPANY)
+                return response
         except Exception as e:
             logger.debug("Data provider failed for company lookup, trying fallback", error=str(e))
 
@@ -3887,13 +4221,27 @@ async def get_company(public_id: str) -> dict:
 
     try:
         company = await ctx.linkedin_client.get_company(public_id)
-        return {"success": True, "company": company, "source": "linkedin_client"}
+        response = _ok(company=company, source="linkedin_client")
+        await cache.set(cache_key, response, CacheService.TTL_COMPANY)
+        return response
     except Exception as e:
-        from linkedin_mcp.core.exceptions import format_error_response
         logger.error("Failed to fetch company", error=str(e), public_id=public_id)
         return format_error_response(e)
 
 
+@mcp.tool()
+async def get_company(public_id: str) -> dict:
+    """
+    Get detailed company information.
+
+    Args:
+        public_id: Company's public identifier (URL slug, e.g., 'microsoft')
+
+    Returns company details including description, industry, employee count, etc.
+    """
+    return await _get_company(public_id)
+
+
 @mcp.tool()
 async def get_company_updates(public_id: str, limit: int = 10) -> dict:
     """
@@ -3905,10 +4253,7 @@ async def get_company_updates(public_id: str, limit: int = 10) -> dict:
 
     Returns list of company posts/updates.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
 
-    logger = get_logger(__name__)
     ctx = get_context()
 
     limit = min(limit, 50)
@@ -3919,17 +4264,16 @@ async def get_company_updates(public_id: str, limit: int = 10) -> dict:
             result = await ctx.data_provider.get_company_posts(public_id, limit=limit)
             updates = result.get("posts", result.get("updates", result.get("data", [])))
             source = result.get("source", "data_provider")
-            return {
-                "success": True,
-                "updates": updates,
-                "count": len(updates),
-                "source": source,
-            }
+            return _ok(
+                updates=updates,
+                count=len(updates),
+                source=source,
+            )
 
         return {"error": "No LinkedIn data provider available. Configure API credentials."}
     except Exception as e:
         logger.error("Failed to fetch company updates", error=str(e), public_id=public_id)
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -3947,10 +4291,7 @@ async def get_organization_followers(organization_id: str) -> dict:
 
     Note: Requires Community Management API access and admin permissions for the organization.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
 
-    logger = get_logger(__name__)
     ctx = get_context()
 
     # This requires the marketing client (Community Management API)
@@ -3958,13 +4299,12 @@ async def get_organization_followers(organization_id: str) -> dict:
         try:
             result = await ctx.data_provider.get_organization_follower_count(organization_id)
             if result:
-                return {
-                    "success": True,
-                    "organization_id": organization_id,
-                    "follower_count": result.get("firstDegreeSize", 0),
-                    "raw_data": result,
-                    "source": "community_management_api",
-                }
+                return _ok(
+                    organization_id=organization_id,
+                    follower_count=result.get("firstDegreeSize", 0),
+                    raw_data=result,
+                    source="community_management_api",
+                )
         except Exception as e:
             logger.warning(
                 "Community Management API failed for follower count",
@@ -3985,6 +4325,23 @@ async def get_organization_followers(organization_id: str) -> dict:
 # Note: get_profile_contact_info and get_profile_skills are defined in Profile Tools section
 
 
+@requires_client
+async def _get_school(client: LinkedInClient, public_id: str) -> dict:
+    """Get school/university information."""
+
+    async def fetch_school() -> dict:
+        return _ok(school=await client.get_school(public_id))
+
+    try:
+        response, hit = await get_cache().get_or_fetch(
+            f"school:{public_id}", fetch_school, CacheService.TTL_COMPANY
+        )
+        return {**response, "cached": True} if hit else response
+    except Exception as e:
+        logger.error("Failed to fetch school", error=str(e), public_id=public_id)
+        return _err(e)
+
+
 @mcp.tool()
 async def get_school(public_id: str) -> dict:
     """
@@ -3995,21 +4352,7 @@ async def get_school(public_id: str) -> dict:
 
     Returns school details including name, description, follower count, etc.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
-    ctx = get_context()
-
-    if not ctx.linkedin_client:
-        return {"error": "LinkedIn client not initialized"}
-
-    try:
-        school = await ctx.linkedin_client.get_school(public_id)
-        return {"success": True, "school": school}
-    except Exception as e:
-        logger.error("Failed to fetch school", error=str(e), public_id=public_id)
-        return {"error": str(e)}
+    return await _get_school(public_id)
 
 
 # =============================================================================
@@ -4018,7 +4361,8 @@ async def get_school(public_id: str) -> dict:
 
 
 @mcp.tool()
-async def get_post_analytics(post_urn: str) -> dict:
+@requires_client
+async def get_post_analytics(client: LinkedInClient, post_urn: str) -> dict:
     """
     Get analytics for a specific post.
 
@@ -4028,83 +4372,57 @@ async def get_post_analytics(post_urn: str) -> dict:
     Returns engagement metrics including reactions, comments, and shares.
     Note: View count requires Partner API access.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
-    ctx = get_context()
 
-    if not ctx.linkedin_client:
-        return {"error": "LinkedIn client not initialized"}
+    if error := _check_post_urn(post_urn):
+        return error
 
     try:
-        # Get reactions
-        reactions = await ctx.linkedin_client.get_post_reactions(post_urn)
-
-        # Get comments
-        comments = await ctx.linkedin_client.get_post_comments(post_urn)
+        # Reactions and comments are independent; fetch them concurrently
+        reactions, comments = await asyncio.gather(
+            client.get_post_reactions(post_urn),
+            client.get_post_comments(post_urn),
+        )
 
         # Categorize reactions
-        reaction_breakdown = {}
-        for reaction in reactions:
-            reaction_type = reaction.get("reactionType", "LIKE")
-            reaction_breakdown[reaction_type] = reaction_breakdown.get(reaction_type, 0) + 1
+        reaction_breakdown = Counter(reaction.get("reactionType", "LIKE") for reaction in reactions)
 
-        return {
-            "success": True,
-            "analytics": {
+        return _ok(
+            analytics={
                 "post_urn": post_urn,
                 "total_reactions": len(reactions),
                 "total_comments": len(comments),
-                "reaction_breakdown": reaction_breakdown,
+                "reaction_breakdown": dict(reaction_breakdown),
                 "note": "View count requires Partner API access",
             },
-        }
+        )
     except Exception as e:
         logger.error("Failed to fetch analytics", error=str(e), post_urn=post_urn)
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
-async def get_rate_limit_status() -> dict:
+@requires_client
+async def get_rate_limit_status(client: LinkedInClient) -> dict:
     """
     Get current rate limit status.
 
     Returns remaining API calls and rate limit information.
     """
-    from linkedin_mcp.core.context import get_context
-
-    ctx = get_context()
-
-    if not ctx.linkedin_client:
-        return {"error": "LinkedIn client not initialized"}
 
-    return {
-        "success": True,
-        "rate_limit": {
-            "remaining": ctx.linkedin_client.rate_limit_remaining,
+    return _ok(
+        rate_limit={
+            "remaining": client.rate_limit_remaining,
             "max_per_hour": 900,
             "note": "Rate limits are advisory. Excessive requests may trigger LinkedIn restrictions.",
         },
-    }
-
-
-@mcp.tool()
-async def analyze_engagement(post_urn: str, follower_count: int | None = None) -> dict:
-    """
-    Perform deep engagement analysis on a specific post.
+    )
 
-    Args:
-        post_urn: LinkedIn post URN
-        follower_count: Author's follower count for rate calculation (optional)
 
-    Returns comprehensive engagement metrics, reaction distribution, and quality score.
-    """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.analytics import get_engagement_analyzer
+async def _analyze_engagement(post_urn: str, follower_count: int | None = None) -> dict:
+    """Perform deep engagement analysis on a specific post."""
+    if error := _check_post_urn(post_urn):
+        return error
 
-    logger = get_logger(__name__)
     ctx = get_context()
     analyzer = get_engagement_analyzer()
 
@@ -4113,16 +4431,18 @@ async def analyze_engagement(post_urn: str, follower_count: int | None = None) -
         if not ctx.data_provider:
             return {"error": "No LinkedIn data provider available. Configure API credentials."}
 
-        # Get reactions via data_provider
+        # Fetch reactions and comments concurrently via data_provider
+        reactions_result, comments_result = await asyncio.gather(
+            _provider_post_reactions(ctx.data_provider, post_urn),
+            _provider_post_comments(ctx.data_provider, post_urn),
+        )
+
         # data_provider returns: {"data": {"reactors": [...], ...}, "source": "..."}
-        reactions_result = await ctx.data_provider.get_post_reactions(post_urn)
         data = reactions_result.get("data", {})
         reactions = data.get("reactors", []) if isinstance(data, dict) else (data if isinstance(data, list) else [])
         source = reactions_result.get("source", "data_provider")
 
-        # Get comments via data_provider
         # data_provider returns: {"data": {"comments": [...], ...}, "source": "..."}
-        comments_result = await ctx.data_provider.get_post_comments(post_urn)
         data = comments_result.get("data", {})
         comments = data.get("comments", data.get("data", [])) if isinstance(data, dict) else (data if isinstance(data, list) else [])
 
@@ -4138,17 +4458,30 @@ async def analyze_engagement(post_urn: str, follower_count: int | None = None) -
         # Analyze reaction distribution
         reaction_analysis = analyzer.analyze_reaction_distribution(reactions)
 
-        return {
-            "success": True,
-            "post_urn": post_urn,
-            "engagement": engagement_metrics,
-            "reactions": reaction_analysis,
-            "comments_count": len(comments),
-            "source": source,
-        }
+        return _ok(
+            post_urn=post_urn,
+            engagement=engagement_metrics,
+            reactions=reaction_analysis,
+            comments_count=len(comments),
+            source=source,
+        )
     except Exception as e:
         logger.error("Failed to analyze engagement", error=str(e), post_urn=post_urn)
-        return {"error": str(e)}
+        return _err(e)
+
+
+@mcp.tool()
+async def analyze_engagement(post_urn: str, follower_count: int | None = None) -> dict:
+    """
+    Perform deep engagement analysis on a specific post.
+
+    Args:
+        post_urn: LinkedIn post URN
+        follower_count: Author's follower count for rate calculation (optional)
+
+    Returns comprehensive engagement metrics, reaction distribution, and quality score.
+    """
+    return await _analyze_engagement(post_urn, follower_count)
 
 
 @mcp.tool()
@@ -4162,11 +4495,7 @@ async def analyze_content_performance(profile_id: str, post_limit: int = 20) ->
 
     Returns content analysis with type distribution, engagement patterns, and recommendations.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.analytics import get_content_analyzer
 
-    logger = get_logger(__name__)
     ctx = get_context()
     analyzer = get_content_analyzer()
 
@@ -4177,24 +4506,23 @@ async def analyze_content_performance(profile_id: str, post_limit: int = 20) ->
         if not ctx.data_provider:
             return {"error": "No LinkedIn data provider available. Configure API credentials."}
 
-        result = await ctx.data_provider.get_profile_posts(profile_id, limit=post_limit)
+        result = await _provider_profile_posts(ctx.data_provider, profile_id, post_limit)
         posts = result.get("posts", result.get("data", []))
         source = result.get("source", "data_provider")
 
         if not posts:
-            return {"success": True, "message": "No posts found for analysis"}
+            return _ok(message="No posts found for analysis")
 
         analysis = analyzer.analyze_posts_performance(posts)
 
-        return {
-            "success": True,
-            "profile_id": profile_id,
-            "analysis": analysis,
-            "source": source,
-        }
+        return _ok(
+            profile_id=profile_id,
+            analysis=analysis,
+            source=source,
+        )
     except Exception as e:
         logger.error("Failed to analyze content", error=str(e), profile_id=profile_id)
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -4208,11 +4536,7 @@ async def analyze_optimal_posting_times(profile_id: str, post_limit: int = 30) -
 
     Returns optimal posting times by hour and day with engagement averages.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.analytics import get_posting_time_analyzer
 
-    logger = get_logger(__name__)
     ctx = get_context()
     analyzer = get_posting_time_analyzer()
 
@@ -4223,41 +4547,30 @@ async def analyze_optimal_posting_times(profile_id: str, post_limit: int = 30) -
         if not ctx.data_provider:
             return {"error": "No LinkedIn data provider available. Configure API credentials."}
 
-        result = await ctx.data_provider.get_profile_posts(profile_id, limit=post_limit)
+        result = await _provider_profile_posts(ctx.data_provider, profile_id, post_limit)
         posts = result.get("posts", result.get("data", []))
         source = result.get("source", "data_provider")
 
         if not posts:
-            return {"success": True, "message": "No posts found for analysis"}
+            return _ok(message="No posts found for analysis")
 
         analysis = analyzer.analyze_posting_patterns(posts)
 
-        return {
-            "success": True,
-            "profile_id": profile_id,
-            "posting_analysis": analysis,
-            "source": source,
-        }
+        return _ok(
+            profile_id=profile_id,
+            posting_analysis=analysis,
+            source=source,
+        )
     except Exception as e:
         logger.error("Failed to analyze posting times", error=str(e), profile_id=profile_id)
-        return {"error": str(e)}
-
-
-@mcp.tool()
-async def analyze_post_audience(post_urn: str) -> dict:
-    """
-    Analyze the audience engaging with a specific post.
+        return _err(e)
 
-    Args:
-        post_urn: LinkedIn post URN
 
-    Returns audience demographics based on commenters' profiles.
-    """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.analytics import get_audience_analyzer
+async def _analyze_post_audience(post_urn: str) -> dict:
+    """Analyze the audience engaging with a specific post."""
+    if error := _check_post_urn(post_urn):
+        return error
 
-    logger = get_logger(__name__)
     ctx = get_context()
     analyzer = get_audience_analyzer()
 
@@ -4266,24 +4579,36 @@ async def analyze_post_audience(post_urn: str) -> dict:
         if not ctx.data_provider:
             return {"error": "No LinkedIn data provider available. Configure API credentials."}
 
-        result = await ctx.data_provider.get_post_comments(post_urn)
+        result = await _provider_post_comments(ctx.data_provider, post_urn)
         comments = result.get("comments", result.get("data", []))
         source = result.get("source", "data_provider")
 
         if not comments:
-            return {"success": True, "message": "No comments to analyze"}
+            return _ok(message="No comments to analyze")
 
         analysis = analyzer.analyze_commenters(comments)
 
-        return {
-            "success": True,
-            "post_urn": post_urn,
-            "audience_analysis": analysis,
-            "source": source,
-        }
+        return _ok(
+            post_urn=post_urn,
+            audience_analysis=analysis,
+            source=source,
+        )
     except Exception as e:
         logger.error("Failed to analyze audience", error=str(e), post_urn=post_urn)
-        return {"error": str(e)}
+        return _err(e)
+
+
+@mcp.tool()
+async def analyze_post_audience(post_urn: str) -> dict:
+    """
+    Analyze the audience engaging with a specific post.
+
+    Args:
+        post_urn: LinkedIn post URN
+
+    Returns audience demographics based on commenters' profiles.
+    """
+    return await _analyze_post_audience(post_urn)
 
 
 @mcp.tool()
@@ -4297,13 +4622,7 @@ async def analyze_hashtag_performance(profile_id: str, post_limit: int = 30) ->
 
     Returns hashtag frequency, engagement correlation, and recommendations.
     """
-    from collections import Counter
 
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.analytics import get_content_analyzer
-
-    logger = get_logger(__name__)
     ctx = get_context()
     analyzer = get_content_analyzer()
 
@@ -4314,22 +4633,24 @@ async def analyze_hashtag_performance(profile_id: str, post_limit: int = 30) ->
         if not ctx.data_provider:
             return {"error": "No LinkedIn data provider available. Configure API credentials."}
 
-        result = await ctx.data_provider.get_profile_posts(profile_id, limit=post_limit)
+        result = await _provider_profile_posts(ctx.data_provider, profile_id, post_limit)
         posts = result.get("posts", result.get("data", []))
         source = result.get("source", "data_provider")
 
         if not posts:
-            return {"success": True, "message": "No posts found for analysis"}
+            return _ok(message="No posts found for analysis")
 
         # Analyze hashtags and their engagement
-        hashtag_engagement: dict[str, list[int]] = {}
+        # Per-tag running totals; uses come from hashtag_counts
+        hashtag_engagement: Counter[str] = Counter()
+        hashtag_counts: Counter[str] = Counter()
         posts_with_hashtags = 0
         posts_without_hashtags = 0
         engagement_with_hashtags: list[int] = []
         engagement_without_hashtags: list[int] = []
 
         for post in posts:
-            content = post.get("commentary", post.get("text", ""))
+            content = post_text(post)
             hashtags = analyzer.extract_hashtags(content)
 
             reactions = post.get("numLikes", 0) or 0
@@ -4339,28 +4660,22 @@ async def analyze_hashtag_performance(profile_id: str, post_limit: int = 30) ->
             if hashtags:
                 posts_with_hashtags += 1
                 engagement_with_hashtags.append(total_engagement)
+                hashtag_counts.update(hashtags)
                 for tag in hashtags:
-                    if tag not in hashtag_engagement:
-                        hashtag_engagement[tag] = []
-                    hashtag_engagement[tag].append(total_engagement)
+                    hashtag_engagement[tag] += total_engagement
             else:
                 posts_without_hashtags += 1
                 engagement_without_hashtags.append(total_engagement)
 
-        # Calculate averages per hashtag
-        hashtag_performance = {}
-        for tag, engagements in hashtag_engagement.items():
-            hashtag_performance[tag] = {
-                "uses": len(engagements),
-                "avg_engagement": round(sum(engagements) / len(engagements), 1),
-            }
+        # Top 10 by average engagement (same order as a stable descending sort);
+        # per-tag entries are built only for the winners
+        def avg_engagement(tag: str) -> float:
+            return round(hashtag_engagement[tag] / hashtag_counts[tag], 1)
 
-        # Sort by average engagement
-        top_hashtags = sorted(
-            hashtag_performance.items(),
-            key=lambda x: x[1]["avg_engagement"],
-            reverse=True,
-        )[:10]
+        top_hashtags = [
+            (tag, {"uses": hashtag_counts[tag], "avg_engagement": avg_engagement(tag)})
+            for tag in heapq.nlargest(10, hashtag_engagement, key=avg_engagement)
+        ]
 
         # Compare hashtag vs no-hashtag performance
         avg_with = round(sum(engagement_with_hashtags) / len(engagement_with_hashtags), 1) if engagement_with_hashtags else 0
@@ -4372,26 +4687,22 @@ async def analyze_hashtag_performance(profile_id: str, post_limit: int = 30) ->
         if top_hashtags:
             recommendations.append(f"Best performing hashtags: #{top_hashtags[0][0]}")
 
-        return {
-            "success": True,
-            "profile_id": profile_id,
-            "hashtag_analysis": {
+        return _ok(
+            profile_id=profile_id,
+            hashtag_analysis={
                 "posts_with_hashtags": posts_with_hashtags,
                 "posts_without_hashtags": posts_without_hashtags,
                 "avg_engagement_with_hashtags": avg_with,
                 "avg_engagement_without_hashtags": avg_without,
                 "top_performing_hashtags": dict(top_hashtags),
-                "all_hashtags": dict(Counter(
-                    tag for post in posts
-                    for tag in analyzer.extract_hashtags(post.get("commentary", post.get("text", "")))
-                ).most_common(20)),
+                "all_hashtags": dict(hashtag_counts.most_common(20)),
             },
-            "recommendations": recommendations,
-            "source": source,
-        }
+            recommendations=recommendations,
+            source=source,
+        )
     except Exception as e:
         logger.error("Failed to analyze hashtags", error=str(e), profile_id=profile_id)
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -4405,19 +4716,9 @@ async def generate_engagement_report(profile_id: str, post_limit: int = 20) -> d
 
     Returns a full engagement report with content analysis, timing, and recommendations.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.analytics import (
-        get_content_analyzer,
-        get_engagement_analyzer,
-        get_posting_time_analyzer,
-    )
 
-    logger = get_logger(__name__)
     ctx = get_context()
     engagement_analyzer = get_engagement_analyzer()
-    content_analyzer = get_content_analyzer()
-    posting_analyzer = get_posting_time_analyzer()
 
     post_limit = min(post_limit, 50)
 
@@ -4426,36 +4727,31 @@ async def generate_engagement_report(profile_id: str, post_limit: int = 20) -> d
         if not ctx.data_provider:
             return {"error": "No LinkedIn data provider available. Configure API credentials."}
 
-        # Get profile via data_provider
-        profile_result = await ctx.data_provider.get_profile(profile_id)
+        # Profile and posts are independent; fetch them concurrently via data_provider
+        profile_result, posts_result = await asyncio.gather(
+            ctx.data_provider.get_profile(profile_id),
+            _provider_profile_posts(ctx.data_provider, profile_id, post_limit),
+        )
         profile = profile_result.get("profile", profile_result.get("data", profile_result))
         source = profile_result.get("source", "data_provider")
-
-        # Get posts via data_provider
-        posts_result = await ctx.data_provider.get_profile_posts(profile_id, limit=post_limit)
         posts = posts_result.get("posts", posts_result.get("data", []))
 
         if not profile:
             return {"error": "Could not retrieve profile data."}
 
         if not posts:
-            return {"success": True, "message": "No posts found for report"}
-
-        # Aggregate engagement
-        total_reactions = 0
-        total_comments = 0
+            return _ok(message="No posts found for report")
 
-        for post in posts:
-            total_reactions += post.get("numLikes", 0) or 0
-            total_comments += post.get("numComments", 0) or 0
+        # Aggregate engagement and run the content and timing analyses in one pass
+        summary = summarize_posts(posts)
+        total_reactions = summary.total_reactions
+        total_comments = summary.total_comments
+        content_analysis = summary.content_analysis
+        timing_analysis = summary.timing_analysis
 
         avg_reactions = round(total_reactions / len(posts), 1)
         avg_comments = round(total_comments / len(posts), 1)
 
-        # Run analyses
-        content_analysis = content_analyzer.analyze_posts_performance(posts)
-        timing_analysis = posting_analyzer.analyze_posting_patterns(posts)
-
         # Calculate overall engagement rate
         follower_count = profile.get("followerCount", profile.get("numFollowers"))
         overall_engagement = engagement_analyzer.calculate_engagement_rate(
@@ -4465,9 +4761,8 @@ async def generate_engagement_report(profile_id: str, post_limit: int = 20) -> d
             follower_count=follower_count,
         )
 
-        return {
-            "success": True,
-            "report": {
+        return _ok(
+            report={
                 "profile": {
                     "id": profile_id,
                     "name": f"{profile.get('firstName', '')} {profile.get('lastName', '')}".strip(),
@@ -4487,11 +4782,11 @@ async def generate_engagement_report(profile_id: str, post_limit: int = 20) -> d
                 "recommendations": content_analysis.get("recommendations", [])
                 + timing_analysis.get("recommended_posting_times", []),
             },
-            "source": source,
-        }
+            source=source,
+        )
     except Exception as e:
         logger.error("Failed to generate report", error=str(e), profile_id=profile_id)
-        return {"error": str(e)}
+        return _err(e)
 
 
 # =============================================================================
@@ -4514,10 +4809,7 @@ async def get_my_posts(count: int = 50) -> dict:
 
     Returns list of your posts with URNs, content, and timestamps.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
 
-    logger = get_logger(__name__)
     ctx = get_context()
 
     if not ctx.data_provider:
@@ -4563,17 +4855,16 @@ async def get_my_posts(count: int = 50) -> dict:
                 "has_media": bool(post.get("content") or post.get("image") or post.get("video")),
             })
 
-        return {
-            "success": True,
-            "posts": formatted_posts,
-            "count": len(formatted_posts),
-            "source": source,
-            "note": "Use get_my_post_analytics with the URNs to get official impression data",
-        }
+        return _ok(
+            posts=formatted_posts,
+            count=len(formatted_posts),
+            source=source,
+            note="Use get_my_post_analytics with the URNs to get official impression data",
+        )
 
     except Exception as e:
         logger.error("Failed to get my posts", error=str(e))
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -4591,12 +4882,6 @@ async def get_my_post_analytics(post_urns: list[str] | None = None, limit: int =
 
     Returns analytics including impressions, reactions, comments, shares, and engagement rate.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.linkedin.analytics_client import LinkedInAnalyticsClient
-    from linkedin_mcp.services.storage.token_storage import get_official_token
-
-    logger = get_logger(__name__)
     ctx = get_context()
 
     # Get OAuth token
@@ -4647,22 +4932,21 @@ async def get_my_post_analytics(post_urns: list[str] | None = None, limit: int =
                     post_urns.append(urn)
 
         if not post_urns:
-            return {"success": True, "message": "No posts found to analyze"}
+            return _ok(message="No posts found to analyze")
 
         # Get analytics from official API
         client = LinkedInAnalyticsClient(access_token=token_data.access_token)
         analytics = client.get_post_analytics(post_urns)
 
-        return {
-            "success": True,
-            "analytics": analytics,
-            "posts_analyzed": len(analytics),
-            "post_urns_checked": post_urns,
-        }
+        return _ok(
+            analytics=analytics,
+            posts_analyzed=len(analytics),
+            post_urns_checked=post_urns,
+        )
 
     except Exception as e:
         logger.error("Failed to get post analytics", error=str(e))
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -4678,15 +4962,7 @@ async def analyze_my_content_performance(post_limit: int = 30) -> dict:
 
     Returns detailed performance analysis with content breakdown, timing insights, and recommendations.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.analytics import (
-        get_content_analyzer,
-        get_engagement_analyzer,
-        get_posting_time_analyzer,
-    )
 
-    logger = get_logger(__name__)
     ctx = get_context()
 
     if not ctx.data_provider:
@@ -4714,28 +4990,22 @@ async def analyze_my_content_performance(post_limit: int = 30) -> dict:
             return {"error": "Could not determine your profile ID"}
 
         # Get your posts
-        result = await ctx.data_provider.get_profile_posts(profile_id, limit=post_limit)
+        result = await _provider_profile_posts(ctx.data_provider, profile_id, post_limit)
         posts = result.get("posts", result.get("data", []))
         source = result.get("source", "data_provider")
 
         if not posts:
-            return {"success": True, "message": "No posts found for analysis"}
+            return _ok(message="No posts found for analysis")
 
-        # Run analyses
-        content_analyzer = get_content_analyzer()
-        posting_analyzer = get_posting_time_analyzer()
-        engagement_analyzer = get_engagement_analyzer()
-
-        content_analysis = content_analyzer.analyze_posts_performance(posts)
-        timing_analysis = posting_analyzer.analyze_posting_patterns(posts)
-
-        # Aggregate engagement
-        total_reactions = sum(p.get("numLikes", 0) or 0 for p in posts)
-        total_comments = sum(p.get("numComments", 0) or 0 for p in posts)
+        # Aggregate engagement and run the content and timing analyses in one pass
+        summary = summarize_posts(posts)
+        total_reactions = summary.total_reactions
+        total_comments = summary.total_comments
+        content_analysis = summary.content_analysis
+        timing_analysis = summary.timing_analysis
 
-        return {
-            "success": True,
-            "analysis": {
+        return _ok(
+            analysis={
                 "posts_analyzed": len(posts),
                 "total_reactions": total_reactions,
                 "total_comments": total_comments,
@@ -4744,12 +5014,12 @@ async def analyze_my_content_performance(post_limit: int = 30) -> dict:
                 "content_analysis": content_analysis,
                 "timing_analysis": timing_analysis,
             },
-            "source": source,
-        }
+            source=source,
+        )
 
     except Exception as e:
         logger.error("Failed to analyze content performance", error=str(e))
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -4765,14 +5035,7 @@ async def get_my_posting_recommendations(post_limit: int = 30) -> dict:
 
     Returns recommendations prioritized by potential impact.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.analytics import (
-        get_content_analyzer,
-        get_posting_time_analyzer,
-    )
 
-    logger = get_logger(__name__)
     ctx = get_context()
 
     if not ctx.data_provider:
@@ -4800,21 +5063,18 @@ async def get_my_posting_recommendations(post_limit: int = 30) -> dict:
             return {"error": "Could not determine your profile ID"}
 
         # Get your posts
-        result = await ctx.data_provider.get_profile_posts(profile_id, limit=post_limit)
+        result = await _provider_profile_posts(ctx.data_provider, profile_id, post_limit)
         posts = result.get("posts", result.get("data", []))
 
         if not posts or len(posts) < 5:
-            return {
-                "success": True,
-                "message": f"Need at least 5 posts for recommendations. Found {len(posts) if posts else 0}.",
-            }
-
-        # Analyze content and timing
-        content_analyzer = get_content_analyzer()
-        posting_analyzer = get_posting_time_analyzer()
+            return _ok(
+                message=f"Need at least 5 posts for recommendations. Found {len(posts) if posts else 0}.",
+            )
 
-        content_analysis = content_analyzer.analyze_posts_performance(posts)
-        timing_analysis = posting_analyzer.analyze_posting_patterns(posts)
+        # Analyze content and timing in one pass
+        summary = summarize_posts(posts)
+        content_analysis = summary.content_analysis
+        timing_analysis = summary.timing_analysis
 
         recommendations = []
 
@@ -4832,7 +5092,7 @@ async def get_my_posting_recommendations(post_limit: int = 30) -> dict:
                 })
 
         # Engagement insights
-        total_engagement = sum((p.get("numLikes", 0) or 0) + (p.get("numComments", 0) or 0) for p in posts)
+        total_engagement = summary.total_reactions + summary.total_comments
         avg_engagement = total_engagement / len(posts) if posts else 0
 
         if avg_engagement < 10:
@@ -4842,18 +5102,17 @@ async def get_my_posting_recommendations(post_limit: int = 30) -> dict:
                 "reason": f"Your average engagement is {avg_engagement:.1f} - questions typically increase comments",
             })
 
-        return {
-            "success": True,
-            "recommendations": recommendations,
-            "based_on": {
+        return _ok(
+            recommendations=recommendations,
+            based_on={
                 "posts_analyzed": len(posts),
                 "avg_engagement": round(avg_engagement, 1),
             },
-        }
+        )
 
     except Exception as e:
         logger.error("Failed to get posting recommendations", error=str(e))
-        return {"error": str(e)}
+        return _err(e)
 
 
 @mcp.tool()
@@ -4870,16 +5129,7 @@ async def generate_my_content_calendar(weeks: int = 4, posts_per_week: int = 3)
 
     Returns content calendar with suggested dates, times, and content prompts.
     """
-    from datetime import datetime, timedelta
 
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-    from linkedin_mcp.services.analytics import (
-        get_content_analyzer,
-        get_posting_time_analyzer,
-    )
-
-    logger = get_logger(__name__)
     ctx = get_context()
 
     # Validate inputs
@@ -4908,7 +5158,7 @@ async def generate_my_content_calendar(weeks: int = 4, posts_per_week: int = 3)
         if not profile_id:
             return {"error": "Could not determine your profile ID"}
 
-        result = await ctx.data_provider.get_profile_posts(profile_id, limit=30)
+        result = await _provider_profile_posts(ctx.data_provider, profile_id, 30)
         posts = result.get("posts", result.get("data", []))
 
         # Analyze content and timing patterns
@@ -4986,23 +5236,22 @@ async def generate_my_content_calendar(weeks: int = 4, posts_per_week: int = 3)
                     "posts": week_posts,
                 })
 
-        return {
-            "success": True,
-            "calendar": calendar,
-            "strategy": {
+        return _ok(
+            calendar=calendar,
+            strategy={
                 "posts_per_week": posts_per_week,
                 "preferred_days": preferred_days[:posts_per_week],
                 "preferred_times": preferred_hours[:3],
                 "recommended_content_types": content_types[:3],
             },
-            "based_on": {
+            based_on={
                 "posts_analyzed": len(posts),
             },
-        }
+        )
 
     except Exception as e:
         logger.error("Failed to generate content calendar", error=str(e))
-        return {"error": str(e)}
+        return _err(e)
 
 
 # =============================================================================
@@ -5011,7 +5260,8 @@ async def generate_my_content_calendar(weeks: int = 4, posts_per_week: int = 3)
 
 
 @mcp.tool()
-async def get_profile_sections() -> dict:
+@requires_client
+async def get_profile_sections(client: LinkedInClient) -> dict:
     """
     Get all editable profile sections with current content.
 
@@ -5022,20 +5272,14 @@ async def get_profile_sections() -> dict:
     - Education count
     - Skills overview
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.services.profile import ProfileManager
-
-    ctx = get_context()
 
-    if not ctx.linkedin_client:
-        return {"error": "LinkedIn client not initialized"}
-
-    manager = ProfileManager(ctx.linkedin_client)
+    manager = ProfileManager(client)
     return await manager.get_profile_sections()
 
 
 @mcp.tool()
-async def get_profile_completeness() -> dict:
+@requires_client
+async def get_profile_completeness(client: LinkedInClient) -> dict:
     """
     Calculate profile completeness score with improvement suggestions.
 
@@ -5044,15 +5288,8 @@ async def get_profile_completeness() -> dict:
     - Completed vs total sections
     - Specific suggestions for improvement
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.services.profile import ProfileManager
 
-    ctx = get_context()
-
-    if not ctx.linkedin_client:
-        return {"error": "LinkedIn client not initialized"}
-
-    manager = ProfileManager(ctx.linkedin_client)
+    manager = ProfileManager(client)
     return await manager.get_profile_completeness()
 
 
@@ -5068,8 +5305,6 @@ async def update_profile_headline(headline: str) -> dict:
 
     Returns success status.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.services.profile import ProfileManager
 
     ctx = get_context()
     manager = ProfileManager(ctx.linkedin_client)
@@ -5088,8 +5323,6 @@ async def update_profile_summary(summary: str) -> dict:
 
     Returns success status.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.services.profile import ProfileManager
 
     ctx = get_context()
     manager = ProfileManager(ctx.linkedin_client)
@@ -5108,20 +5341,16 @@ async def upload_profile_photo(photo_path: str) -> dict:
 
     Returns success status.
     """
-    from pathlib import Path
 
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.services.profile import ProfileManager
+    # Validate file extension (only the suffix is lowercased, not the whole path)
+    photo_file = Path(photo_path)
+    if photo_file.suffix.lower() not in _VALID_IMAGE_EXTS:
+        return {"error": f"Invalid file type. Supported: {', '.join(_VALID_IMAGE_EXTS)}"}
 
     # Validate file exists
-    if not Path(photo_path).exists():
+    if not await asyncio.to_thread(photo_file.exists):
         return {"error": f"File not found: {photo_path}"}
 
-    # Validate file extension
-    valid_extensions = (".jpg", ".jpeg", ".png", ".gif")
-    if not photo_path.lower().endswith(valid_extensions):
-        return {"error": f"Invalid file type. Supported: {', '.join(valid_extensions)}"}
-
     ctx = get_context()
     manager = ProfileManager(ctx.linkedin_client)
     return await manager.upload_profile_photo(photo_path)
@@ -5139,20 +5368,16 @@ async def upload_background_photo(photo_path: str) -> dict:
 
     Returns success status.
     """
-    from pathlib import Path
 
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.services.profile import ProfileManager
+    # Validate file extension (only the suffix is lowercased, not the whole path)
+    photo_file = Path(photo_path)
+    if photo_file.suffix.lower() not in _VALID_BACKGROUND_EXTS:
+        return {"error": f"Invalid file type. Supported: {', '.join(_VALID_BACKGROUND_EXTS)}"}
 
     # Validate file exists
-    if not Path(photo_path).exists():
+    if not await asyncio.to_thread(photo_file.exists):
         return {"error": f"File not found: {photo_path}"}
 
-    # Validate file extension
-    valid_extensions = (".jpg", ".jpeg", ".png")
-    if not photo_path.lower().endswith(valid_extensions):
-        return {"error": f"Invalid file type. Supported: {', '.join(valid_extensions)}"}
-
     ctx = get_context()
     manager = ProfileManager(ctx.linkedin_client)
     return await manager.upload_background_photo(photo_path)
@@ -5170,14 +5395,22 @@ async def add_profile_skill(skill_name: str) -> dict:
 
     Returns success status.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.services.profile import ProfileManager
 
     ctx = get_context()
     manager = ProfileManager(ctx.linkedin_client)
     return await manager.add_skill(skill_name)
 
 
+# Tools that only work through browser automation
+_FEATURES_REQUIRING_BROWSER = (
+    "update_profile_headline",
+    "update_profile_summary",
+    "upload_profile_photo",
+    "upload_background_photo",
+    "add_profile_skill",
+)
+
+
 @mcp.tool()
 async def check_browser_automation_status() -> dict:
     """
@@ -5185,52 +5418,142 @@ async def check_browser_automation_status() -> dict:
 
     Returns availability status and feature capabilities.
     """
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.services.browser import get_browser_automation
-
     ctx = get_context()
     automation = get_browser_automation()
 
-    features_requiring_browser = [
-        "update_profile_headline",
-        "update_profile_summary",
-        "upload_profile_photo",
-        "upload_background_photo",
-        "add_profile_skill",
-    ]
+    return _ok(
+        browser_available=ctx.has_browser,
+        automation_ready=automation is not None and automation.is_available,
+        features_requiring_browser=_FEATURES_REQUIRING_BROWSER,
+        note="Browser automation is optional but enables profile update features.",
+    )
 
-    return {
-        "success": True,
-        "browser_available": ctx.has_browser,
-        "automation_ready": automation is not None and automation.is_available,
-        "features_requiring_browser": features_requiring_browser,
-        "note": "Browser automation is optional but enables profile update features.",
-    }
+
+# =============================================================================
+# Batch Tools
+# =============================================================================
+
+# Read-only single-ID tools that batch() may fan out over, keyed by tool name.
+# Values are the undecorated implementations: @mcp.tool() replaces a function
+# with a Tool object, which is not callable in every supported fastmcp release.
+_BATCHABLE: dict[str, Callable[[str], Awaitable[dict]]] = {
+    "get_profile_contact_info": _get_profile_contact_info,
+    "get_profile_skills": _get_profile_skills,
+    "get_post_reactions": _get_post_reactions,
+    "get_post_comments": _get_post_comments,
+    "get_post_engagement": _get_post_engagement,
+    "get_company": _get_company,
+    "get_school": _get_school,
+    "analyze_engagement": _analyze_engagement,
+    "analyze_post_audience": _analyze_post_audience,
+}
+_BATCH_MAX_IDS = 50
+_BATCH_CONCURRENCY = 8
+
+
+@mcp.tool()
+async def batch(op: str, ids: list[str]) -> dict:
+    """
+    Run a read-only lookup tool over many IDs concurrently in one call.
+
+    Args:
+        op: Tool to run per ID - one of get_profile_contact_info, get_profile_skills,
+            get_post_reactions, get_post_comments, get_post_engagement, get_company, get_school,
+            analyze_engagement, analyze_post_audience
+        ids: Profile IDs, post URNs, or company/school public IDs (max 50)
+
+    Returns per-ID results and failures, in input order.
+    """
+    tool_fn = _BATCHABLE.get(op)
+    if tool_fn is None:
+        return {"error": f"Unsupported op '{op}'. Supported: {', '.join(_BATCHABLE)}"}
+
+    # Drop blanks and repeats while preserving order
+    unique_ids = list(dict.fromkeys(i.strip() for i in ids if i.strip()))
+    if not unique_ids:
+        return {"error": "At least one ID is required"}
+    if len(unique_ids) > _BATCH_MAX_IDS:
+        return {"error": f"Maximum {_BATCH_MAX_IDS} IDs per batch request"}
+
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def run_one(item_id: str) -> dict:
+        # Each item runs in its own task, so these bindings stay per item and
+        # sit alongside the tool=batch binding from _ToolLogContext
+        with LogContext(op=op, item_id=item_id):
+            async with semaphore:
+                try:
+                    return await tool_fn(item_id)
+                except Exception as e:
+                    logger.error("Batch item failed", error=str(e))
+                    return _err(e)
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(run_one(item_id)) for item_id in unique_ids]
+
+    results = []
+    failures = []
+    for item_id, task in zip(unique_ids, tasks, strict=True):
+        response = task.result()
+        if "error" in response or response.get("success") is False:
+            failures.append({"id": item_id, "error": response.get("error", "Unknown error")})
+        else:
+            results.append({"id": item_id, **response})
+
+    return _ok(
+        op=op,
+        results=results,
+        failures=failures,
+        total_requested=len(unique_ids),
+        successful=len(results),
+        failed=len(failures),
+    )
 
 
 # =============================================================================
 # Server Info Resource
 # =============================================================================
 
+# (settings, static fields) of the last server_info read; settings are fixed at startup
+_SERVER_INFO_STATIC: tuple[Any, dict[str, Any]] | None = None
+
+
+def _server_info_static(settings: Any) -> dict[str, Any]:
+    """Return the name, version and feature flags, built once per settings object."""
+    global _SERVER_INFO_STATIC
+
+    if _SERVER_INFO_STATIC is None or _SERVER_INFO_STATIC[0] is not settings:
+        features = settings.features
+        _SERVER_INFO_STATIC = (
+            settings,
+            {
+                "name": settings.server.name,
+                "version": settings.server.version,
+                "features": {
+                    "browser_fallback": features.browser_fallback,
+                    "analytics_tracking": features.analytics_tracking,
+                    "post_scheduling": features.post_scheduling,
+                    "messaging_enabled": features.messaging_enabled,
+                    "connections_enabled": features.connections_enabled,
+                    "jobs_enabled": features.jobs_enabled,
+                },
+            },
+        )
+    return _SERVER_INFO_STATIC[1]
+
 
 @mcp.resource("linkedin://server/info")
 async def server_info() -> str:
     """
     Get LinkedIn MCP server information and status.
     """
-    import json
-
-    from linkedin_mcp.core.context import get_context
-    from linkedin_mcp.core.logging import get_logger
-
-    logger = get_logger(__name__)
 
     try:
         ctx = get_context()
-        settings = ctx.settings
+        static = _server_info_static(ctx.settings)
         info = {
-            "name": settings.server.name,
-            "version": settings.server.version,
+            "name": static["name"],
+            "version": static["version"],
             "status": {
                 "initialized": ctx.is_initialized,
                 "linkedin_connected": ctx.has_linkedin_client,
@@ -5238,14 +5561,7 @@ async def server_info() -> str:
                 "scheduler_running": ctx.has_scheduler,
                 "browser_available": ctx.has_browser,
             },
-            "features": {
-                "browser_fallback": settings.features.browser_fallback,
-                "analytics_tracking": settings.features.analytics_tracking,
-                "post_scheduling": settings.features.post_scheduling,
-                "messaging_enabled": settings.features.messaging_enabled,
-                "connections_enabled": settings.features.connections_enabled,
-                "jobs_enabled": settings.features.jobs_enabled,
-            },
+            "features": static["features"],
             "rate_limit": {
                 "remaining": ctx.linkedin_client.rate_limit_remaining if ctx.linkedin_client else 0,
             },
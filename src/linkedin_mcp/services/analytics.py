@@ -5,8 +5,10 @@ Provides engagement analysis, optimal posting times, content performance metrics
 and audience insights.
 """
 
+import heapq
 import re
 from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -15,6 +17,11 @@ from linkedin_mcp.core.logging import get_logger
 logger = get_logger(__name__)
 
 
+def post_text(post: dict[str, Any]) -> str:
+    """Return a post's text, preferring ``commentary`` over ``text``."""
+    return post.get("commentary") or post.get("text") or ""
+
+
 class EngagementAnalyzer:
     """Analyzes engagement metrics for posts and profiles."""
 
@@ -119,6 +126,19 @@ class EngagementAnalyzer:
         }
 
 
+@dataclass
+class _ContentTally:
+    """Running per-post counters for ContentAnalyzer."""
+
+    post_count: int = 0
+    content_types: Counter[str] = field(default_factory=Counter)
+    hashtags: Counter[str] = field(default_factory=Counter)
+    engagement_by_type: dict[str, list[int]] = field(default_factory=dict)
+    engagement_by_length: dict[str, list[int]] = field(
+        default_factory=lambda: {"short": [], "medium": [], "long": []}
+    )
+
+
 class ContentAnalyzer:
     """Analyzes content patterns and performance."""
 
@@ -212,47 +232,48 @@ class ContentAnalyzer:
         if not posts:
             return {"error": "No posts to analyze"}
 
-        content_types: Counter[str] = Counter()
-        hashtag_counter: Counter[str] = Counter()
-        engagement_by_type: dict[str, list[int]] = {}
-        engagement_by_length: dict[str, list[int]] = {"short": [], "medium": [], "long": []}
-
+        tally = _ContentTally()
         for post in posts:
-            content = post.get("commentary", post.get("text", ""))
-            content_type = self.detect_content_type(post)
-            content_types[content_type] += 1
-
-            # Extract hashtags
-            hashtags = self.extract_hashtags(content)
-            hashtag_counter.update(hashtags)
-
-            # Calculate engagement
-            reactions = post.get("numLikes", 0) or post.get("socialDetail", {}).get("totalSocialActivityCounts", {}).get("numLikes", 0)
-            comments = post.get("numComments", 0) or post.get("socialDetail", {}).get("totalSocialActivityCounts", {}).get("numComments", 0)
-            total_engagement = reactions + comments
-
-            # Track by content type
-            if content_type not in engagement_by_type:
-                engagement_by_type[content_type] = []
-            engagement_by_type[content_type].append(total_engagement)
-
-            # Track by length
-            char_count = len(content)
-            if char_count < 500:
-                engagement_by_length["short"].append(total_engagement)
-            elif char_count < 1500:
-                engagement_by_length["medium"].append(total_engagement)
-            else:
-                engagement_by_length["long"].append(total_engagement)
+            self._tally_post(tally, post)
+        return self._summarize(tally)
+
+    def _tally_post(self, tally: _ContentTally, post: dict[str, Any]) -> None:
+        """Add one post to the running content counters."""
+        tally.post_count += 1
+        content = post_text(post)
+        content_type = self.detect_content_type(post)
+        tally.content_types[content_type] += 1
+
+        # Extract hashtags
+        tally.hashtags.update(self.extract_hashtags(content))
+
+        # Calculate engagement
+        reactions = post.get("numLikes", 0) or post.get("socialDetail", {}).get("totalSocialActivityCounts", {}).get("numLikes", 0)
+        comments = post.get("numComments", 0) or post.get("socialDetail", {}).get("totalSocialActivityCounts", {}).get("numComments", 0)
+        total_engagement = reactions + comments
+
+        # Track by content type
+        tally.engagement_by_type.setdefault(content_type, []).append(total_engagement)
+
+        # Track by length
+        char_count = len(content)
+        if char_count < 500:
+            tally.engagement_by_length["short"].append(total_engagement)
+        elif char_count < 1500:
+            tally.engagement_by_length["medium"].append(total_engagement)
+        else:
+            tally.engagement_by_length["long"].append(total_engagement)
 
+    def _summarize(self, tally: _ContentTally) -> dict[str, Any]:
+        """Turn the running content counters into the performance analysis."""
         # Calculate averages
         avg_by_type = {}
-        for ct, engagements in engagement_by_type.items():
+        for ct, engagements in tally.engagement_by_type.items():
             if engagements:
                 avg_by_type[ct] = round(sum(engagements) / len(engagements), 1)
 
         avg_by_length = {}
-        for length, engagements in engagement_by_length.items():
+        for length, engagements in tally.engagement_by_length.items():
             if engagements:
                 avg_by_length[length] = round(sum(engagements) / len(engagements), 1)
 
@@ -260,12 +281,12 @@ class ContentAnalyzer:
         best_type = max(avg_by_type.items(), key=lambda x: x[1])[0] if avg_by_type else None
 
         return {
-            "total_posts_analyzed": len(posts),
-            "content_type_distribution": dict(content_types),
+            "total_posts_analyzed": tally.post_count,
+            "content_type_distribution": dict(tally.content_types),
             "average_engagement_by_type": avg_by_type,
             "average_engagement_by_length": avg_by_length,
             "best_performing_type": best_type,
-            "top_hashtags": dict(hashtag_counter.most_common(10)),
+            "top_hashtags": dict(tally.hashtags.most_common(10)),
             "recommendations": self._generate_recommendations(avg_by_type, avg_by_length, best_type),
         }
 
@@ -294,6 +315,14 @@ class ContentAnalyzer:
         return recommendations
 
 
+@dataclass
+class _TimingTally:
+    """Running per-post engagement buckets for PostingTimeAnalyzer."""
+
+    hour_engagement: dict[int, list[int]] = field(default_factory=lambda: {h: [] for h in range(24)})
+    day_engagement: dict[int, list[int]] = field(default_factory=lambda: {d: [] for d in range(7)})  # 0=Monday
+
+
 class PostingTimeAnalyzer:
     """Analyzes optimal posting times based on engagement patterns."""
 
@@ -313,50 +342,55 @@ class PostingTimeAnalyzer:
         if not posts:
             return {"error": "No posts to analyze"}
 
-        hour_engagement: dict[int, list[int]] = {h: [] for h in range(24)}
-        day_engagement: dict[int, list[int]] = {d: [] for d in range(7)}  # 0=Monday
-
+        tally = _TimingTally()
         for post in posts:
-            # Get post timestamp
-            timestamp = post.get("created", post.get("postedAt", post.get("created_at")))
-            if not timestamp:
-                continue
-
-            # Parse timestamp if string
-            if isinstance(timestamp, str):
-                try:
-                    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                except ValueError:
-                    continue
-            elif isinstance(timestamp, (int, float)):
-                # Unix timestamp (milliseconds)
-                dt = datetime.fromtimestamp(timestamp / 1000)
-            else:
-                continue
-
-            # Get engagement
-            reactions = post.get("numLikes", 0) or 0
-            comments = post.get("numComments", 0) or 0
-            total_engagement = reactions + comments
-
-            hour_engagement[dt.hour].append(total_engagement)
-            day_engagement[dt.weekday()].append(total_engagement)
+            self._tally_post(tally, post)
+        return self._summarize(tally)
+
+    def _tally_post(self, tally: _TimingTally, post: dict[str, Any]) -> None:
+        """Add one post's engagement to its hour and weekday buckets."""
+        # Get post timestamp
+        timestamp = post.get("created", post.get("postedAt", post.get("created_at")))
+        if not timestamp:
+            return
+
+        # Parse timestamp if string
+        if isinstance(timestamp, str):
+            try:
+                dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            except ValueError:
+                return
+        elif isinstance(timestamp, (int, float)):
+            # Unix timestamp (milliseconds)
+            dt = datetime.fromtimestamp(timestamp / 1000)
+        else:
+            return
+
+        # Get engagement
+        reactions = post.get("numLikes", 0) or 0
+        comments = post.get("numComments", 0) or 0
+        total_engagement = reactions + comments
+
+        tally.hour_engagement[dt.hour].append(total_engagement)
+        tally.day_engagement[dt.weekday()].append(total_engagement)
 
+    def _summarize(self, tally: _TimingTally) -> dict[str, Any]:
+        """Turn the hour and weekday buckets into posting-time recommendations."""
         # Calculate averages
         avg_by_hour = {}
-        for hour, engagements in hour_engagement.items():
+        for hour, engagements in tally.hour_engagement.items():
             if engagements:
                 avg_by_hour[hour] = round(sum(engagements) / len(engagements), 1)
 
         avg_by_day = {}
         day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        for day, engagements in day_engagement.items():
+        for day, engagements in tally.day_engagement.items():
             if engagements:
                 avg_by_day[day_names[day]] = round(sum(engagements) / len(engagements), 1)
 
         # Find best times
-        best_hours = sorted(avg_by_hour.items(), key=lambda x: x[1], reverse=True)[:3]
-        best_days = sorted(avg_by_day.items(), key=lambda x: x[1], reverse=True)[:3]
+        best_hours = heapq.nlargest(3, avg_by_hour.items(), key=lambda x: x[1])
+        best_days = heapq.nlargest(3, avg_by_day.items(), key=lambda x: x[1])
 
         return {
             "engagement_by_hour": avg_by_hour,
@@ -505,3 +539,79 @@ def get_audience_analyzer() -> AudienceAnalyzer:
     if _audience_analyzer is None:
         _audience_analyzer = AudienceAnalyzer()
     return _audience_analyzer
+
+
+@dataclass
+class PostsSummary:
+    """Engagement totals plus content and timing analyses for a set of posts."""
+
+    total_reactions: int
+    total_comments: int
+    content_analysis: dict[str, Any]
+    timing_analysis: dict[str, Any]
+
+
+def summarize_posts(posts: list[dict[str, Any]]) -> PostsSummary:
+    """
+    Run the engagement totals, content analysis and timing analysis in one pass.
+
+    Equivalent to summing ``numLikes``/``numComments`` and calling
+    ``analyze_posts_performance`` and ``analyze_posting_patterns`` separately,
+    but each post is visited once.
+
+    Args:
+        posts: List of post objects with engagement data
+
+    Returns:
+        PostsSummary with the combined results
+    """
+    if not posts:
+        empty = {"error": "No posts to analyze"}
+        return PostsSummary(0, 0, dict(empty), dict(empty))
+
+    content_analyzer = get_content_analyzer()
+    posting_analyzer = get_posting_time_analyzer()
+    content_tally = _ContentTally()
+    timing_tally = _TimingTally()
+    total_reactions = 0
+    total_comments = 0
+
+    for post in posts:
+        total_reactions += post.get("numLikes", 0) or 0
+        total_comments += post.get("numComments", 0) or 0
+        content_analyzer._tally_post(content_tally, post)
+        posting_analyzer._tally_post(timing_tally, post)
+
+    return PostsSummary(
+        total_reactions=total_reactions,
+        total_comments=total_comments,
+        content_analysis=content_analyzer._summarize(content_tally),
+        timing_analysis=posting_analyzer._summarize(timing_tally),
+    )
+
+
+def summarize_network(connections: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Summarize a connection list into network size and top industries/locations/companies.
+
+    Args:
+        connections: Connection objects from ``get_profile_connections``
+
+    Returns:
+        Network stats with the ten most common values per field
+    """
+    # Count one column at a time so each tally runs in Counter's C loop
+    industries = Counter(conn.get("industry", "Unknown") for conn in connections)
+    locations = Counter(conn.get("locationName", "Unknown") for conn in connections)
+    companies = Counter(
+        company
+        for conn in connections
+        if (company := conn.get("companyName")) and company != "Unknown"
+    )
+
+    return {
+        "total_connections": len(connections),
+        "top_industries": dict(industries.most_common(10)),
+        "top_locations": dict(locations.most_common(10)),
+        "top_companies": dict(companies.most_common(10)),
+    }
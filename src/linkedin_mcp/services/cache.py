@@ -5,7 +5,8 @@ Provides TTL-based caching to reduce API calls and improve response times.
 """
 
 import asyncio
-from collections.abc import Callable
+import hashlib
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
 from typing import Any, ParamSpec, TypeVar
 
@@ -18,19 +19,25 @@ R = TypeVar("R")
 
 
 class CacheEntry:
-    """Single cache entry with TTL."""
+    """Single cache entry with TTL and an optional stale grace period."""
 
-    __slots__ = ("value", "expires_at", "hits")
+    __slots__ = ("value", "expires_at", "stale_at", "hits")
 
-    def __init__(self, value: Any, ttl_seconds: int) -> None:
+    def __init__(self, value: Any, ttl_seconds: int, grace_seconds: int = 0) -> None:
         self.value = value
-        self.expires_at = datetime.now() + timedelta(seconds=ttl_seconds)
+        self.stale_at = datetime.now() + timedelta(seconds=ttl_seconds)
+        self.expires_at = self.stale_at + timedelta(seconds=grace_seconds)
         self.hits = 0
 
     @property
     def is_expired(self) -> bool:
         return datetime.now() > self.expires_at
 
+    @property
+    def is_stale(self) -> bool:
+        """Past its TTL but still servable during the grace period."""
+        return datetime.now() > self.stale_at
+
     def access(self) -> Any:
         self.hits += 1
         return self.value
@@ -56,6 +63,21 @@ class CacheService:
     TTL_ANALYTICS = 120  # 2 minutes
     TTL_COMPANY = 7200  # 2 hours
     TTL_ARTICLES = 3600  # 1 hour
+    TTL_CONVERSATIONS = 60  # 1 minute
+    TTL_INVITATIONS = 30  # 30 seconds
+    TTL_NEGATIVE = 300  # 5 minutes, for empty results from hidden profile fields
+
+    # Share of an entry's lifetime during which reads trigger a background refresh
+    REFRESH_AHEAD = 0.2
+
+    # Fixed prefixes for the hottest key families
+    PROFILE_PREFIX = "profile:"
+    SKILLS_PREFIX = "skills:"
+    CONTACT_PREFIX = "contact:"
+
+    # Singleton keys shared by the tools and the startup cache warmer
+    OWN_PROFILE_KEY = "own_profile"
+    NETWORK_STATS_KEY = "network:stats"
 
     def __init__(self, default_ttl: int = 300, max_size: int = 1000) -> None:
         self._cache: dict[str, CacheEntry] = {}
@@ -64,6 +86,8 @@ class CacheService:
         self._lock = asyncio.Lock()
         self._total_hits = 0
         self._total_misses = 0
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._refresh_tasks: set[asyncio.Task[Any]] = set()
 
     async def get(self, key: str) -> Any | None:
         """
@@ -76,25 +100,43 @@ class CacheService:
             Cached value or None if not found/expired
         """
         async with self._lock:
-            entry = self._cache.get(key)
+            return self._lookup(key)
 
-            if entry is None:
-                self._total_misses += 1
-                return None
+    async def mget(self, keys: list[str]) -> list[Any | None]:
+        """
+        Get several values from cache under a single lock acquisition.
 
-            if entry.is_expired:
-                del self._cache[key]
-                self._total_misses += 1
-                return None
+        Args:
+            keys: Cache keys
 
-            self._total_hits += 1
-            return entry.access()
+        Returns:
+            Cached values in key order, with None for missing/expired keys
+        """
+        async with self._lock:
+            return [self._lookup(key) for key in keys]
+
+    def _lookup(self, key: str) -> Any | None:
+        """Look up a key and update hit/miss stats. Caller must hold the lock."""
+        entry = self._cache.get(key)
+
+        if entry is None:
+            self._total_misses += 1
+            return None
+
+        if entry.is_expired:
+            del self._cache[key]
+            self._total_misses += 1
+            return None
+
+        self._total_hits += 1
+        return entry.access()
 
     async def set(
         self,
         key: str,
         value: Any,
         ttl: int | None = None,
+        grace: int = 0,
     ) -> None:
         """
         Set a value in cache.
@@ -103,18 +145,183 @@ class CacheService:
             key: Cache key
             value: Value to cache
             ttl: Time to live in seconds (uses default if not specified)
+            grace: Extra seconds the entry may be served stale while it is refreshed
         """
         async with self._lock:
-            # Evict if at capacity
+            await self._store(key, value, ttl, grace)
+
+    async def mset(self, items: dict[str, Any], ttl: int | None = None) -> None:
+        """
+        Set several values in cache under a single lock acquisition.
+
+        Args:
+            items: Mapping of cache key to value
+            ttl: Time to live in seconds (uses default if not specified)
+        """
+        async with self._lock:
+            for key, value in items.items():
+                await self._store(key, value, ttl)
+
+    async def _store(self, key: str, value: Any, ttl: int | None, grace: int = 0) -> None:
+        """Insert an entry, evicting if at capacity. Caller must hold the lock."""
+        # Evict if at capacity
+        if len(self._cache) >= self._max_size:
+            await self._evict_expired()
+
+            # If still at capacity, remove oldest
             if len(self._cache) >= self._max_size:
-                await self._evict_expired()
+                oldest_key = next(iter(self._cache))
+                del self._cache[oldest_key]
 
-                # If still at capacity, remove oldest
-                if len(self._cache) >= self._max_size:
-                    oldest_key = next(iter(self._cache))
-                    del self._cache[oldest_key]
+        self._cache[key] = CacheEntry(value, ttl or self._default_ttl, grace)
 
-            self._cache[key] = CacheEntry(value, ttl or self._default_ttl)
+    @classmethod
+    def refresh_ahead(cls, ttl: int, fraction: float | None = None) -> tuple[int, int]:
+        """
+        Split a TTL into ``(ttl, grace)`` for refresh-ahead caching.
+
+        Passing the result to ``get_or_revalidate``/``set`` keeps the entry's
+        total lifetime at ``ttl`` but starts refreshing it in the background
+        during the last ``fraction`` of that lifetime, so hot keys are renewed
+        before they expire instead of paying a full fetch on the next read.
+
+        Args:
+            ttl: Total time to live in seconds
+            fraction: Share of ``ttl`` to refresh ahead (default: REFRESH_AHEAD)
+
+        Returns:
+            Tuple of (fresh seconds, grace seconds)
+        """
+        grace = int(ttl * (cls.REFRESH_AHEAD if fraction is None else fraction))
+        return ttl - grace, grace
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch_fn: Callable[[], Awaitable[Any]],
+        ttl: int | None = None,
+        negative_ttl: int | None = None,
+    ) -> tuple[Any, bool]:
+        """
+        Get a value from cache, fetching it at most once across concurrent callers.
+
+        While a fetch for ``key`` is in flight, other callers await the same
+        result instead of issuing a duplicate upstream request.
+
+        Args:
+            key: Cache key
+            fetch_fn: Async function to fetch value if not cached
+            ttl: Optional TTL override
+            negative_ttl: Optional TTL for empty results (e.g. ``[]`` or ``{}``)
+
+        Returns:
+            Tuple of (value, cache_hit)
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value, True
+
+        return await self._fetch_shared(key, fetch_fn, ttl, negative_ttl=negative_ttl), False
+
+    async def get_or_revalidate(
+        self,
+        key: str,
+        fetch_fn: Callable[[], Awaitable[Any]],
+        ttl: int | None = None,
+        grace: int = 0,
+    ) -> tuple[Any, bool]:
+        """
+        Stale-while-revalidate lookup.
+
+        Fresh entries are returned as-is. Entries past ``ttl`` but within
+        ``grace`` are returned immediately while a single background task
+        refreshes them. Only a miss or a fully expired entry waits on
+        ``fetch_fn``.
+
+        Args:
+            key: Cache key
+            fetch_fn: Async function to fetch value if not cached
+            ttl: Optional TTL override
+            grace: Seconds past ``ttl`` that stale data may still be served
+
+        Returns:
+            Tuple of (value, cache_hit)
+        """
+        async with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and not entry.is_expired:
+                self._total_hits += 1
+                value, stale = entry.access(), entry.is_stale
+            else:
+                self._total_misses += 1
+                entry = None
+
+        if entry is None:
+            return await self._fetch_shared(key, fetch_fn, ttl, grace), False
+
+        if stale and key not in self._inflight:
+            task = asyncio.create_task(self._refresh(key, fetch_fn, ttl, grace))
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+
+        return value, True
+
+    async def _refresh(
+        self,
+        key: str,
+        fetch_fn: Callable[[], Awaitable[Any]],
+        ttl: int | None,
+        grace: int,
+    ) -> None:
+        """Refresh a stale entry in the background, keeping the old value on failure."""
+        try:
+            await self._fetch_shared(key, fetch_fn, ttl, grace)
+        except Exception as e:
+            logger.warning("Background cache refresh failed", key=key, error=str(e))
+
+    async def _fetch_shared(
+        self,
+        key: str,
+        fetch_fn: Callable[[], Awaitable[Any]],
+        ttl: int | None = None,
+        grace: int = 0,
+        negative_ttl: int | None = None,
+    ) -> Any:
+        """
+        Run ``fetch_fn`` once per key at a time and cache its result.
+
+        If the caller running the fetch is cancelled, one of the callers
+        waiting on it takes over the fetch rather than being cancelled too.
+        """
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not inflight.cancelled() or (task is not None and task.cancelling()):
+                    raise
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch_fn()
+            if value is not None:
+                if not value and negative_ttl is not None:
+                    ttl = negative_ttl
+                await self.set(key, value, ttl, grace)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved so an unawaited failure is not reported at GC
+                future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
 
     async def delete(self, key: str) -> bool:
         """
@@ -144,12 +351,12 @@ class CacheService:
             self._cache.clear()
             return count
 
-    async def clear_pattern(self, pattern: str) -> int:
+    async def clear_pattern(self, pattern: str | tuple[str, ...]) -> int:
         """
         Clear cache entries matching a pattern.
 
         Args:
-            pattern: Key prefix to match
+            pattern: Key prefix to match, or a tuple of prefixes cleared in one pass
 
         Returns:
             Number of entries cleared
@@ -192,7 +399,39 @@ class CacheService:
         Returns:
             Joined cache key
         """
-        return ":".join(str(p) for p in parts)
+        return ":".join(map(str, parts))
+
+    def digest_key(self, prefix: str, *parts: str) -> str:
+        """
+        Create a fixed-length cache key for free-form parts such as search text or URLs.
+
+        The parts are fingerprinted with a 128-bit BLAKE2b digest so the key
+        stays short however long the input is, while the readable prefix
+        still works with ``clear_pattern``.
+
+        Args:
+            prefix: Readable key family, e.g. ``"search_people"``
+            *parts: Key components to fingerprint
+
+        Returns:
+            Key of the form ``"<prefix>:<32 hex chars>"``
+        """
+        # Length-prefix each part so ("a:1", "2") and ("a", "1:2") stay distinct
+        encoded = "".join(f"{len(part)}:{part}" for part in map(str, parts))
+        digest = hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+        return f"{prefix}:{digest}"
+
+    def profile_key(self, profile_id: str) -> str:
+        """Cache key for a profile; equivalent to ``make_key("profile", profile_id)``."""
+        return self.PROFILE_PREFIX + profile_id
+
+    def skills_key(self, profile_id: str) -> str:
+        """Cache key for profile skills; equivalent to ``make_key("skills", profile_id)``."""
+        return self.SKILLS_PREFIX + profile_id
+
+    def contact_key(self, profile_id: str) -> str:
+        """Cache key for profile contact info; equivalent to ``make_key("contact", profile_id)``."""
+        return self.CONTACT_PREFIX + profile_id
 
 
 # Global cache instance
@@ -0,0 +1,26 @@
+"""
+Shared LinkedInPostsClient instances.
+
+Reusing one client per access token keeps its ``requests.Session`` (and the
+underlying keep-alive connections to api.linkedin.com) plus the resolved
+member URN alive across tool calls, instead of paying a new TCP/TLS
+handshake and a userinfo lookup on every post, comment or reaction.
+"""
+
+import functools
+
+from linkedin_mcp.services.linkedin.posts_client import LinkedInPostsClient
+
+
+@functools.lru_cache(maxsize=4)
+def get_posts_client(access_token: str) -> LinkedInPostsClient:
+    """
+    Get the pooled Posts API client for an access token.
+
+    Args:
+        access_token: OAuth access token with w_member_social scope
+
+    Returns:
+        LinkedInPostsClient: Client shared by all callers using this token
+    """
+    return LinkedInPostsClient(access_token=access_token)
@@ -0,0 +1,45 @@
+"""
+HTTP session factory for the requests-based LinkedIn API clients.
+
+A bare ``requests.Session`` has no timeout (a stalled api.linkedin.com call
+blocks its worker thread forever) and a 10-connection pool per host. Sessions
+built here keep connections alive in a larger pool and apply a default
+connect/read timeout to every request that does not pass its own.
+"""
+
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# (connect, read) seconds; read is per socket operation, so long uploads still work
+DEFAULT_TIMEOUT = (10, 60)
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that fills in a default timeout."""
+
+    def __init__(self, timeout: tuple[float, float] = DEFAULT_TIMEOUT, **kwargs: Any) -> None:
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def make_session() -> requests.Session:
+    """
+    Create a pooled session with default timeouts.
+
+    Returns:
+        requests.Session: Session with a keep-alive pool mounted for https and http
+    """
+    session = requests.Session()
+    adapter = _TimeoutHTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
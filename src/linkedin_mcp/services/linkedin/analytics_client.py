@@ -15,9 +15,10 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any
 
-import requests
 import structlog
 
+from linkedin_mcp.services.linkedin._http import make_session
+
 logger = structlog.get_logger(__name__)
 
 
@@ -62,7 +63,7 @@ class LinkedInAnalyticsClient:
         """
         self.access_token = access_token
         self._member_urn = member_urn
-        self._session = requests.Session()
+        self._session = make_session()
 
     def _get_headers(self, content_type: str = "application/json") -> dict[str, str]:
         """Get headers for API requests."""
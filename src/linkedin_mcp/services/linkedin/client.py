@@ -6,8 +6,9 @@ with session persistence, rate limiting, and retry logic.
 """
 
 import asyncio
+import contextlib
 import json
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, ParamSpec, TypeVar
@@ -80,6 +81,78 @@ class RateLimiter:
         return max(0, self.max_requests - len(active))
 
 
+class AdaptiveLimiter:
+    """
+    Concurrency limit that adapts to upstream rate limiting.
+
+    Follows TCP-style additive-increase/multiplicative-decrease: after every
+    ``window`` completed calls, the limit shrinks by 25% if more than 10% of
+    them were rate limited, or grows by one if none were and callers had to
+    queue for a slot. The limit stays between ``minimum`` and ``maximum``.
+    """
+
+    def __init__(self, initial: int = 5, minimum: int = 1, maximum: int = 10, window: int = 20) -> None:
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.window = window
+        self._in_flight = 0
+        self._waiting = 0
+        self._queued_in_window = False
+        self._completed = 0
+        self._rate_limited = 0
+        self._condition = asyncio.Condition()
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one slot for the duration of an upstream call."""
+        async with self._condition:
+            if self._in_flight >= self.limit:
+                self._queued_in_window = True
+            self._waiting += 1
+            try:
+                await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            finally:
+                self._waiting -= 1
+            self._in_flight += 1
+
+        rate_limited = False
+        try:
+            yield
+        except Exception as e:
+            rate_limited = _is_rate_limited(e)
+            raise
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._record(rate_limited)
+                self._condition.notify_all()
+
+    def _record(self, rate_limited: bool) -> None:
+        """Count a completed call and adjust the limit at the end of each window."""
+        self._completed += 1
+        self._rate_limited += rate_limited
+        if self._completed < self.window:
+            return
+
+        if self._rate_limited / self._completed > 0.1:
+            self.limit = max(self.minimum, int(self.limit * 0.75))
+            logger.warning("Upstream rate limited, reducing concurrency", limit=self.limit)
+        elif self._rate_limited == 0 and self._queued_in_window:
+            self.limit = min(self.maximum, self.limit + 1)
+
+        self._completed = self._rate_limited = 0
+        self._queued_in_window = self._waiting > 0
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Whether an upstream error looks like a LinkedIn rate limit."""
+    if isinstance(error, LinkedInRateLimitError):
+        return True
+    error_str = str(error).lower()
+    return "rate" in error_str or "limit" in error_str or "429" in error_str
+
+
 class LinkedInClient:
     """
     Async-compatible LinkedIn API client.
@@ -96,6 +169,14 @@ class LinkedInClient:
     3. Email/password (may cause session issues, not recommended)
     """
 
+    # Max concurrent recipient profile lookups when sending a message
+    MESSAGE_LOOKUP_CONCURRENCY = 8
+
+    # Upstream requests in flight at once, across all callers of this client; the
+    # limit starts at the initial value and adapts to LinkedIn's rate limiting
+    INITIAL_CONCURRENT_REQUESTS = 5
+    MAX_CONCURRENT_REQUESTS = 10
+
     def __init__(
         self,
         email: str | None = None,
@@ -121,6 +202,9 @@ class LinkedInClient:
         self.cookie_path = cookie_path or Path("./data/session_cookies.json")
         self._direct_cookies = cookies  # New: direct cookies from keychain
         self.rate_limiter = RateLimiter(max_requests=rate_limit)
+        self._request_slots = AdaptiveLimiter(
+            initial=self.INITIAL_CONCURRENT_REQUESTS, maximum=self.MAX_CONCURRENT_REQUESTS
+        )
         self._client: Any = None
         self._initialized = False
         self._headless_scraper = headless_scraper
@@ -360,9 +444,10 @@ class LinkedInClient:
         await self.rate_limiter.acquire()
 
         try:
-            result = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: method(*args, **kwargs)
-            )
+            async with self._request_slots.slot():
+                result = await asyncio.get_event_loop().run_in_executor(
+                    None, lambda: method(*args, **kwargs)
+                )
             return result
         except Exception as e:
             error_str = str(e).lower()
@@ -484,13 +569,18 @@ class LinkedInClient:
         public_id: str,
         limit: int = 10,
     ) -> list[dict[str, Any]]:
-        """Get posts from a specific profile."""
+        """Get posts from a specific profile.
+
+        linkedin-api requests at most ``limit`` items per page but appends
+        whole pages while paginating, so trim any overshoot here.
+        """
         logger.info("Fetching profile posts", public_id=public_id, limit=limit)
-        return await self._execute(
+        posts = await self._execute(
             self._client.get_profile_posts,
             public_id,
             post_count=limit,
         )
+        return posts[:limit]
 
     async def create_post(
         self,
@@ -863,10 +953,11 @@ class LinkedInClient:
 
         try:
             scraper = await self._get_headless_scraper()
-            result = await scraper.api_fetch(
-                url,
-                headers={"Accept": "application/graphql"},
-            )
+            async with self._request_slots.slot():
+                result = await scraper.api_fetch(
+                    url,
+                    headers={"Accept": "application/graphql"},
+                )
             return result
         except Exception as e:
             error_str = str(e).lower()
@@ -1005,11 +1096,11 @@ class LinkedInClient:
         sync_token_data = root.get("messengerConversationsBySyncToken", {})
         elements = sync_token_data.get("elements", [])
 
-        conversations = [self._normalize_conversation(el) for el in elements]
+        # Apply limit before normalizing so discarded elements are never parsed
+        if limit:
+            elements = elements[:limit]
 
-        # Apply limit
-        if limit and len(conversations) > limit:
-            conversations = conversations[:limit]
+        conversations = [self._normalize_conversation(el) for el in elements]
 
         logger.info("Fetched conversations via GraphQL", count=len(conversations))
         return conversations
@@ -1112,6 +1203,30 @@ class LinkedInClient:
         logger.info("Search conversations matched", query=query, matches=len(matches))
         return matches
 
+    async def _resolve_member_id(self, public_id: str) -> str | None:
+        """Look up the member URN id for a public ID, or None if it cannot be resolved."""
+        try:
+            # Get profile to extract the URN
+            profile = await self._execute(self._client.get_profile, public_id)
+        except Exception as e:
+            logger.warning("Failed to get profile for messaging", public_id=public_id, error=str(e))
+            return None
+
+        if not profile:
+            logger.warning("Could not find profile", public_id=public_id)
+            return None
+
+        # profile_urn is like "urn:li:fs_miniProfile:ACoAACX1hoMBvWqTY21JGe0z91mnmjmLy9Wen4w"
+        # entityUrn is used as a fallback
+        urn = profile.get("profile_urn") or profile.get("entityUrn")
+        if not urn:
+            logger.warning("Could not extract URN from profile", public_id=public_id)
+            return None
+
+        member_id = urn.split(":")[-1]
+        logger.debug("Converted public_id to URN", public_id=public_id, member_id=member_id)
+        return member_id
+
     async def send_message(
         self,
         recipients: list[str],
@@ -1132,33 +1247,15 @@ class LinkedInClient:
         # Convert public IDs to member URNs
         # linkedin-api expects URN IDs like "ACoAACX1hoMBvWqTY21JGe0z91mnmjmLy9Wen4w"
         # not public IDs like "johndoe"
-        member_urns = []
-        for public_id in recipients:
-            try:
-                # Get profile to extract the URN
-                profile = await self._execute(self._client.get_profile, public_id)
-                if not profile:
-                    logger.warning("Could not find profile", public_id=public_id)
-                    continue
-
-                # Extract member URN from profile
-                # profile_urn is like "urn:li:fs_miniProfile:ACoAACX1hoMBvWqTY21JGe0z91mnmjmLy9Wen4w"
-                profile_urn = profile.get("profile_urn", "")
-                if profile_urn:
-                    member_id = profile_urn.split(":")[-1]
-                    member_urns.append(member_id)
-                    logger.debug("Converted public_id to URN", public_id=public_id, member_id=member_id)
-                else:
-                    # Try entityUrn as fallback
-                    entity_urn = profile.get("entityUrn", "")
-                    if entity_urn:
-                        member_id = entity_urn.split(":")[-1]
-                        member_urns.append(member_id)
-                    else:
-                        logger.warning("Could not extract URN from profile", public_id=public_id)
-            except Exception as e:
-                logger.warning("Failed to get profile for messaging", public_id=public_id, error=str(e))
-                continue
+        # Lookups run concurrently, capped so a large recipient list cannot burst
+        semaphore = asyncio.Semaphore(self.MESSAGE_LOOKUP_CONCURRENCY)
+
+        async def resolve(public_id: str) -> str | None:
+            async with semaphore:
+                return await self._resolve_member_id(public_id)
+
+        resolved = await asyncio.gather(*(resolve(public_id) for public_id in dict.fromkeys(recipients)))
+        member_urns = [member_id for member_id in resolved if member_id]
 
         if not member_urns:
             return {
@@ -2012,7 +2109,8 @@ class LinkedInClient:
         await self.rate_limiter.acquire()
         scraper = await self._get_headless_scraper()
         try:
-            return await scraper.api_fetch(url)
+            async with self._request_slots.slot():
+                return await scraper.api_fetch(url)
         except Exception as e:
             error_str = str(e).lower()
             if "rate" in error_str or "limit" in error_str or "429" in error_str:
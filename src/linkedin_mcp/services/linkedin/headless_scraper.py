@@ -24,6 +24,11 @@ from linkedin_mcp.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Wait before the single retry of a 429 when Retry-After is missing or unparseable,
+# and the longest Retry-After honoured before giving up
+RATE_LIMIT_DEFAULT_WAIT = 5
+RATE_LIMIT_MAX_WAIT = 30
+
 # Try to import Patchright (most undetectable)
 try:
     from patchright.async_api import async_playwright
@@ -41,6 +46,21 @@ except ImportError:
         async_playwright = None
         logger.warning("No browser automation available")
 
+
+def _retry_after_seconds(header: str | None) -> float | None:
+    """
+    Seconds to wait before retrying a 429, or None if the wait is too long.
+
+    Only the delta-seconds form of Retry-After is parsed; a missing or
+    HTTP-date value falls back to RATE_LIMIT_DEFAULT_WAIT.
+    """
+    try:
+        wait = float(header) if header else RATE_LIMIT_DEFAULT_WAIT
+    except ValueError:
+        wait = RATE_LIMIT_DEFAULT_WAIT
+    return max(wait, 0) if wait <= RATE_LIMIT_MAX_WAIT else None
+
+
 # Stealth JavaScript to inject when using standard Playwright
 STEALTH_SCRIPTS = """
 // Hide webdriver flag
@@ -498,6 +518,7 @@ class HeadlessLinkedInScraper:
                     return {
                         status: resp.status,
                         ok: resp.ok,
+                        retryAfter: resp.headers.get('retry-after'),
                         data: data
                     };
                 } catch (err) {
@@ -556,6 +577,15 @@ class HeadlessLinkedInScraper:
                     details={"url": url, "method": method},
                 )
 
+        # Handle rate limiting with one retry after the server's Retry-After delay
+        if status == 429:
+            wait_seconds = _retry_after_seconds(result.get("retryAfter"))
+            if wait_seconds is not None:
+                logger.warning("Rate limited by LinkedIn, retrying once", retry_after=wait_seconds, url=url)
+                await asyncio.sleep(wait_seconds)
+                result = await self._page.evaluate(js_function, config)
+                status = result.get("status", 0)
+
         # Handle other HTTP errors
         if not result.get("ok"):
             raise BrowserAutomationError(
@@ -14,9 +14,10 @@ from typing import Any, Optional
 from urllib.parse import parse_qs, urlencode, urlparse
 import threading
 
-import requests
 import structlog
 
+from linkedin_mcp.services.linkedin._http import make_session
+
 logger = structlog.get_logger()
 
 
@@ -271,7 +272,7 @@ class LinkedInOfficialClient:
 
         self._access_token: Optional[str] = None
         self._token_expires_at: Optional[int] = None
-        self._session = requests.Session()
+        self._session = make_session()
 
         # Load existing token if available
         self._load_token()
@@ -22,6 +22,8 @@ from typing import Any, Optional
 import requests
 import structlog
 
+from linkedin_mcp.services.linkedin._http import make_session
+
 logger = structlog.get_logger(__name__)
 
 
@@ -63,6 +65,22 @@ class ReactionType(str, Enum):
     ENTERTAINMENT = "ENTERTAINMENT"  # Funny
 
 
+# UI reaction names accepted as aliases for the API values
+_REACTION_ALIASES = {
+    "CELEBRATE": "PRAISE",
+    "LOVE": "EMPATHY",
+    "INSIGHTFUL": "INTEREST",
+    "SUPPORT": "APPRECIATION",
+    "FUNNY": "ENTERTAINMENT",
+}
+_VALID_REACTIONS = frozenset(r.value for r in ReactionType)
+_VALID_REACTIONS_STR = ", ".join(r.value for r in ReactionType)
+
+_VALID_DOCUMENT_EXTENSIONS = frozenset({".pdf", ".pptx", ".docx"})
+# Post URN types that accept comments
+_COMMENTABLE_URN_PREFIXES = ("urn:li:share:", "urn:li:ugcPost:", "urn:li:activity:")
+
+
 def escape_little_text(text: str, preserve_hashtags: bool = True) -> str:
     """
     Escape reserved characters for LinkedIn's 'little text' format.
@@ -131,7 +149,7 @@ class LinkedInPostsClient:
         """
         self.access_token = access_token
         self._member_urn = member_urn
-        self._session = requests.Session()
+        self._session = make_session()
 
     def _get_headers(self, content_type: str = "application/json") -> dict[str, str]:
         """Get headers for API requests."""
@@ -907,8 +925,7 @@ class LinkedInPostsClient:
             return {"success": False, "error": f"Document file not found: {document_path}"}
 
         # Validate file type
-        valid_extensions = {".pdf", ".pptx", ".docx"}
-        if document_path.suffix.lower() not in valid_extensions:
+        if document_path.suffix.lower() not in _VALID_DOCUMENT_EXTENSIONS:
             return {
                 "success": False,
                 "error": f"Invalid document type '{document_path.suffix}'. Supported: PDF, PPTX, DOCX",
@@ -1258,8 +1275,7 @@ class LinkedInPostsClient:
                     )
 
             # Validate URN format
-            valid_prefixes = ("urn:li:share:", "urn:li:ugcPost:", "urn:li:activity:")
-            if not social_action_urn.startswith(valid_prefixes):
+            if not social_action_urn.startswith(_COMMENTABLE_URN_PREFIXES):
                 logger.warning("Unexpected URN format for comment", post_urn=social_action_urn)
                 # Try to use as-is anyway
 
@@ -1687,23 +1703,15 @@ class LinkedInPostsClient:
             if isinstance(reaction_type, str):
                 reaction_type = reaction_type.upper()
                 # Handle UI names
-                reaction_map = {
-                    "CELEBRATE": "PRAISE",
-                    "LOVE": "EMPATHY",
-                    "INSIGHTFUL": "INTEREST",
-                    "SUPPORT": "APPRECIATION",
-                    "FUNNY": "ENTERTAINMENT",
-                }
-                reaction_type = reaction_map.get(reaction_type, reaction_type)
+                reaction_type = _REACTION_ALIASES.get(reaction_type, reaction_type)
             else:
                 reaction_type = reaction_type.value
 
             # Validate reaction type
-            valid_reactions = ["LIKE", "PRAISE", "EMPATHY", "INTEREST", "APPRECIATION", "ENTERTAINMENT"]
-            if reaction_type not in valid_reactions:
+            if reaction_type not in _VALID_REACTIONS:
                 return {
                     "success": False,
-                    "error": f"Invalid reaction type '{reaction_type}'. Valid types: {', '.join(valid_reactions)}",
+                    "error": f"Invalid reaction type '{reaction_type}'. Valid types: {_VALID_REACTIONS_STR}",
                 }
 
             # Use original URN directly - do NOT convert between URN types
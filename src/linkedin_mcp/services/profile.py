@@ -6,6 +6,7 @@ Includes ProfileEnrichmentEngine for comprehensive multi-source profile data.
 """
 
 import asyncio
+import heapq
 from datetime import datetime
 from typing import Any
 
@@ -506,11 +507,11 @@ class ProfileEnrichmentEngine:
             profile["skills"] = skills
             profile["skills_count"] = len(skills)
             # Also extract top skills summary
-            top_skills = sorted(
+            top_skills = heapq.nlargest(
+                5,
                 skills,
                 key=lambda x: x.get("endorsementCount", 0) if isinstance(x, dict) else 0,
-                reverse=True,
-            )[:5]
+            )
             profile["top_skills"] = [
                 {"name": s.get("name"), "endorsements": s.get("endorsementCount", 0)}
                 for s in top_skills if isinstance(s, dict)
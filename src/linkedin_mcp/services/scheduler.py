@@ -4,7 +4,10 @@ Post scheduling service for LinkedIn MCP Server.
 Manages scheduled posts using APScheduler with persistence.
 """
 
-from datetime import datetime
+import heapq
+import re
+from collections import Counter
+from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
@@ -206,14 +209,15 @@ class ScheduledPostManager:
 
     def get_due_posts(self) -> list[dict[str, Any]]:
         """Get posts that are due for publishing."""
-        now = datetime.now()
+        now = datetime.now(UTC)
         due_posts = []
 
         for post in self._scheduled_posts.values():
             if post.get("status") != "pending":
                 continue
 
-            scheduled_for = datetime.fromisoformat(post["scheduled_for"])
+            # Times may be stored with or without an offset; naive ones are local time
+            scheduled_for = datetime.fromisoformat(post["scheduled_for"]).astimezone()
 
             if scheduled_for <= now:
                 due_posts.append(post)
@@ -330,6 +334,51 @@ class ContentDraftManager:
         logger.info("Draft updated", draft_id=draft_id)
         return draft
 
+    def pop_draft_for_publish(self, draft_id: str) -> str | None:
+        """
+        Claim a draft for publishing and return its content.
+
+        Marks the draft as published up front so concurrent publish calls
+        cannot post the same draft twice.
+
+        Args:
+            draft_id: ID of the draft
+
+        Returns:
+            Draft content, or None if not found or already published
+        """
+        draft = self._drafts.get(draft_id)
+
+        if not draft or draft["status"] == "published":
+            return None
+
+        now = datetime.now().isoformat()
+        draft["status"] = "published"
+        draft["published_at"] = now
+        draft["updated_at"] = now
+
+        logger.info("Draft claimed for publishing", draft_id=draft_id)
+        return draft["content"]
+
+    def reopen_draft(self, draft_id: str) -> bool:
+        """
+        Return a claimed draft to draft status after a failed publish.
+
+        Args:
+            draft_id: ID of the draft
+
+        Returns:
+            True if reopened, False if not found
+        """
+        draft = self._drafts.get(draft_id)
+
+        if not draft:
+            return False
+
+        draft["status"] = "draft"
+        draft.pop("published_at", None)
+        return True
+
     def delete_draft(self, draft_id: str) -> bool:
         """
         Delete a draft.
@@ -360,6 +409,39 @@ class ContentSuggestionEngine:
     OPTIMAL_HASHTAG_COUNT = 3
     MAX_HASHTAG_COUNT = 5
 
+    _HASHTAG_RE = re.compile(r"#(\w+)")
+    _MENTION_RE = re.compile(r"@(\w+)")
+    _KEYWORD_RE = re.compile(r"\b[a-z]{4,}\b")
+    # All call-to-action phrases in one alternation, matched in a single scan
+    _CTA_RE = re.compile(
+        "|".join([
+            r"comment (below|your)",
+            r"share (your|this)",
+            r"let me know",
+            r"what do you think",
+            r"agree\?",
+            r"follow for more",
+            r"like if",
+        ])
+    )
+
+    _COMMON_WORDS = frozenset({
+        "this", "that", "with", "from", "have", "been", "were",
+        "will", "would", "could", "should", "their", "about",
+        "which", "when", "where", "what", "there", "these",
+        "those", "some", "more", "very", "just", "also", "into",
+        "only", "other", "than", "then", "them", "such", "each",
+    })
+
+    _INDUSTRY_HASHTAGS: dict[str, list[str]] = {
+        "technology": ["Tech", "Innovation", "AI", "Digital", "Startup"],
+        "marketing": ["Marketing", "DigitalMarketing", "ContentMarketing", "Branding", "Growth"],
+        "finance": ["Finance", "Investment", "FinTech", "Business", "Economy"],
+        "healthcare": ["Healthcare", "MedTech", "Health", "Wellness", "HealthTech"],
+        "education": ["Education", "Learning", "EdTech", "Training", "Development"],
+        "sales": ["Sales", "B2B", "SalesEnablement", "Revenue", "Growth"],
+    }
+
     def analyze_content(self, content: str) -> dict[str, Any]:
         """
         Analyze content and provide suggestions.
@@ -370,34 +452,23 @@ class ContentSuggestionEngine:
         Returns:
             Analysis with suggestions for improvement
         """
-        import re
-
         char_count = len(content)
         word_count = len(content.split())
         line_count = len(content.splitlines())
 
         # Extract hashtags
-        hashtags = re.findall(r"#(\w+)", content)
+        hashtags = self._HASHTAG_RE.findall(content)
         hashtag_count = len(hashtags)
 
         # Extract mentions
-        mentions = re.findall(r"@(\w+)", content)
+        mentions = self._MENTION_RE.findall(content)
 
         # Check for hook (first line)
         first_line = content.split("\n")[0] if content else ""
         has_hook = len(first_line) > 20 and len(first_line) < 150
 
         # Check for call to action patterns
-        cta_patterns = [
-            r"comment (below|your)",
-            r"share (your|this)",
-            r"let me know",
-            r"what do you think",
-            r"agree\?",
-            r"follow for more",
-            r"like if",
-        ]
-        has_cta = any(re.search(p, content.lower()) for p in cta_patterns)
+        has_cta = self._CTA_RE.search(content.lower()) is not None
 
         # Check for question
         has_question = "?" in content
@@ -516,40 +587,18 @@ class ContentSuggestionEngine:
         Returns:
             List of suggested hashtags
         """
-        import re
-
-        # Extract keywords from content
-        words = re.findall(r"\b[a-z]{4,}\b", content.lower())
-        word_freq = {}
-        for word in words:
-            word_freq[word] = word_freq.get(word, 0) + 1
-
-        # Remove common words
-        common_words = {
-            "this", "that", "with", "from", "have", "been", "were",
-            "will", "would", "could", "should", "their", "about",
-            "which", "when", "where", "what", "there", "these",
-            "those", "some", "more", "very", "just", "also", "into",
-            "only", "other", "than", "then", "them", "such", "each",
-        }
-        word_freq = {k: v for k, v in word_freq.items() if k not in common_words}
+        # Extract keywords from content, skipping common words
+        word_freq = Counter(
+            word for word in self._KEYWORD_RE.findall(content.lower()) if word not in self._COMMON_WORDS
+        )
 
         # Get top keywords
-        top_keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_keywords = heapq.nlargest(5, word_freq.items(), key=lambda x: x[1])
         suggested = [kw[0] for kw in top_keywords]
 
         # Add industry-specific hashtags
-        industry_hashtags: dict[str, list[str]] = {
-            "technology": ["Tech", "Innovation", "AI", "Digital", "Startup"],
-            "marketing": ["Marketing", "DigitalMarketing", "ContentMarketing", "Branding", "Growth"],
-            "finance": ["Finance", "Investment", "FinTech", "Business", "Economy"],
-            "healthcare": ["Healthcare", "MedTech", "Health", "Wellness", "HealthTech"],
-            "education": ["Education", "Learning", "EdTech", "Training", "Development"],
-            "sales": ["Sales", "B2B", "SalesEnablement", "Revenue", "Growth"],
-        }
-
-        if industry and industry.lower() in industry_hashtags:
-            suggested.extend(industry_hashtags[industry.lower()][:2])
+        if industry and industry.lower() in self._INDUSTRY_HASHTAGS:
+            suggested.extend(self._INDUSTRY_HASHTAGS[industry.lower()][:2])
 
         # Add generic engagement hashtags
         suggested.extend(["LinkedInTips", "CareerGrowth", "Leadership"])
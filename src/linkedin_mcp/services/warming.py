@@ -0,0 +1,160 @@
+"""
+Startup cache warming for LinkedIn MCP Server.
+
+Pre-populates the cache entries a session usually asks for first: the
+authenticated user's own profile, their network stats, and the raw profiles
+of recently requested members. The recent-profile list is kept in a small
+bounded LRU that is persisted to disk so it survives restarts.
+"""
+
+import asyncio
+import functools
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from linkedin_mcp.core.logging import get_logger
+from linkedin_mcp.services.analytics import summarize_network
+from linkedin_mcp.services.cache import CacheService
+
+if TYPE_CHECKING:
+    from linkedin_mcp.core.context import AppContext
+
+logger = get_logger(__name__)
+
+DEFAULT_HOT_PROFILES_PATH = Path.home() / ".linkedin-mcp" / "hot_profiles.json"
+HOT_PROFILES_MAX = 100
+FLUSH_INTERVAL = 60  # seconds between hot-list writes
+WARM_CONCURRENCY = 5
+
+
+class HotProfiles:
+    """
+    Bounded LRU of recently requested profile IDs, persisted as JSON.
+
+    ``touch`` only updates memory, so tools can call it on the event loop.
+    File access happens in worker threads: ``load`` at startup, ``persist``
+    in a background task at most once per ``FLUSH_INTERVAL``, and
+    ``flush(force=True)`` at shutdown.
+    """
+
+    def __init__(self, path: Path = DEFAULT_HOT_PROFILES_PATH, max_size: int = HOT_PROFILES_MAX) -> None:
+        self._path = path
+        self._max_size = max_size
+        self._ids: OrderedDict[str, None] = OrderedDict()
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def touch(self, profile_id: str) -> None:
+        """Mark a profile as most recently used."""
+        self._ids[profile_id] = None
+        self._ids.move_to_end(profile_id)
+        if len(self._ids) > self._max_size:
+            self._ids.popitem(last=False)
+        self._dirty = True
+
+    def top(self, n: int) -> list[str]:
+        """Return up to ``n`` profile IDs, most recently used first."""
+        return list(reversed(self._ids))[:n]
+
+    async def load(self) -> None:
+        """Read the saved list, keeping any profiles touched since startup as most recent."""
+        ids = OrderedDict.fromkeys(await asyncio.to_thread(self._read))
+        for profile_id in self._ids:
+            ids[profile_id] = None
+            ids.move_to_end(profile_id)
+        while len(ids) > self._max_size:
+            ids.popitem(last=False)
+        self._ids = ids
+
+    async def flush(self, force: bool = False) -> None:
+        """Write the list to disk if it changed and the flush interval has passed."""
+        if not self._dirty or (not force and time.monotonic() - self._last_flush < FLUSH_INTERVAL):
+            return
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        try:
+            await asyncio.to_thread(self._write, list(self._ids))
+        except OSError as e:
+            self._dirty = True
+            logger.warning("Could not save hot profile list", path=str(self._path), error=str(e))
+
+    async def persist(self) -> None:
+        """Flush the list every ``FLUSH_INTERVAL`` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            await self.flush()
+
+    def _read(self) -> list[str]:
+        try:
+            ids = json.loads(self._path.read_text())
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            logger.warning("Could not load hot profile list", path=str(self._path), error=str(e))
+            return []
+        if not isinstance(ids, list):
+            logger.warning("Could not load hot profile list", path=str(self._path), error="expected a JSON list")
+            return []
+        return [str(profile_id) for profile_id in ids]
+
+    def _write(self, ids: list[str]) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._path.write_text(json.dumps(ids))
+
+
+_hot_profiles: HotProfiles | None = None
+
+
+def get_hot_profiles() -> HotProfiles:
+    """Get the global hot profile list."""
+    global _hot_profiles
+    if _hot_profiles is None:
+        _hot_profiles = HotProfiles()
+    return _hot_profiles
+
+
+async def warm(ctx: "AppContext", cache: CacheService, top_n: int = 20) -> None:
+    """
+    Pre-populate the cache for the authenticated user and their hot profiles.
+
+    Each entry is fetched through ``get_or_fetch``, so a tool call that races
+    the warmer shares its request instead of duplicating it. Failures are
+    logged and skipped; warming never raises.
+
+    Args:
+        ctx: Initialized application context
+        cache: Cache to populate
+        top_n: Number of recently requested profiles to warm
+    """
+    client = ctx.linkedin_client
+    if client is None:
+        return
+
+    slots = asyncio.Semaphore(WARM_CONCURRENCY)
+
+    async def network_stats() -> dict[str, Any]:
+        return summarize_network(await client.get_profile_connections(limit=500))
+
+    async def run(key: str, fetch_fn: Callable[[], Awaitable[Any]], ttl: int) -> None:
+        try:
+            async with slots:
+                await cache.get_or_fetch(key, fetch_fn, ttl)
+        except Exception as e:
+            logger.debug("Cache warming failed", key=key, error=str(e))
+
+    jobs = [
+        run(CacheService.OWN_PROFILE_KEY, client.get_own_profile, CacheService.TTL_PROFILE),
+        run(CacheService.NETWORK_STATS_KEY, network_stats, CacheService.TTL_CONNECTIONS),
+    ]
+    jobs.extend(
+        run(cache.profile_key(profile_id), functools.partial(client.get_profile, profile_id), CacheService.TTL_PROFILE)
+        for profile_id in get_hot_profiles().top(top_n)
+    )
+
+    started = time.monotonic()
+    await asyncio.gather(*jobs)
+    logger.info("Cache warmed", entries=len(jobs), duration=round(time.monotonic() - started, 2))
@@ -7,6 +7,9 @@ from linkedin_mcp.services.analytics import (
     ContentAnalyzer,
     EngagementAnalyzer,
     PostingTimeAnalyzer,
+    post_text,
+    summarize_network,
+    summarize_posts,
 )
 
 
@@ -156,6 +159,12 @@ class TestContentAnalyzer:
         post: dict[str, Any] = {"images": [{"url": "..."}]}
         assert self.analyzer.detect_content_type(post) == "image"
 
+    def test_post_text(self) -> None:
+        """Test post text lookup prefers commentary and tolerates missing values."""
+        assert post_text({"commentary": "A", "text": "B"}) == "A"
+        assert post_text({"commentary": None, "text": "B"}) == "B"
+        assert post_text({}) == ""
+
 
 class TestPostingTimeAnalyzer:
     """Tests for PostingTimeAnalyzer."""
@@ -220,3 +229,46 @@ class TestAudienceAnalyzer:
         result = self.analyzer.analyze_commenters([])
 
         assert result["total_commenters"] == 0
+
+
+class TestSummarizePosts:
+    """Tests for the single-pass summarize_posts helper."""
+
+    def test_matches_separate_analyses(self) -> None:
+        """Test that the fused pass matches the individual analyzers."""
+        posts = [
+            {"created": "2024-01-15T09:00:00Z", "commentary": "Hello #AI", "numLikes": 100, "numComments": 20},
+            {"created": "2024-01-16T14:00:00Z", "text": "x" * 600, "numLikes": 50, "numComments": None, "video": {}},
+            {"commentary": "No timestamp #AI #Python", "numLikes": 5, "numComments": 1, "images": [{}]},
+        ]
+
+        summary = summarize_posts(posts)
+
+        assert summary.total_reactions == 155
+        assert summary.total_comments == 21
+        assert summary.content_analysis == ContentAnalyzer().analyze_posts_performance(posts)
+        assert summary.timing_analysis == PostingTimeAnalyzer().analyze_posting_patterns(posts)
+
+    def test_empty_posts(self) -> None:
+        """Test with empty posts list."""
+        summary = summarize_posts([])
+
+        assert summary.total_reactions == 0
+        assert "error" in summary.content_analysis
+        assert "error" in summary.timing_analysis
+
+
+def test_summarize_network() -> None:
+    """Test network stats tallies per field, skipping unknown companies."""
+    connections = [
+        {"industry": "Software", "locationName": "Berlin", "companyName": "Acme"},
+        {"industry": "Software", "companyName": "Unknown"},
+        {"locationName": "Berlin"},
+    ]
+
+    stats = summarize_network(connections)
+
+    assert stats["total_connections"] == 3
+    assert stats["top_industries"] == {"Software": 2, "Unknown": 1}
+    assert stats["top_locations"] == {"Berlin": 2, "Unknown": 1}
+    assert stats["top_companies"] == {"Acme": 1}
@@ -1,6 +1,7 @@
 """Tests for the caching service."""
 
 import asyncio
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock
 
 import pytest
@@ -122,6 +123,17 @@ class TestCacheService:
         assert await cache.get("user:2") is None
         assert await cache.get("post:1") == "data3"
 
+    @pytest.mark.asyncio
+    async def test_clear_pattern_multiple_prefixes(self, cache: CacheService) -> None:
+        """Test clearing entries matching any of several prefixes."""
+        await cache.set("feed:10", "data1")
+        await cache.set("posts:me:10", "data2")
+        await cache.set("profile:me", "data3")
+
+        count = await cache.clear_pattern(("feed:", "posts:"))
+        assert count == 2
+        assert await cache.get("profile:me") == "data3"
+
     @pytest.mark.asyncio
     async def test_max_size_eviction(self) -> None:
         """Test that cache evicts entries when max size is reached."""
@@ -163,11 +175,156 @@ class TestCacheService:
         assert stats["misses"] == 1
         assert stats["hit_rate"] == 50.0
 
+    @pytest.mark.asyncio
+    async def test_mget_and_mset(self, cache: CacheService) -> None:
+        """Test bulk get and set operations."""
+        await cache.mset({"key1": "value1", "key2": "value2"})
+
+        assert await cache.mget(["key2", "missing", "key1"]) == ["value2", None, "value1"]
+        assert cache.stats["hits"] == 2
+        assert cache.stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_values_are_cached(self, cache: CacheService) -> None:
+        """Test that empty results are cached and distinguishable from misses."""
+        await cache.set("key1", [], ttl=CacheService.TTL_NEGATIVE)
+
+        assert await cache.get("key1") == []
+        assert await cache.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_get_or_fetch_single_flight(self, cache: CacheService) -> None:
+        """Test that concurrent misses for one key share a single fetch."""
+        call_count = 0
+
+        async def fetch_fn() -> str:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return "fetched_value"
+
+        results = await asyncio.gather(*(cache.get_or_fetch("key1", fetch_fn) for _ in range(5)))
+
+        assert call_count == 1
+        assert [value for value, _ in results] == ["fetched_value"] * 5
+        assert await cache.get_or_fetch("key1", fetch_fn) == ("fetched_value", True)
+        assert call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_or_fetch_leader_cancelled(self, cache: CacheService) -> None:
+        """Test that cancelling the fetching caller hands the fetch to a waiter."""
+        started = asyncio.Event()
+        call_count = 0
+
+        async def fetch_fn() -> str:
+            nonlocal call_count
+            call_count += 1
+            started.set()
+            await asyncio.sleep(0.01)
+            return "fetched_value"
+
+        leader = asyncio.create_task(cache.get_or_fetch("key1", fetch_fn))
+        await started.wait()
+        waiter = asyncio.create_task(cache.get_or_fetch("key1", fetch_fn))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await waiter == ("fetched_value", False)
+        assert leader.cancelled()
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_or_fetch_waiter_cancelled(self, cache: CacheService) -> None:
+        """Test that cancelling a waiting caller leaves the shared fetch running."""
+        async def fetch_fn() -> str:
+            await asyncio.sleep(0.01)
+            return "fetched_value"
+
+        leader = asyncio.create_task(cache.get_or_fetch("key1", fetch_fn))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_fetch("key1", fetch_fn))
+        await asyncio.sleep(0)
+        waiter.cancel()
+
+        assert await leader == ("fetched_value", False)
+        assert waiter.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_get_or_fetch_negative_ttl(self, cache: CacheService) -> None:
+        """Test that empty fetch results are cached with the negative TTL."""
+        await cache.get_or_fetch("empty", AsyncMock(return_value=[]), ttl=3600, negative_ttl=60)
+        await cache.get_or_fetch("full", AsyncMock(return_value=[1]), ttl=3600, negative_ttl=60)
+
+        empty_ttl = cache._cache["empty"].expires_at - datetime.now()
+        full_ttl = cache._cache["full"].expires_at - datetime.now()
+        assert empty_ttl <= timedelta(seconds=60)
+        assert full_ttl > timedelta(seconds=3000)
+
+    @pytest.mark.asyncio
+    async def test_get_or_fetch_propagates_errors(self, cache: CacheService) -> None:
+        """Test that a failed fetch raises and is not cached."""
+        fetch_fn = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch("key1", fetch_fn)
+
+        assert await cache.get("key1") is None
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_get_or_revalidate_serves_stale(self, cache: CacheService) -> None:
+        """Test that stale entries are served while refreshing in the background."""
+        await cache.set("key1", "old_value", ttl=60, grace=60)
+        cache._cache["key1"].stale_at = datetime.now() - timedelta(seconds=1)
+        fetch_fn = AsyncMock(return_value="new_value")
+
+        value, hit = await cache.get_or_revalidate("key1", fetch_fn, ttl=60, grace=60)
+        assert (value, hit) == ("old_value", True)
+
+        await asyncio.gather(*cache._refresh_tasks)
+        fetch_fn.assert_awaited_once()
+        assert await cache.get("key1") == "new_value"
+
+    @pytest.mark.asyncio
+    async def test_get_or_revalidate_fresh_and_miss(self, cache: CacheService) -> None:
+        """Test that fresh entries skip fetching and misses fetch inline."""
+        fetch_fn = AsyncMock(return_value="fetched_value")
+
+        assert await cache.get_or_revalidate("key1", fetch_fn, ttl=60) == ("fetched_value", False)
+        assert await cache.get_or_revalidate("key1", fetch_fn, ttl=60) == ("fetched_value", True)
+        fetch_fn.assert_awaited_once()
+        assert cache._refresh_tasks == set()
+
+    def test_refresh_ahead_split(self) -> None:
+        """Test that refresh_ahead keeps the total lifetime and reserves a refresh window."""
+        assert CacheService.refresh_ahead(3600) == (2880, 720)
+        assert CacheService.refresh_ahead(600, fraction=0.1) == (540, 60)
+
     def test_make_key(self, cache: CacheService) -> None:
         """Test cache key generation."""
         key = cache.make_key("profile", "user123", "posts")
         assert key == "profile:user123:posts"
 
+    def test_digest_key(self, cache: CacheService) -> None:
+        """Test fingerprinted keys are fixed-length, prefixed and deterministic."""
+        key = cache.digest_key("search_people", "x" * 1000, "10")
+
+        assert key.startswith("search_people:")
+        assert len(key) == len("search_people:") + 32
+        assert key == cache.digest_key("search_people", "x" * 1000, "10")
+        assert key != cache.digest_key("search_people", "x" * 1000, "20")
+
+    def test_digest_key_keeps_part_boundaries(self, cache: CacheService) -> None:
+        """Test that parts containing the separator do not collide."""
+        assert cache.digest_key("p", "a:10", "10", "") != cache.digest_key("p", "a", "10:10", "")
+        assert cache.digest_key("p", "ab", "") != cache.digest_key("p", "a", "b")
+
+    def test_profile_and_skills_keys(self, cache: CacheService) -> None:
+        """Test specialized keys match make_key output."""
+        assert cache.profile_key("user123") == cache.make_key("profile", "user123")
+        assert cache.skills_key("user123") == cache.make_key("skills", "user123")
+        assert cache.contact_key("user123") == cache.make_key("contact", "user123")
+
 
 class TestCachedFunction:
     """Tests for the cached() helper function."""
@@ -219,3 +376,6 @@ class TestTTLConstants:
         assert CacheService.TTL_CONNECTIONS == 1800
         assert CacheService.TTL_SEARCH == 900
         assert CacheService.TTL_ANALYTICS == 120
+        assert CacheService.TTL_CONVERSATIONS == 60
+        assert CacheService.TTL_INVITATIONS == 30
+        assert CacheService.TTL_NEGATIVE == 300
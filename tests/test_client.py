@@ -0,0 +1,128 @@
+"""Tests for the unofficial LinkedIn client helpers."""
+
+import asyncio
+
+import pytest
+
+from linkedin_mcp.core.exceptions import LinkedInRateLimitError
+from linkedin_mcp.services.linkedin.client import AdaptiveLimiter
+
+
+async def _call(limiter: AdaptiveLimiter, error: Exception | None = None) -> None:
+    """Run one call through a limiter slot, optionally failing with error."""
+    try:
+        async with limiter.slot():
+            await asyncio.sleep(0)
+            if error is not None:
+                raise error
+    except Exception as e:
+        if e is not error:
+            raise
+
+
+async def _calls(limiter: AdaptiveLimiter, ok: int, rate_limited: int = 0) -> None:
+    """Run sequential calls, the rate-limited ones first."""
+    for _ in range(rate_limited):
+        await _call(limiter, LinkedInRateLimitError())
+    for _ in range(ok):
+        await _call(limiter)
+
+
+class TestAdaptiveLimiter:
+    """Tests for AdaptiveLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_shrinks_above_rate_limit_threshold(self) -> None:
+        """Test that more than 10% rate-limited calls cut the limit by 25%."""
+        limiter = AdaptiveLimiter(initial=8, window=10)
+
+        await _calls(limiter, ok=8, rate_limited=2)
+
+        assert limiter.limit == 6
+
+    @pytest.mark.asyncio
+    async def test_threshold_is_exclusive(self) -> None:
+        """Test that exactly 10% rate-limited calls leave the limit alone."""
+        limiter = AdaptiveLimiter(initial=8, window=10)
+
+        await _calls(limiter, ok=9, rate_limited=1)
+
+        assert limiter.limit == 8
+
+    @pytest.mark.asyncio
+    async def test_counts_rate_limit_messages(self) -> None:
+        """Test that generic errors mentioning a 429 count as rate limited."""
+        limiter = AdaptiveLimiter(initial=8, window=10)
+
+        for _ in range(2):
+            await _call(limiter, RuntimeError("HTTP 429"))
+        for _ in range(8):
+            await _call(limiter, ValueError("bad input"))
+
+        assert limiter.limit == 6
+
+    @pytest.mark.asyncio
+    async def test_window_resets(self) -> None:
+        """Test that each window is judged on its own calls."""
+        limiter = AdaptiveLimiter(initial=8, window=10)
+
+        await _calls(limiter, ok=8, rate_limited=2)
+        await _calls(limiter, ok=10)
+
+        assert limiter.limit == 6
+
+    @pytest.mark.asyncio
+    async def test_no_growth_without_queueing(self) -> None:
+        """Test that a clean window only grows the limit when callers waited."""
+        limiter = AdaptiveLimiter(initial=3, window=10)
+
+        await _calls(limiter, ok=10)
+
+        assert limiter.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_grows_when_callers_queue(self) -> None:
+        """Test that a clean window with queued callers adds one slot."""
+        limiter = AdaptiveLimiter(initial=1, window=4)
+
+        await asyncio.gather(*(_call(limiter) for _ in range(4)))
+
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_clamped_to_minimum(self) -> None:
+        """Test that repeated rate limiting never drops below the minimum."""
+        limiter = AdaptiveLimiter(initial=2, minimum=1, window=5)
+
+        for _ in range(3):
+            await _calls(limiter, ok=0, rate_limited=5)
+
+        assert limiter.limit == 1
+
+    @pytest.mark.asyncio
+    async def test_clamped_to_maximum(self) -> None:
+        """Test that growth stops at the maximum."""
+        limiter = AdaptiveLimiter(initial=2, maximum=2, window=4)
+
+        await asyncio.gather(*(_call(limiter) for _ in range(4)))
+
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self) -> None:
+        """Test that no more than limit calls hold a slot at once."""
+        limiter = AdaptiveLimiter(initial=2, window=100)
+        in_flight = 0
+        peak = 0
+
+        async def call() -> None:
+            nonlocal in_flight, peak
+            async with limiter.slot():
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.001)
+                in_flight -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert peak == 2
@@ -0,0 +1,19 @@
+"""Tests for error interpretation."""
+
+from linkedin_mcp.core.exceptions import LinkedInRateLimitError, interpret_error
+
+
+def test_rate_limit_error_is_recognised() -> None:
+    """Test that a local rate limit error gets the rate-limit suggestion."""
+    result = interpret_error(LinkedInRateLimitError("Rate limit exceeded", retry_after=9))
+
+    assert result["message"] == "Rate limit exceeded"
+    assert result["suggestion"] == "Wait 9 seconds before making more requests"
+
+
+def test_http_429_is_recognised() -> None:
+    """Test that an upstream 429 response maps to the same message."""
+    result = interpret_error("HTTP 429 Too Many Requests")
+
+    assert result["message"] == "Rate limit exceeded"
+    assert result["suggestion"] == "Wait before making more requests"
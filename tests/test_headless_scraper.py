@@ -0,0 +1,63 @@
+"""Tests for the headless LinkedIn scraper."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from linkedin_mcp.core.exceptions import BrowserAutomationError
+from linkedin_mcp.services.linkedin.headless_scraper import (
+    RATE_LIMIT_DEFAULT_WAIT,
+    HeadlessLinkedInScraper,
+    _retry_after_seconds,
+)
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, RATE_LIMIT_DEFAULT_WAIT),
+        ("", RATE_LIMIT_DEFAULT_WAIT),
+        ("12", 12),
+        ("1.5", 1.5),
+        ("-3", 0),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", RATE_LIMIT_DEFAULT_WAIT),
+        ("30", 30),
+        ("31", None),
+    ],
+)
+def test_retry_after_seconds(header: str | None, expected: float | None) -> None:
+    """Test Retry-After parsing for missing, numeric, HTTP-date and over-maximum values."""
+    assert _retry_after_seconds(header) == expected
+
+
+class TestApiFetchRateLimit:
+    """Tests for api_fetch's 429 handling."""
+
+    @pytest.fixture
+    def scraper(self, tmp_path: Path) -> HeadlessLinkedInScraper:
+        """Create a scraper with a stubbed authenticated page."""
+        scraper = HeadlessLinkedInScraper(session_dir=tmp_path)
+        scraper.ensure_authenticated = AsyncMock()  # type: ignore[method-assign]
+        scraper._page = MagicMock(url="https://www.linkedin.com/feed/")
+        return scraper
+
+    @pytest.mark.asyncio
+    async def test_retries_once_after_retry_after(self, scraper: HeadlessLinkedInScraper) -> None:
+        """Test that a 429 is retried once after the advertised delay."""
+        scraper._page.evaluate = AsyncMock(side_effect=[
+            {"status": 429, "ok": False, "retryAfter": "0", "data": None},
+            {"status": 200, "ok": True, "data": {"id": 1}},
+        ])
+
+        assert await scraper.api_fetch("/voyager/api/me") == {"id": 1}
+        assert scraper._page.evaluate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_when_retry_after_too_long(self, scraper: HeadlessLinkedInScraper) -> None:
+        """Test that an over-long Retry-After fails without retrying."""
+        scraper._page.evaluate = AsyncMock(return_value={"status": 429, "ok": False, "retryAfter": "3600"})
+
+        with pytest.raises(BrowserAutomationError, match="429"):
+            await scraper.api_fetch("/voyager/api/me")
+        scraper._page.evaluate.assert_awaited_once()
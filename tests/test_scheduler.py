@@ -1,6 +1,6 @@
 """Tests for the scheduling service."""
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
 from linkedin_mcp.services.scheduler import (
     ContentDraftManager,
@@ -186,6 +186,20 @@ class TestScheduledPostManager:
         assert len(due_posts) == 1
         assert due_posts[0]["content"] == "Due post"
 
+    def test_get_due_posts_mixed_offsets(self) -> None:
+        """Test that naive and offset-aware schedule times can be compared."""
+        self.manager.schedule_post(
+            content="Aware due post",
+            scheduled_time=datetime.now(UTC) - timedelta(minutes=5),
+        )
+        self.manager.schedule_post(
+            content="Naive future post",
+            scheduled_time=datetime.now() + timedelta(hours=1),
+        )
+
+        due_posts = self.manager.get_due_posts()
+        assert [post["content"] for post in due_posts] == ["Aware due post"]
+
 
 class TestContentDraftManager:
     """Tests for ContentDraftManager."""
@@ -268,6 +282,29 @@ class TestContentDraftManager:
         result = self.manager.delete_draft("nonexistent")
         assert result is False
 
+    def test_pop_draft_for_publish(self) -> None:
+        """Test claiming a draft for publishing."""
+        draft = self.manager.create_draft(content="Ready to ship")
+
+        content = self.manager.pop_draft_for_publish(draft["draft_id"])
+        assert content == "Ready to ship"
+        assert draft["status"] == "published"
+        assert "published_at" in draft
+
+        # A second claim must not publish the same draft again
+        assert self.manager.pop_draft_for_publish(draft["draft_id"]) is None
+        assert self.manager.pop_draft_for_publish("nonexistent") is None
+
+    def test_reopen_draft(self) -> None:
+        """Test reopening a claimed draft after a failed publish."""
+        draft = self.manager.create_draft(content="Retry me")
+        self.manager.pop_draft_for_publish(draft["draft_id"])
+
+        assert self.manager.reopen_draft(draft["draft_id"]) is True
+        assert draft["status"] == "draft"
+        assert "published_at" not in draft
+        assert self.manager.pop_draft_for_publish(draft["draft_id"]) == "Retry me"
+
 
 class TestContentSuggestionEngine:
     """Tests for ContentSuggestionEngine."""
@@ -0,0 +1,338 @@
+"""Tests for MCP server tool helpers."""
+
+import asyncio
+import tempfile
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+import structlog
+from structlog.testing import LogCapture
+
+from linkedin_mcp import server
+from linkedin_mcp.core.context import AppContext, clear_context, set_context
+from linkedin_mcp.services.cache import CacheService, set_cache
+
+
+def _tool_fn(tool: object) -> object:
+    """Return the coroutine function behind a registered tool."""
+    # fastmcp 2.x wraps tools in a FunctionTool; later releases return the function
+    return getattr(tool, "fn", tool)
+
+
+@pytest.fixture
+def app_context(mock_linkedin_client: MagicMock) -> Iterator[MagicMock]:
+    """Install an app context backed by the mock client and a fresh cache."""
+    mock_linkedin_client.get_profile_contact_info = AsyncMock(
+        side_effect=lambda profile_id: {"email": f"{profile_id}@example.com"}
+    )
+    set_cache(CacheService(default_ttl=300, max_size=100))
+    set_context(AppContext(settings=MagicMock(), linkedin_client=mock_linkedin_client))
+    yield mock_linkedin_client
+    clear_context()
+
+
+class TestProfileEnriched:
+    """Tests for the get_profile_enriched tool."""
+
+    @pytest.mark.asyncio
+    async def test_returns_both_parts(self, app_context: MagicMock) -> None:
+        """Test that contact info and skills are combined."""
+        app_context.get_profile.return_value = {"skills": [{"name": "Python", "endorsementCount": 5}]}
+
+        result = await _tool_fn(server.get_profile_enriched)("jane")
+
+        assert result["contact_info"] == {"email": "jane@example.com"}
+        assert result["skills"] == [{"name": "Python", "endorsement_count": 5}]
+        assert result["errors"] == []
+
+    @pytest.mark.asyncio
+    async def test_partial_failure(self, app_context: MagicMock) -> None:
+        """Test that one failed lookup is reported without dropping the other."""
+        app_context.get_profile.side_effect = RuntimeError("boom")
+
+        result = await _tool_fn(server.get_profile_enriched)("jane")
+
+        assert result["success"] is True
+        assert result["contact_info"] == {"email": "jane@example.com"}
+        assert result["skills"] is None
+        assert result["errors"] == [{"part": "skills", "error": "boom"}]
+
+
+@pytest.fixture
+def captured_logs() -> Iterator[LogCapture]:
+    """Capture structlog events with contextvars merged in."""
+    capture = LogCapture()
+    previous = structlog.get_config()
+    structlog.configure(processors=[structlog.contextvars.merge_contextvars, capture])
+    yield capture
+    structlog.configure(**previous)
+
+
+@pytest.mark.asyncio
+async def test_tool_log_context_binds_tool_name(captured_logs: LogCapture) -> None:
+    """Test that log lines emitted during a tool call carry tool=<name>."""
+
+    async def call_next(_context: object) -> dict:
+        server.logger.info("inside tool")
+        return {"success": True}
+
+    context = MagicMock()
+    context.message.name = "get_profile"
+
+    await server._ToolLogContext().on_call_tool(context, call_next)
+    server.logger.info("after tool")
+
+    assert captured_logs.entries[0]["tool"] == "get_profile"
+    assert "tool" not in captured_logs.entries[1]
+
+
+@pytest.mark.asyncio
+async def test_tool_error_handler_logs_id_arguments(captured_logs: LogCapture) -> None:
+    """Test that a failed tool logs its identifier arguments but not free text."""
+
+    @server.tool_error_handler
+    async def send(conversation_id: str, text: str) -> dict:
+        raise RuntimeError(f"boom in {conversation_id} ({len(text)} chars)")
+
+    result = await send("c1", text="hello")
+
+    assert result["error"] == "boom in c1 (5 chars)"
+    failure = captured_logs.entries[0]
+    assert failure["conversation_id"] == "c1"
+    assert "text" not in failure
+
+
+class TestPrefetch:
+    """Tests for predictive contact info and skills prefetch."""
+
+    @pytest.fixture
+    def features(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Replace the settings seen by the server with a mock feature set."""
+        settings = MagicMock()
+        settings.features.predictive_prefetch = True
+        monkeypatch.setattr(server, "get_settings", lambda: settings)
+        return settings.features
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("features")
+    async def test_schedules_and_fills_both_caches(self, app_context: MagicMock) -> None:
+        """Test that a scheduled prefetch loads contact info and skills."""
+        server._schedule_prefetch("jane")
+        await asyncio.gather(*server._prefetch_tasks)
+
+        cache = server.get_cache()
+        assert await cache.get(cache.contact_key("jane")) == {"email": "jane@example.com"}
+        assert await cache.get(cache.skills_key("jane")) == []
+        app_context.get_profile_contact_info.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_skips_cached_keys(self, app_context: MagicMock) -> None:
+        """Test that entries already in the cache are not fetched again."""
+        cache = server.get_cache()
+        await cache.set(cache.contact_key("jane"), {"email": "cached@example.com"})
+
+        await server._prefetch_related("jane")
+
+        app_context.get_profile_contact_info.assert_not_called()
+        app_context.get_profile.assert_awaited_once_with("jane")
+
+    @pytest.mark.asyncio
+    async def test_feature_flag_off(self, app_context: MagicMock, features: MagicMock) -> None:
+        """Test that nothing is scheduled when predictive prefetch is disabled."""
+        features.predictive_prefetch = False
+
+        server._schedule_prefetch("jane")
+
+        assert server._prefetch_tasks == set()
+        app_context.get_profile_contact_info.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("features")
+    async def test_no_client(self) -> None:
+        """Test that prefetch is a no-op without the unofficial client."""
+        set_context(AppContext(settings=MagicMock()))
+        try:
+            server._schedule_prefetch("jane")
+            assert server._prefetch_tasks == set()
+            await server._prefetch_related("jane")
+        finally:
+            clear_context()
+
+    @pytest.mark.asyncio
+    async def test_loader_errors_are_swallowed(self, app_context: MagicMock) -> None:
+        """Test that one failed loader neither raises nor stops the other."""
+        app_context.get_profile_contact_info.side_effect = RuntimeError("boom")
+
+        await server._prefetch_related("jane")
+
+        cache = server.get_cache()
+        assert await cache.get(cache.contact_key("jane")) is None
+        assert await cache.get(cache.skills_key("jane")) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("app_context")
+async def test_invalidate_post_engagement_is_exact() -> None:
+    """Test that invalidating one post leaves posts with longer URNs cached."""
+    cache = server.get_cache()
+    for urn in ("urn:li:activity:1", "urn:li:activity:12"):
+        await cache.set(f"provider:reactions:{urn}", {"reactions": []})
+        await cache.set(f"provider:comments:{urn}:10", {"comments": []})
+
+    await server._invalidate_post_engagement("urn:li:activity:1")
+
+    assert await cache.get("provider:reactions:urn:li:activity:1") is None
+    assert await cache.get("provider:comments:urn:li:activity:1:10") is None
+    assert await cache.get("provider:reactions:urn:li:activity:12") is not None
+    assert await cache.get("provider:comments:urn:li:activity:12:10") is not None
+
+
+class TestProfilePosts:
+    """Tests for the get_profile_posts tool."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("app_context")
+    async def test_coalesced_callers_report_source(self) -> None:
+        """Test that callers sharing one fetch all report the provider that served it."""
+
+        async def get_profile_posts(*_args: object, **_kwargs: object) -> dict:
+            await asyncio.sleep(0.01)
+            return {"posts": [{"urn": "urn:li:activity:1"}], "source": "pnd"}
+
+        provider = MagicMock()
+        provider.get_profile_posts = AsyncMock(side_effect=get_profile_posts)
+        server.get_context().data_provider = provider
+
+        results = await asyncio.gather(*(_tool_fn(server.get_profile_posts)("jane") for _ in range(3)))
+
+        assert [result["source"] for result in results] == ["pnd"] * 3
+        provider.get_profile_posts.assert_awaited_once()
+
+
+@pytest.mark.usefixtures("app_context")
+class TestBatch:
+    """Tests for the batch tool."""
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_op_per_id(self, app_context: MagicMock) -> None:
+        """Test that batch calls the op once per unique ID and keeps input order."""
+        result = await _tool_fn(server.batch)("get_profile_contact_info", ["bob", "alice", " bob ", ""])
+
+        assert result["success"] is True
+        assert [item["id"] for item in result["results"]] == ["bob", "alice"]
+        assert result["results"][0]["contact_info"] == {"email": "bob@example.com"}
+        assert result["failed"] == 0
+        assert app_context.get_profile_contact_info.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_collects_failures(self, app_context: MagicMock) -> None:
+        """Test that per-ID errors are reported without failing the whole batch."""
+        app_context.get_profile_contact_info.side_effect = [{"email": "a@example.com"}, RuntimeError("boom")]
+
+        result = await _tool_fn(server.batch)("get_profile_contact_info", ["a", "b"])
+
+        assert result["successful"] == 1
+        assert result["failures"] == [{"id": "b", "error": "boom"}]
+
+    @pytest.mark.asyncio
+    async def test_batch_logs_failures_with_op(self, app_context: MagicMock, captured_logs: LogCapture) -> None:
+        """Test that a failing item is logged with the op and item ID."""
+        app_context.get_profile_contact_info.side_effect = RuntimeError("boom")
+
+        await _tool_fn(server.batch)("get_profile_contact_info", ["a"])
+
+        failure = next(entry for entry in captured_logs.entries if entry["log_level"] == "error")
+        assert failure["op"] == "get_profile_contact_info"
+        assert failure["item_id"] == "a"
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_unknown_op(self) -> None:
+        """Test that only the read-only batchable ops are accepted."""
+        result = await _tool_fn(server.batch)("send_message", ["a"])
+
+        assert "Unsupported op" in result["error"]
+
+    def test_batchable_entries_are_plain_coroutines(self) -> None:
+        """Test that batch() dispatches to callables rather than registered tool objects."""
+        for fn in server._BATCHABLE.values():
+            assert callable(fn)
+            assert fn.__name__.startswith("_")
+
+
+class TestStreamToTempfile:
+    """Tests for the media download helper."""
+
+    @pytest.mark.asyncio
+    async def test_writes_chunks(self) -> None:
+        """Test that streamed chunks land in a closed temp file."""
+        response = MagicMock()
+        response.aiter_bytes = lambda _size: _chunks([b"ab", b"cd"])
+
+        temp_file, size = await server._stream_to_tempfile(response, ".png")
+
+        path = Path(temp_file.name)
+        assert size == 4
+        assert path.read_bytes() == b"abcd"
+        path.unlink()
+
+    @pytest.mark.asyncio
+    async def test_removes_partial_file_on_error(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a download failing mid-stream leaves no file behind."""
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        response = MagicMock()
+        response.aiter_bytes = lambda _size: _chunks([b"ab", httpx.ReadError("reset")])
+
+        with pytest.raises(httpx.ReadError):
+            await server._stream_to_tempfile(response, ".png")
+
+        assert list(tmp_path.iterdir()) == []
+
+
+async def _chunks(items: list[bytes | Exception]) -> AsyncIterator[bytes]:
+    """Yield byte chunks, raising any exception found in the sequence."""
+    for item in items:
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+@pytest.mark.parametrize(
+    ("raw", "unique", "expected"),
+    [
+        ("a, b,,a", True, ["a", "b"]),
+        ("a, b,,a", False, ["a", "b", "a"]),
+        ("a,b,c,d", True, None),
+    ],
+)
+def test_split_csv(raw: str, unique: bool, expected: list[str] | None) -> None:
+    """Test splitting, deduplication and the item cap."""
+    assert server._split_csv(raw, 3, unique=unique) == expected
+
+
+@pytest.mark.asyncio
+async def test_create_poll_rejects_duplicate_options() -> None:
+    """Test that repeated poll options are an error rather than silently dropped."""
+    result = await _tool_fn(server.create_poll)("Favourite?", "Red, Blue, Red")
+
+    assert result == {"error": "Poll options must be unique"}
+
+
+@pytest.mark.parametrize(
+    ("urn", "allow_comment", "valid"),
+    [
+        ("urn:li:activity:123", False, True),
+        ("urn:li:ugcPost:123", False, True),
+        ("123", False, True),
+        ("urn%3Ali%3Aactivity%3A123", False, True),
+        ("urn:li:comment:(urn:li:activity:1,2)", True, True),
+        ("urn:li:comment:(urn:li:activity:1,2)", False, False),
+        ("urn:li:activity:abc", False, False),
+        ("https://www.linkedin.com/feed/", False, False),
+    ],
+)
+def test_check_post_urn(urn: str, allow_comment: bool, valid: bool) -> None:
+    """Test which post identifiers pass validation."""
+    assert (server._check_post_urn(urn, allow_comment=allow_comment) is None) is valid
@@ -0,0 +1,139 @@
+"""Tests for the cache warming service."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from linkedin_mcp.core.context import AppContext
+from linkedin_mcp.services import warming
+from linkedin_mcp.services.cache import CacheService
+from linkedin_mcp.services.warming import HotProfiles, warm
+
+
+class TestHotProfiles:
+    """Tests for HotProfiles."""
+
+    def test_top_orders_most_recent_first(self, tmp_path: Path) -> None:
+        """Test that re-touching a profile moves it to the front."""
+        hot = HotProfiles(tmp_path / "hot.json")
+        for profile_id in ("a", "b", "c", "a"):
+            hot.touch(profile_id)
+
+        assert hot.top(10) == ["a", "c", "b"]
+        assert hot.top(2) == ["a", "c"]
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Test that the least recently used profile is dropped at capacity."""
+        hot = HotProfiles(tmp_path / "hot.json", max_size=2)
+        for profile_id in ("a", "b", "a", "c"):
+            hot.touch(profile_id)
+
+        assert hot.top(10) == ["c", "a"]
+
+    def test_touch_does_not_write(self, tmp_path: Path) -> None:
+        """Test that touch stays in memory."""
+        path = tmp_path / "hot.json"
+        hot = HotProfiles(path)
+        hot.touch("a")
+
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_load_keeps_touched_profiles_most_recent(self, tmp_path: Path) -> None:
+        """Test that loading merges saved IDs behind ones touched since startup."""
+        path = tmp_path / "hot.json"
+        path.write_text(json.dumps(["x", "y", "a"]))
+        hot = HotProfiles(path, max_size=3)
+        hot.touch("a")
+
+        await hot.load()
+
+        assert hot.top(10) == ["a", "y", "x"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("content", ["not json", '{"a": 1}'])
+    async def test_load_corrupt_file(self, tmp_path: Path, content: str) -> None:
+        """Test that an unreadable list is ignored."""
+        path = tmp_path / "hot.json"
+        path.write_text(content)
+        hot = HotProfiles(path)
+
+        await hot.load()
+
+        assert hot.top(10) == []
+
+    @pytest.mark.asyncio
+    async def test_flush_interval(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that flushes wait for the interval unless forced."""
+        path = tmp_path / "nested" / "hot.json"
+        hot = HotProfiles(path)
+        hot.touch("a")
+
+        await hot.flush()
+        assert not path.exists()
+
+        await hot.flush(force=True)
+        assert json.loads(path.read_text()) == ["a"]
+
+        hot.touch("b")
+        monkeypatch.setattr(warming, "FLUSH_INTERVAL", 0)
+        await hot.flush()
+        assert json.loads(path.read_text()) == ["a", "b"]
+
+        reloaded = HotProfiles(path)
+        await reloaded.load()
+        assert reloaded.top(10) == ["b", "a"]
+
+
+class TestWarm:
+    """Tests for warm()."""
+
+    @pytest.fixture
+    def hot(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> HotProfiles:
+        """Install a hot list with three profiles, c most recent."""
+        hot = HotProfiles(tmp_path / "hot.json")
+        for profile_id in ("a", "b", "c"):
+            hot.touch(profile_id)
+        monkeypatch.setattr(warming, "_hot_profiles", hot)
+        return hot
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("hot")
+    async def test_fills_own_profile_network_and_hot_profiles(self, mock_linkedin_client: MagicMock) -> None:
+        """Test that the own profile, network stats and top-N hot profiles are cached."""
+        mock_linkedin_client.get_profile_connections = AsyncMock(return_value=[{"industry": "Software"}])
+        cache = CacheService()
+
+        await warm(AppContext(settings=MagicMock(), linkedin_client=mock_linkedin_client), cache, top_n=2)
+
+        assert await cache.get(CacheService.OWN_PROFILE_KEY) == await mock_linkedin_client.get_own_profile()
+        stats = await cache.get(CacheService.NETWORK_STATS_KEY)
+        assert stats["total_connections"] == 1
+        assert await cache.get(cache.profile_key("c")) is not None
+        assert await cache.get(cache.profile_key("b")) is not None
+        assert await cache.get(cache.profile_key("a")) is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("hot")
+    async def test_no_client(self) -> None:
+        """Test that warming does nothing without the unofficial client."""
+        cache = CacheService()
+
+        await warm(AppContext(settings=MagicMock()), cache)
+
+        assert cache.stats["size"] == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("hot")
+    async def test_failed_fetch_does_not_raise(self, mock_linkedin_client: MagicMock) -> None:
+        """Test that one failing fetch is skipped while the rest are cached."""
+        mock_linkedin_client.get_profile_connections = AsyncMock(side_effect=RuntimeError("boom"))
+        mock_linkedin_client.get_profile = AsyncMock(side_effect=RuntimeError("boom"))
+        cache = CacheService()
+
+        await warm(AppContext(settings=MagicMock(), linkedin_client=mock_linkedin_client), cache)
+
+        assert await cache.get(CacheService.NETWORK_STATS_KEY) is None
+        assert await cache.get(CacheService.OWN_PROFILE_KEY) is not None